@@ -0,0 +1,127 @@
+"""Stress-test concurrent reservations: no oversell, throughput per worker count.
+
+Run: python benchmarks/bench_concurrency.py [reservations_per_worker]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pymixology.inventory.concurrent import ConcurrentInventory  # noqa: E402
+from pymixology.inventory.items import Mixer  # noqa: E402
+
+SKUS = 32
+STOCK_PER_SKU = 5_000
+
+
+def build() -> ConcurrentInventory:
+    return ConcurrentInventory(Mixer(f"Item {i}", STOCK_PER_SKU, "2030-01-01", False, value=10) for i in range(SKUS))
+
+
+def run_threads(workers: int, attempts: int) -> dict:
+    """Have every worker hammer all SKUs and check the books balance."""
+    inventory = build()
+    granted = [0] * workers
+    start_gate = threading.Barrier(workers)
+
+    def worker(index: int) -> None:
+        start_gate.wait()
+        for n in range(attempts):
+            if inventory.reserve(f"Item {(n + index) % SKUS}", 1):
+                granted[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    remaining = sum(item.quantity for item in inventory)
+    assert all(item.quantity >= 0 for item in inventory), "negative stock"
+    assert sum(granted) + remaining == SKUS * STOCK_PER_SKU, "oversold"
+    return {
+        "mode": "threads",
+        "workers": workers,
+        "granted": sum(granted),
+        "ops_per_sec": round(workers * attempts / elapsed),
+    }
+
+
+def run_async(tasks: int, attempts: int) -> dict:
+    """Same workload as coroutines on one event loop."""
+    inventory = build()
+
+    async def worker(index: int) -> int:
+        granted = 0
+        for n in range(attempts):
+            if await inventory.reserve_async(f"Item {(n + index) % SKUS}", 1, timeout=0):
+                granted += 1
+        return granted
+
+    async def main() -> list:
+        return await asyncio.gather(*(worker(i) for i in range(tasks)))
+
+    start = time.perf_counter()
+    granted = asyncio.run(main())
+    elapsed = time.perf_counter() - start
+    remaining = sum(item.quantity for item in inventory)
+    assert sum(granted) + remaining == SKUS * STOCK_PER_SKU, "oversold"
+    ops_per_sec = round(tasks * attempts / elapsed)
+    return {"mode": "asyncio", "workers": tasks, "granted": sum(granted), "ops_per_sec": ops_per_sec}
+
+
+def run_async_waiting(tasks: int, attempts: int) -> dict:
+    """Coroutines wait for a restocking thread; half of them are cancelled by ``wait_for``."""
+    inventory = ConcurrentInventory([Mixer("Item 0", 0, "2030-01-01", False)])
+    restocked = tasks * attempts // 2
+
+    async def worker(index: int) -> int:
+        granted = 0
+        for _ in range(attempts):
+            try:
+                # Odd workers give up quickly, so cancellations race with restocks.
+                limit = 0.001 if index % 2 else 0.05
+                granted += await asyncio.wait_for(inventory.reserve_async("Item 0", 1), limit)
+            except asyncio.TimeoutError:
+                pass
+        return granted
+
+    def producer() -> None:
+        for _ in range(restocked):
+            inventory.restock("Item 0", 1)
+
+    async def main() -> list:
+        thread = threading.Thread(target=producer)
+        thread.start()
+        granted = await asyncio.gather(*(worker(i) for i in range(tasks)))
+        thread.join()
+        return granted
+
+    start = time.perf_counter()
+    granted = asyncio.run(main())
+    elapsed = time.perf_counter() - start
+    remaining = inventory.check_stock("Item 0")
+    assert remaining >= 0, "negative stock"
+    assert sum(granted) + remaining == restocked, "stock consumed by a cancelled waiter"
+    ops_per_sec = round(tasks * attempts / elapsed)
+    return {"mode": "asyncio-wait", "workers": tasks, "granted": sum(granted), "ops_per_sec": ops_per_sec}
+
+
+def main() -> None:
+    attempts = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    for workers in (1, 2, 4, 8, 16):
+        print(json.dumps(run_threads(workers, attempts)))
+    print(json.dumps(run_async(16, attempts)))
+    print(json.dumps(run_async_waiting(16, max(attempts // 100, 10))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measure inventory journal write throughput, recovery time and time-travel reads.
+
+Run: python benchmarks/bench_journal.py [event_count]
+Events are quantity changes spread over a synthetic inventory, fsynced in groups.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.generators import synthetic_inventory  # noqa: E402
+from pymixology.inventory.journal import InventoryJournal  # noqa: E402
+
+
+def write_events(directory: Path, count: int, snapshot_every: int) -> float:
+    """Journal ``count`` quantity changes and return events per second."""
+    clock = iter(range(1, 1 << 62)).__next__
+    rng = random.Random(533)
+    start = time.perf_counter()
+    with InventoryJournal(directory, snapshot_every=snapshot_every, clock=clock) as journal:
+        for item in synthetic_inventory(500):
+            journal.inventory.add(item)
+        items = list(journal.inventory)
+        for _ in range(count):
+            rng.choice(items).quantity = rng.random() * 1000
+    return count / (time.perf_counter() - start)
+
+
+def timed_open(directory: Path) -> float:
+    """Return seconds to open (recover) a journal."""
+    start = time.perf_counter()
+    InventoryJournal(directory).close()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, snapshot_every in (("no snapshots", 1 << 62), ("snapshot every 100k", 100_000)):
+            directory = Path(tmp) / label.replace(" ", "_")
+            rate = write_events(directory, count, snapshot_every)
+            size = (directory / "journal.log").stat().st_size
+            print(f"{label}: {count} events, {rate:,.0f} events/s, journal {size / 1e6:.1f} MB")
+            print(f"  recovery {timed_open(directory):.3f}s")
+            with InventoryJournal(directory) as journal:
+                for fraction in (0.25, 0.5, 0.99):
+                    start = time.perf_counter()
+                    journal.state_at(500 + count * fraction)
+                    print(f"  state_at({fraction:.0%}) {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare startup time and peak RSS of the recipe loaders.
+
+Run: python benchmarks/bench_loader.py [recipe_count]
+Each loader runs in a fresh interpreter so peak RSS is measured in isolation.
+"""
+
+from __future__ import annotations
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.generators import write_synthetic_catalog  # noqa: E402
+from pymixology.recipes.catalog import (  # noqa: E402
+    BinaryCatalog,
+    iter_recipes,
+    load_recipes,
+    search_cocktail,
+    write_binary_catalog,
+)
+
+LOADERS = ("load_recipes", "iter_recipes", "binary_catalog")
+
+
+def run_child(loader: str, path: str) -> None:
+    """Load the catalog with one loader and print elapsed seconds and peak RSS."""
+    start = time.perf_counter()
+    if loader == "load_recipes":
+        recipes = load_recipes(path)
+        hits = len(search_cocktail(recipes, "gin 99"))
+    elif loader == "iter_recipes":
+        hits = sum(1 for recipe in iter_recipes(path) if "gin 99" in recipe["name"].lower())
+    else:
+        with BinaryCatalog(path) as catalog:
+            hits = len(search_cocktail(catalog, "gin 99"))
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = round(peak_kb / 1024, 1)
+    print(json.dumps({"loader": loader, "seconds": round(elapsed, 3), "peak_rss_mb": peak_mb, "hits": hits}))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "catalog.json"
+        binary_path = Path(tmp) / "catalog.bin"
+        write_synthetic_catalog(json_path, count)
+        write_binary_catalog(iter_recipes(str(json_path)), str(binary_path))
+        json_mb, binary_mb = json_path.stat().st_size / 1e6, binary_path.stat().st_size / 1e6
+        print(f"{count} recipes, JSON {json_mb:.1f} MB, binary {binary_mb:.1f} MB")
+        for loader in LOADERS:
+            path = binary_path if loader == "binary_catalog" else json_path
+            subprocess.run([sys.executable, __file__, "--child", loader, str(path)], check=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3])
+    else:
+        main()
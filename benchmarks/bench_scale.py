@@ -0,0 +1,54 @@
+"""Compare scale_recipe deep copies with lazy ScaledRecipe views.
+
+Run: python benchmarks/bench_scale.py [copies_of_bundled_catalog]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from pymixology.recipes.catalog import load_recipes  # noqa: E402
+from pymixology.recipes.tools import scale_catalog, scale_recipe  # noqa: E402
+
+
+def measure(label: str, func) -> None:
+    """Report wall time, allocated blocks and peak bytes for one call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+    record = {
+        "case": label,
+        "seconds": round(elapsed, 4),
+        "retained_mb": round(current / 1e6, 2),
+        "peak_mb": round(peak / 1e6, 2),
+        "blocks": blocks,
+    }
+    print(json.dumps(record))
+    del result
+
+
+def main() -> None:
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    recipes = load_recipes(str(ROOT / "pymixology" / "data" / "cocktails.json")) * copies
+    print(f"{len(recipes)} recipes scaled to 12 servings")
+    measure("scale_recipe (deepcopy)", lambda: [scale_recipe(recipe, 12) for recipe in recipes])
+    measure("scale_catalog (views)", lambda: scale_catalog(recipes, 12))
+    measure(
+        "scale_catalog + read every amount",
+        lambda: [[item["amount"] for item in view["ingredients"]] for view in scale_catalog(recipes, 12)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Load and query speedup of ShardedCatalog versus a single process.
+
+Run: python -m benchmarks.bench_sharding [recipe_count]
+Both loads start from the same JSON file; speedup is bounded by the number of CPU cores available.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pymixology.recipes.catalog import RecipeCatalog, filter_by_base, load_recipes, search_cocktail
+from pymixology.recipes.sharding import ShardedCatalog
+from pymixology.recommendation.suggester import MakeableIndex, get_makeable_cocktails
+
+from .generators import synthetic_inventory, write_synthetic_catalog
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def query_all(catalog, makeable, inventory) -> None:
+    search_cocktail(catalog, "gin 1")
+    filter_by_base(catalog, "Tequila")
+    get_makeable_cocktails(inventory, makeable)
+
+
+def main() -> None:
+    import sys
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    cores = os.cpu_count() or 1
+    inventory = synthetic_inventory()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "catalog.json"
+        write_synthetic_catalog(path, count)
+
+        def single():
+            recipes = load_recipes(str(path))
+            return RecipeCatalog(recipes), MakeableIndex(recipes)
+
+        cpu_start = time.process_time()
+        (catalog, makeable), load_seconds = timed(single)
+        single_cpu = time.process_time() - cpu_start
+        _, query_seconds = timed(lambda: query_all(catalog, makeable, inventory))
+        print(
+            json.dumps(
+                {
+                    "shards": 0,
+                    "cores": cores,
+                    "load_seconds": round(load_seconds, 3),
+                    "load_cpu_seconds": round(single_cpu, 3),
+                    "query_seconds": round(query_seconds, 4),
+                }
+            )
+        )
+        del catalog, makeable
+
+        for shards in sorted({1, 2, 4, 8, cores}):
+            # Timed from the original file: computing byte ranges is part of the load.
+            sharded, load_seconds = timed(lambda: ShardedCatalog.from_file(str(path), shards))
+            with sharded:
+                _, query_seconds = timed(lambda: query_all(sharded, sharded, inventory))
+                # The slowest worker's CPU time is the load time with one free core per shard.
+                critical = max(sharded.load_cpu_seconds, default=0.0)
+            print(
+                json.dumps(
+                    {
+                        "shards": shards,
+                        "cores": cores,
+                        "load_seconds": round(load_seconds, 3),
+                        "max_shard_cpu_seconds": round(critical, 3),
+                        "query_seconds": round(query_seconds, 4),
+                    }
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
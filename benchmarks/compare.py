@@ -0,0 +1,41 @@
+"""Compare two ``benchmarks.suite`` result files and flag regressions.
+
+Run: python -m benchmarks.compare baseline.json candidate.json [--threshold 1.25]
+Exits with status 1 when any case slowed down by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+def load(path: Path) -> Dict[Tuple[str, int], float]:
+    """Map (case, size) to median seconds."""
+    document = json.loads(path.read_text(encoding="utf-8"))
+    return {(row["case"], row["size"]): row["seconds_median"] for row in document["results"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio that counts as a regression")
+    args = parser.parse_args()
+    baseline = load(args.baseline)
+    candidate = load(args.candidate)
+    regressions = 0
+    for key in sorted(baseline.keys() & candidate.keys(), key=lambda item: (item[1], item[0])):
+        before, after = baseline[key], candidate[key]
+        ratio = after / before if before > 0 else float("inf")
+        flag = "REGRESSION" if ratio > args.threshold else ""
+        regressions += bool(flag)
+        print(f"{key[1]:>9} {key[0]:<55} {before * 1e3:10.3f} -> {after * 1e3:10.3f} ms  x{ratio:5.2f} {flag}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Synthetic catalogs and inventories with realistic ingredient distributions.
+
+Run: python -m benchmarks.generators COUNT OUTPUT [--jsonl] to write a catalog file.
+Recipes are generated lazily, so 10^7-recipe files stream to disk in bounded memory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from pymixology.inventory.items import Ingredient, Mixer, Spirit
+
+BASES = ["Gin", "Rum", "Vodka", "Tequila", "Whiskey", "Bourbon", "Brandy", "Mezcal", "Cachaca", "Champagne"]
+# Relative popularity of each base (gin and rum dominate real menus).
+BASE_WEIGHTS = [18, 17, 15, 12, 11, 9, 7, 5, 3, 3]
+FLAVORS = ["sweet", "sour", "bitter", "strong", "refreshing", "herbal", "citrus", "tropical", "creamy", "spicy"]
+MODIFIERS = ["Lime Juice", "Lemon Juice", "Simple Syrup", "Triple Sec", "Sweet Vermouth", "Dry Vermouth", "Campari",
+             "Angostura Bitters", "Soda Water", "Ginger Beer", "Grenadine", "Orgeat", "Mint", "Egg White", "Cream"]
+UNITS = ["ml"] * 17 + ["dash", "barspoon", "piece"]
+
+
+def ingredient_pool(size: int = 2000) -> List[str]:
+    """Return ingredient names: the real-world staples first, then synthetic long-tail ones."""
+    names = BASES + MODIFIERS
+    names += [f"Ingredient {i}" for i in range(max(size - len(names), 0))]
+    return names[:size]
+
+
+def iter_synthetic_recipes(count: int, seed: int = 533, pool_size: int = 2000) -> Iterator[Dict[str, Any]]:
+    """Yield ``count`` recipes whose ingredient popularity follows a Zipf-like law."""
+    rng = random.Random(seed)
+    pool = ingredient_pool(pool_size)
+    cumulative = list(accumulate(1.0 / (rank + 1) for rank in range(len(pool))))
+    for i in range(count):
+        base = rng.choices(BASES, weights=BASE_WEIGHTS)[0]
+        # Ordered like a set, so the same seed yields the same recipes in every process.
+        names = {base: None}
+        target = rng.choice((2, 3, 3, 4, 4, 4, 5, 5, 6, 7, 8))
+        while len(names) < target:
+            names.setdefault(rng.choices(pool, cum_weights=cumulative)[0])
+        ingredients = []
+        for name in names:
+            unit = "ml" if name == base else rng.choice(UNITS)
+            if name == base:
+                amount = rng.choice((30, 45, 50, 60))
+            else:
+                amount = rng.randint(5, 60) if unit == "ml" else rng.randint(1, 3)
+            ingredients.append({"name": name, "amount": amount, "unit": unit})
+        yield {
+            "name": f"{rng.choice(FLAVORS).title()} {base} {i}",
+            "base": base,
+            "flavor": rng.choice(FLAVORS),
+            "ingredients": ingredients,
+            "steps": ["Shake with ice", "Strain into glass"],
+        }
+
+
+def synthetic_recipes(count: int, seed: int = 533, pool_size: int = 2000) -> List[Dict[str, Any]]:
+    """Materialized ``iter_synthetic_recipes`` (already in ``load_recipes`` shape)."""
+    return list(iter_synthetic_recipes(count, seed, pool_size))
+
+
+def write_synthetic_catalog(path: Path, count: int, seed: int = 533, json_lines: bool = False) -> None:
+    """Stream a synthetic catalog to disk as a JSON array (or JSON Lines)."""
+    with Path(path).open("w", encoding="utf-8") as f:
+        if json_lines:
+            for recipe in iter_synthetic_recipes(count, seed):
+                f.write(json.dumps(recipe) + "\n")
+            return
+        f.write("[\n")
+        for i, recipe in enumerate(iter_synthetic_recipes(count, seed)):
+            f.write(("," if i else "") + json.dumps(recipe) + "\n")
+        f.write("]\n")
+
+
+def synthetic_inventory(size: int = 500, seed: int = 533, coverage: float = 0.6) -> List[Ingredient]:
+    """Return an inventory stocking the most popular ``coverage`` share of ``size`` ingredients."""
+    rng = random.Random(seed)
+    items: List[Ingredient] = []
+    for name in ingredient_pool(size):
+        if rng.random() > coverage and name not in BASES:
+            continue
+        quantity = rng.choice((0, 50, 200, 700, 1000, 1750))
+        expiry = f"20{rng.randint(25, 28)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        value = round(rng.uniform(5, 60), 2)
+        if name in BASES:
+            items.append(Spirit(name, quantity, expiry, 0.40, value=value))
+        else:
+            items.append(Mixer(name, quantity, expiry, name in ("Soda Water", "Ginger Beer"), value=value))
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic recipe catalog.")
+    parser.add_argument("count", type=int)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--jsonl", action="store_true", help="write JSON Lines instead of a JSON array")
+    parser.add_argument("--seed", type=int, default=533)
+    args = parser.parse_args()
+    write_synthetic_catalog(args.output, args.count, seed=args.seed, json_lines=args.jsonl)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,539 @@
+"""Time the public pymixology API across synthetic catalog sizes.
+
+Run: python -m benchmarks.suite --sizes 1000 10000 100000 --output results.json
+Each case's inputs are built lazily and freed after its last case, so large
+sizes can be run on a subset: --sizes 10000000 --cases "recipes.iter_recipes" "*[binary]".
+Results are JSON so two revisions can be compared with ``benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import fnmatch
+import functools
+import io
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pymixology.inventory.concurrent import ConcurrentInventory
+from pymixology.inventory.manager import (
+    Inventory,
+    add_item,
+    check_stock,
+    get_shopping_list,
+    remove_item,
+    total_value,
+)
+from pymixology.inventory.items import Mixer
+from pymixology.inventory.forecast import (
+    ExpiryIndex,
+    demand_from_orders,
+    demand_from_reviews,
+    plan_shopping,
+    plan_shopping_batch,
+)
+from pymixology.inventory.journal import InventoryJournal
+from pymixology.inventory.orders import serve_orders
+from pymixology.inventory.pricing import MenuPricing, optimize_menu, price_menu
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import (
+    BinaryCatalog,
+    RecipeCatalog,
+    display_recipe,
+    filter_by_base,
+    iter_recipes,
+    load_recipes,
+    search_cocktail,
+    write_binary_catalog,
+)
+from pymixology.recipes.fuzzy import FuzzyIndex, fuzzy_search_cocktail, fuzzy_search_ingredient
+from pymixology.recipes.render import render_recipes
+from pymixology.recipes.sharding import ShardedCatalog, shard_ranges
+from pymixology.recipes.tools import (
+    IngredientColumns,
+    calculate_abv,
+    calculate_abv_batch,
+    convert_units,
+    estimate_cost,
+    estimate_cost_batch,
+    scale_catalog,
+    scale_recipe,
+    unit_converter,
+)
+from pymixology.recommendation.cache import RecommendationCache
+from pymixology.recommendation.flavor import FlavorIndex, rank_by_flavor_profile
+from pymixology.recommendation.sampler import RecipeSampler, preference_weights
+from pymixology.recommendation.similarity import SimilarityIndex
+from pymixology.recommendation.preference import (
+    ProfileRegistry,
+    ReviewStore,
+    get_top_favorites,
+    record_review,
+    set_flavor_profile,
+)
+from pymixology.recommendation.suggester import (
+    MakeableIndex,
+    find_cocktails_with_ingredients,
+    get_makeable_cocktails,
+    get_nearly_makeable_cocktails,
+    recommend_by_flavor,
+    surprise_flight,
+    surprise_me,
+)
+
+from .generators import iter_synthetic_recipes, synthetic_inventory, synthetic_recipes, write_synthetic_catalog
+
+PROFILE = {"sweet": 4, "sour": 7, "bitter": 6, "strong": 8}
+USERS = 1_000
+
+
+def time_case(func: Callable[[], Any], repeats: int) -> Dict[str, float]:
+    """Run ``func`` ``repeats`` times and return min/median wall seconds."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {"seconds_min": min(samples), "seconds_median": statistics.median(samples)}
+
+
+class Fixtures:
+    """Benchmark inputs for one catalog size, each built on first use.
+
+    Cases name the fixtures they need so ``run`` can build them before timing
+    starts and ``release`` them after their last case, so only what the
+    selected cases use is ever materialized. The on-disk catalogs are streamed
+    from the generator, so file-only cases run at 10^7 recipes without holding
+    the catalog in memory.
+    """
+
+    def __init__(self, size: int, workdir: Path) -> None:
+        self.size = size
+        self.workdir = workdir
+
+    def release(self, name: str) -> None:
+        """Drop a built fixture, closing it if it holds a file, connection or process."""
+        value = self.__dict__.pop(name, None)
+        if hasattr(value, "close"):
+            value.close()
+
+    @functools.cached_property
+    def recipes(self) -> List[Dict[str, Any]]:
+        return synthetic_recipes(self.size)
+
+    @functools.cached_property
+    def json_path(self) -> Path:
+        path = self.workdir / f"catalog_{self.size}.json"
+        write_synthetic_catalog(path, self.size)
+        return path
+
+    @functools.cached_property
+    def binary_path(self) -> Path:
+        path = self.workdir / f"catalog_{self.size}.bin"
+        write_binary_catalog(iter_synthetic_recipes(self.size), str(path))
+        return path
+
+    @functools.cached_property
+    def catalog(self) -> RecipeCatalog:
+        return RecipeCatalog(self.recipes)
+
+    @functools.cached_property
+    def binary(self) -> BinaryCatalog:
+        return BinaryCatalog(str(self.binary_path))
+
+    @functools.cached_property
+    def sharded(self) -> ShardedCatalog:
+        return ShardedCatalog.from_file(str(self.json_path), 2)
+
+    @functools.cached_property
+    def makeable(self) -> MakeableIndex:
+        return MakeableIndex(self.recipes)
+
+    @functools.cached_property
+    def menu(self) -> MenuPricing:
+        return MenuPricing(self.recipes)
+
+    @functools.cached_property
+    def flavor(self) -> FlavorIndex:
+        return FlavorIndex(self.recipes)
+
+    @functools.cached_property
+    def similarity(self) -> SimilarityIndex:
+        return SimilarityIndex(self.recipes)
+
+    @functools.cached_property
+    def fuzzy(self) -> FuzzyIndex:
+        return FuzzyIndex(self.recipes)
+
+    @functools.cached_property
+    def sampler(self) -> RecipeSampler:
+        return RecipeSampler(self.recipes, [i % 5 + 1.0 for i in range(len(self.recipes))])
+
+    @functools.cached_property
+    def inventory_items(self) -> List[Any]:
+        return synthetic_inventory()
+
+    @functools.cached_property
+    def inventory(self) -> Inventory:
+        return Inventory(synthetic_inventory(), columnar=True)
+
+    @functools.cached_property
+    def concurrent(self) -> ConcurrentInventory:
+        return ConcurrentInventory(synthetic_inventory())
+
+    @functools.cached_property
+    def journal(self) -> InventoryJournal:
+        journal = InventoryJournal(self.workdir / f"journal_{self.size}")
+        for item in synthetic_inventory():
+            journal.inventory.add(item)
+        return journal
+
+    @functools.cached_property
+    def cache(self) -> RecommendationCache:
+        return RecommendationCache()
+
+    @functools.cached_property
+    def reviews(self) -> Dict[str, int]:
+        return {recipe["name"]: i % 5 + 1 for i, recipe in enumerate(self.recipes)}
+
+    @functools.cached_property
+    def review_store(self) -> ReviewStore:
+        store = ReviewStore()
+        store.add_many(self.reviews.items())
+        return store
+
+    @functools.cached_property
+    def registry(self) -> ProfileRegistry:
+        registry = ProfileRegistry(cache_size=USERS)
+        for i in range(USERS):
+            registry.set(f"user-{i}", {"sweet": i % 10, "sour": i % 7, "bitter": i % 5, "strong": i % 3})
+        return registry
+
+    @functools.cached_property
+    def volumes(self) -> List[List[Dict[str, float]]]:
+        return [[{"vol": item["amount"], "abv": 0.4} for item in recipe["ingredients"]] for recipe in self.recipes]
+
+    @functools.cached_property
+    def volume_columns(self) -> IngredientColumns:
+        return IngredientColumns.from_lists(self.volumes, ("vol", "abv"))
+
+    @functools.cached_property
+    def costs(self) -> List[List[Dict[str, float]]]:
+        return [
+            [{"price_per_bottle": 30, "bottle_vol": 700, "used_vol": item["amount"]} for item in recipe["ingredients"]]
+            for recipe in self.recipes
+        ]
+
+    @functools.cached_property
+    def cost_columns(self) -> IngredientColumns:
+        return IngredientColumns.from_lists(self.costs, ("price_per_bottle", "bottle_vol", "used_vol"))
+
+    @functools.cached_property
+    def orders(self) -> List[Tuple[str, int]]:
+        return [(recipe["name"], 2) for recipe in self.recipes[:100]]
+
+    @functools.cached_property
+    def demand(self) -> Dict[str, float]:
+        return demand_from_orders(self.orders, 7)
+
+
+# (case name, fixtures it needs, callable taking the Fixtures)
+Case = Tuple[str, Tuple[str, ...], Callable[[Fixtures], Any]]
+
+
+def _add_then_remove(target: Any) -> None:
+    add_item(target, Mixer("Benchmark Item", 1, "2030-01-01", False))
+    remove_item(target, "Benchmark Item")
+
+
+def _display(recipe: Dict[str, Any]) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        display_recipe(recipe)
+
+
+def _journal_writes(journal: InventoryJournal) -> None:
+    for item in journal.inventory:
+        item.quantity += 1
+
+
+def _restock_then_reserve(concurrent: ConcurrentInventory) -> None:
+    for _ in range(1_000):
+        concurrent.restock("Gin", 1)
+        concurrent.reserve("Gin", 1)
+
+
+async def _reserve_many(concurrent: ConcurrentInventory) -> None:
+    for _ in range(1_000):
+        concurrent.restock("Gin", 1)
+        await concurrent.reserve_async("Gin", 1, timeout=0.01)
+
+
+def _cache_after_restock(data: Fixtures) -> List[str]:
+    # A quantity change on a used ingredient invalidates the cached makeable set.
+    item = data.inventory.get("Gin")
+    item.quantity = item.quantity
+    return data.cache.get_makeable_cocktails(data.inventory, data.catalog)
+
+
+CASES: List[Case] = [
+    ("recipes.load_recipes", ("json_path",), lambda d: load_recipes(str(d.json_path))),
+    ("recipes.iter_recipes", ("json_path",), lambda d: sum(1 for _ in iter_recipes(str(d.json_path)))),
+    (
+        "recipes.write_binary_catalog",
+        ("recipes",),
+        lambda d: write_binary_catalog(d.recipes, str(d.workdir / "out.bin")),
+    ),
+    ("recipes.search_cocktail[list]", ("recipes",), lambda d: search_cocktail(d.recipes, "gin 1")),
+    ("recipes.search_cocktail[catalog]", ("catalog",), lambda d: search_cocktail(d.catalog, "gin 1")),
+    ("recipes.search_cocktail[binary]", ("binary",), lambda d: search_cocktail(d.binary, "gin 1")),
+    ("recipes.search_cocktail[sharded]", ("sharded",), lambda d: search_cocktail(d.sharded, "gin 1")),
+    ("recipes.filter_by_base[list]", ("recipes",), lambda d: filter_by_base(d.recipes, "Tequila")),
+    ("recipes.filter_by_base[catalog]", ("catalog",), lambda d: filter_by_base(d.catalog, "Tequila")),
+    ("recipes.filter_by_base[binary]", ("binary",), lambda d: filter_by_base(d.binary, "Tequila")),
+    ("recipes.RecipeCatalog", ("recipes",), lambda d: RecipeCatalog(d.recipes)),
+    ("recipes.shard_ranges", ("json_path",), lambda d: shard_ranges(str(d.json_path), 4)),
+    (
+        "recipes.ShardedCatalog.from_file",
+        ("json_path",),
+        lambda d: ShardedCatalog.from_file(str(d.json_path), 2).close(),
+    ),
+    ("recipes.display_recipe", ("recipes",), lambda d: _display(d.recipes[0])),
+    ("recipes.render_recipes[text]", ("recipes",), lambda d: render_recipes(d.recipes, d.workdir / "menu.txt")),
+    (
+        "recipes.render_recipes[csv,scaled]",
+        ("recipes",),
+        lambda d: render_recipes(d.recipes, d.workdir / "prep.csv", "csv", servings=8),
+    ),
+    ("recipes.FuzzyIndex", ("recipes",), lambda d: FuzzyIndex(d.recipes)),
+    ("recipes.fuzzy_search_cocktail", ("fuzzy",), lambda d: fuzzy_search_cocktail(d.fuzzy, "margerita gin")),
+    ("recipes.fuzzy_search_ingredient", ("fuzzy",), lambda d: fuzzy_search_ingredient(d.fuzzy, "lemon juce")),
+    ("names.canonical_name", ("recipes",), lambda d: [canonical_name(i["name"]) for i in d.recipes[0]["ingredients"]]),
+    ("tools.calculate_abv", ("volumes",), lambda d: [calculate_abv(batch) for batch in d.volumes]),
+    ("tools.calculate_abv_batch[list]", ("volumes",), lambda d: calculate_abv_batch(d.volumes)),
+    ("tools.calculate_abv_batch[columns]", ("volume_columns",), lambda d: calculate_abv_batch(d.volume_columns)),
+    ("tools.estimate_cost", ("costs",), lambda d: [estimate_cost(batch) for batch in d.costs]),
+    ("tools.estimate_cost_batch[list]", ("costs",), lambda d: estimate_cost_batch(d.costs)),
+    ("tools.estimate_cost_batch[columns]", ("cost_columns",), lambda d: estimate_cost_batch(d.cost_columns)),
+    ("tools.unit_converter", (), lambda d: unit_converter(45, "ml", "oz")),
+    ("tools.convert_units", (), lambda d: convert_units([45.0] * d.size, "ml", "oz")),
+    ("tools.scale_recipe", ("recipes",), lambda d: [scale_recipe(recipe, 8) for recipe in d.recipes]),
+    ("tools.scale_catalog", ("recipes",), lambda d: scale_catalog(d.recipes, 8)),
+    ("inventory.add_remove[list]", ("inventory_items",), lambda d: _add_then_remove(d.inventory_items)),
+    ("inventory.add_remove[inventory]", ("inventory",), lambda d: _add_then_remove(d.inventory)),
+    ("inventory.check_stock[list]", ("inventory_items",), lambda d: check_stock(d.inventory_items, "Ingredient 400")),
+    ("inventory.check_stock[inventory]", ("inventory",), lambda d: check_stock(d.inventory, "Ingredient 400")),
+    ("inventory.get_shopping_list[list]", ("inventory_items",), lambda d: get_shopping_list(d.inventory_items, 100)),
+    ("inventory.get_shopping_list[inventory]", ("inventory",), lambda d: get_shopping_list(d.inventory, 100)),
+    ("inventory.total_value[list]", ("inventory_items",), lambda d: total_value(d.inventory_items)),
+    ("inventory.total_value[inventory]", ("inventory",), lambda d: total_value(d.inventory)),
+    ("inventory.ConcurrentInventory.reserve", ("concurrent",), lambda d: _restock_then_reserve(d.concurrent)),
+    (
+        "inventory.ConcurrentInventory.reserve_async",
+        ("concurrent",),
+        lambda d: asyncio.run(_reserve_many(d.concurrent)),
+    ),
+    ("inventory.InventoryJournal.write", ("journal",), lambda d: _journal_writes(d.journal)),
+    ("inventory.InventoryJournal.state_at", ("journal",), lambda d: d.journal.state_at(time.time())),
+    (
+        "inventory.serve_orders",
+        ("catalog", "orders"),
+        lambda d: serve_orders(synthetic_inventory(), d.catalog, d.orders),
+    ),
+    ("inventory.price_menu", ("inventory", "menu"), lambda d: price_menu(d.inventory, d.menu)),
+    ("inventory.optimize_menu", ("inventory", "menu"), lambda d: optimize_menu(d.inventory, d.menu, 20)),
+    ("inventory.ExpiryIndex", ("inventory_items",), lambda d: ExpiryIndex(d.inventory_items).expired("2027-01-01")),
+    (
+        "inventory.plan_shopping",
+        ("inventory_items", "catalog", "demand"),
+        lambda d: plan_shopping(d.inventory_items, d.catalog, d.demand, 14, today="2026-01-01"),
+    ),
+    (
+        "inventory.plan_shopping_batch",
+        ("inventory_items", "catalog", "demand"),
+        lambda d: plan_shopping_batch(
+            {venue: d.inventory_items for venue in range(10)},
+            d.catalog,
+            {venue: d.demand for venue in range(10)},
+            14,
+            today="2026-01-01",
+        ),
+    ),
+    ("inventory.demand_from_reviews", ("review_store",), lambda d: demand_from_reviews(d.review_store, 200)),
+    ("recommendation.set_flavor_profile", (), lambda d: set_flavor_profile(4, 7, 6, 8)),
+    ("recommendation.record_review", (), lambda d: record_review({}, "Martini", 5)),
+    ("recommendation.get_top_favorites[dict]", ("reviews",), lambda d: get_top_favorites(d.reviews, top_n=10)),
+    (
+        "recommendation.get_top_favorites[store]",
+        ("review_store",),
+        lambda d: get_top_favorites(d.review_store, top_n=10),
+    ),
+    (
+        "recommendation.ReviewStore.add_many",
+        ("review_store",),
+        lambda d: d.review_store.add_many([("Martini", 5)] * 100),
+    ),
+    ("recommendation.ProfileRegistry.set", ("registry",), lambda d: d.registry.set("user-0", PROFILE)),
+    (
+        "recommendation.ProfileRegistry.load_many",
+        ("registry",),
+        lambda d: d.registry.load_many(f"user-{i}" for i in range(USERS)),
+    ),
+    (
+        "recommendation.get_makeable_cocktails[list]",
+        ("inventory_items", "recipes"),
+        lambda d: get_makeable_cocktails(d.inventory_items, d.recipes),
+    ),
+    (
+        "recommendation.get_makeable_cocktails[index]",
+        ("inventory_items", "makeable"),
+        lambda d: get_makeable_cocktails(d.inventory_items, d.makeable),
+    ),
+    (
+        "recommendation.get_makeable_cocktails[sharded]",
+        ("inventory_items", "sharded"),
+        lambda d: get_makeable_cocktails(d.inventory_items, d.sharded),
+    ),
+    (
+        "recommendation.get_nearly_makeable_cocktails",
+        ("inventory_items", "makeable"),
+        lambda d: get_nearly_makeable_cocktails(d.inventory_items, d.makeable, 1),
+    ),
+    ("recommendation.MakeableIndex", ("recipes",), lambda d: MakeableIndex(d.recipes)),
+    (
+        "recommendation.find_cocktails_with_ingredients[list]",
+        ("recipes",),
+        lambda d: find_cocktails_with_ingredients(["Mint"], d.recipes),
+    ),
+    (
+        "recommendation.find_cocktails_with_ingredients[catalog]",
+        ("catalog",),
+        lambda d: find_cocktails_with_ingredients(["Mint"], d.catalog),
+    ),
+    (
+        "recommendation.RecommendationCache.get_makeable_cocktails",
+        ("cache", "inventory", "catalog"),
+        lambda d: d.cache.get_makeable_cocktails(d.inventory, d.catalog),
+    ),
+    (
+        "recommendation.RecommendationCache.get_makeable_cocktails[invalidated]",
+        ("cache", "inventory", "catalog"),
+        _cache_after_restock,
+    ),
+    (
+        "recommendation.RecommendationCache.recommend_by_flavor",
+        ("cache", "catalog"),
+        lambda d: d.cache.recommend_by_flavor(PROFILE, d.catalog),
+    ),
+    ("recommendation.recommend_by_flavor", ("recipes",), lambda d: recommend_by_flavor(PROFILE, d.recipes)),
+    ("recommendation.rank_by_flavor_profile[list]", ("recipes",), lambda d: rank_by_flavor_profile(PROFILE, d.recipes)),
+    (
+        "recommendation.rank_by_flavor_profile[index,user]",
+        ("flavor", "registry"),
+        lambda d: rank_by_flavor_profile("user-1", d.flavor, registry=d.registry),
+    ),
+    ("recommendation.FlavorIndex.top_k", ("flavor",), lambda d: d.flavor.top_k(PROFILE, 10)),
+    (
+        "recommendation.FlavorIndex.top_k_batch",
+        ("flavor", "registry"),
+        lambda d: d.flavor.top_k_batch([f"user-{i}" for i in range(100)], 10, registry=d.registry),
+    ),
+    ("recommendation.SimilarityIndex", ("recipes",), lambda d: SimilarityIndex(d.recipes)),
+    (
+        "recommendation.SimilarityIndex.similar",
+        ("similarity",),
+        lambda d: d.similarity.similar(d.recipes[0]["name"], 10),
+    ),
+    (
+        "recommendation.SimilarityIndex.closest",
+        ("similarity",),
+        lambda d: d.similarity.closest(["Gin", "Lime Juice", "Simple Syrup"], 10),
+    ),
+    ("recommendation.SimilarityIndex.near_duplicates", ("similarity",), lambda d: d.similarity.near_duplicates()),
+    ("recommendation.surprise_me", ("recipes",), lambda d: surprise_me(d.recipes)),
+    ("recommendation.surprise_me[sampler]", ("sampler",), lambda d: surprise_me(d.sampler)),
+    ("recommendation.surprise_flight[sampler]", ("sampler",), lambda d: surprise_flight(d.sampler, 5)),
+    ("recommendation.RecipeSampler.sample", ("sampler",), lambda d: d.sampler.sample(5)),
+    (
+        "recommendation.RecipeSampler.makeable",
+        ("sampler", "inventory_items"),
+        lambda d: d.sampler.makeable(d.inventory_items).draw(),
+    ),
+    (
+        "recommendation.preference_weights",
+        ("recipes", "review_store"),
+        lambda d: preference_weights(d.recipes, d.review_store, PROFILE),
+    ),
+]
+
+
+def select_cases(patterns: Optional[Sequence[str]] = None) -> List[Case]:
+    """Return the cases whose names match any of ``patterns`` (all cases when None).
+
+    Patterns use ``*`` and ``?`` wildcards; brackets are literal, so "*[binary]" selects variants.
+    """
+    if not patterns:
+        return list(CASES)
+    globs = [pattern.replace("[", "[[]") for pattern in patterns]
+    return [case for case in CASES if any(fnmatch.fnmatchcase(case[0], glob) for glob in globs)]
+
+
+def git_revision() -> str:
+    """Return the current git revision, or an empty string outside a checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run(sizes: List[int], repeats: int, patterns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """Run the selected cases at every size and return the result document."""
+    cases = select_cases(patterns)
+    last_use = {need: index for index, (_, needs, _) in enumerate(cases) for need in needs}
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            data = Fixtures(size, Path(tmp))
+            for index, (name, needs, func) in enumerate(cases):
+                for need in needs:
+                    getattr(data, need)
+                timing = time_case(functools.partial(func, data), repeats)
+                results.append({"case": name, "size": size, "repeats": repeats, **timing})
+                print(f"{size:>9} {name:<70} {timing['seconds_median'] * 1e3:10.3f} ms")
+                for need in needs:
+                    if last_use[need] == index:
+                        data.release(need)
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--cases", nargs="+", metavar="PATTERN", help="only run cases matching these globs")
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args()
+    document = run(args.sizes, args.repeats, args.cases)
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
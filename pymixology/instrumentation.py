@@ -0,0 +1,240 @@
+"""Opt-in instrumentation for pymixology hot paths.
+
+Decorated functions check one module-level flag per call; while instrumentation
+is disabled (the default) they do nothing else. Once ``enable`` is called every
+call is timed and forwarded to the configured sinks together with the number of
+items the call scanned.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import cProfile
+import functools
+import inspect
+import io
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+LATENCY_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+_enabled = False
+_sinks: List["Sink"] = []
+
+
+class FunctionStats:
+    """Call count, latency histogram and items-scanned total for one function."""
+
+    __slots__ = ("calls", "total_seconds", "items_scanned", "buckets")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.items_scanned = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "items_scanned": self.items_scanned,
+            "buckets": dict(zip([*map(str, LATENCY_BUCKETS), "+Inf"], self.buckets)),
+        }
+
+
+class Sink(ABC):
+    """Receives one record per instrumented call."""
+
+    @abstractmethod
+    def record(self, name: str, seconds: float, items_scanned: int) -> None:
+        """Handle one call of ``name`` that took ``seconds`` and scanned ``items_scanned`` items."""
+
+    def flush(self) -> None:
+        """Persist buffered data, if the sink buffers anything."""
+
+
+class InMemorySink(Sink):
+    """Aggregates per-function statistics in memory."""
+
+    def __init__(self) -> None:
+        self.stats: Dict[str, FunctionStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, items_scanned: int) -> None:
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = FunctionStats()
+            stats.calls += 1
+            stats.total_seconds += seconds
+            stats.items_scanned += items_scanned
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a plain-dict copy of the collected statistics."""
+        with self._lock:
+            return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    def reset(self) -> None:
+        """Forget everything collected so far."""
+        with self._lock:
+            self.stats.clear()
+
+
+class LogSink(Sink):
+    """Logs every call through the standard ``logging`` module."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> None:
+        self.logger = logger or logging.getLogger("pymixology.instrumentation")
+        self.level = level
+
+    def record(self, name: str, seconds: float, items_scanned: int) -> None:
+        self.logger.log(self.level, "%s took %.6fs scanning %d items", name, seconds, items_scanned)
+
+
+class PrometheusFileSink(InMemorySink):
+    """Aggregates in memory and writes Prometheus text exposition format on ``flush``."""
+
+    def __init__(self, path: str, prefix: str = "pymixology") -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.prefix = prefix
+
+    def render(self) -> str:
+        """Return the current statistics in Prometheus text format."""
+        p = self.prefix
+        lines = [
+            f"# TYPE {p}_calls_total counter",
+            f"# TYPE {p}_items_scanned_total counter",
+            f"# TYPE {p}_call_seconds histogram",
+        ]
+        for name, stats in sorted(self.snapshot().items()):
+            label = f'function="{name}"'
+            lines.append(f"{p}_calls_total{{{label}}} {stats['calls']}")
+            lines.append(f"{p}_items_scanned_total{{{label}}} {stats['items_scanned']}")
+            cumulative = 0
+            for bound, count in stats["buckets"].items():
+                cumulative += count
+                lines.append(f'{p}_call_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f"{p}_call_seconds_sum{{{label}}} {stats['total_seconds']}")
+            lines.append(f"{p}_call_seconds_count{{{label}}} {stats['calls']}")
+        return "\n".join(lines) + "\n"
+
+    def flush(self) -> None:
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(self.render(), encoding="utf-8")
+        temporary.replace(self.path)
+
+
+def enable(*sinks: Sink) -> List[Sink]:
+    """Turn instrumentation on; with no sinks an ``InMemorySink`` is used. Returns the active sinks."""
+    global _enabled, _sinks
+    _sinks = list(sinks) or [InMemorySink()]
+    _enabled = True
+    return _sinks
+
+
+def disable() -> None:
+    """Turn instrumentation off and flush the sinks."""
+    global _enabled
+    _enabled = False
+    for sink in _sinks:
+        sink.flush()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def instrument(
+    name: Optional[str] = None, scans: Optional[str] = None, indexed: Tuple[type, ...] = ()
+) -> Callable[[F], F]:
+    """Decorate a function so calls are reported while instrumentation is enabled.
+
+    ``scans`` names the argument whose ``len()`` counts as the items scanned.
+    When that argument is an instance of one of the ``indexed`` types the call
+    takes an index lookup instead of a scan and reports 0 items scanned.
+    """
+
+    def decorator(func: F) -> F:
+        label = name or f"{func.__module__}.{func.__qualname__}"
+        position = list(inspect.signature(func).parameters).index(scans) if scans else None
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                scanned = 0
+                if position is not None:
+                    target = args[position] if position < len(args) else kwargs.get(scans)
+                    if not isinstance(target, indexed):
+                        try:
+                            scanned = len(target)
+                        except TypeError:
+                            pass
+                for sink in _sinks:
+                    sink.record(label, elapsed, scanned)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class ProfileResult:
+    """cProfile statistics and tracemalloc snapshot captured by ``profile_block``."""
+
+    def __init__(self) -> None:
+        self.profile: Optional[cProfile.Profile] = None
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.peak_bytes = 0
+
+    def stats(self, sort_by: str = "cumulative", limit: int = 20) -> str:
+        """Return the top cProfile entries as text."""
+        if self.profile is None:
+            return ""
+        out = io.StringIO()
+        pstats.Stats(self.profile, stream=out).sort_stats(sort_by).print_stats(limit)
+        return out.getvalue()
+
+    def top_allocations(self, limit: int = 10, key_type: str = "lineno") -> Sequence[tracemalloc.Statistic]:
+        """Return the largest allocation sites seen inside the block."""
+        if self.snapshot is None:
+            return []
+        return self.snapshot.statistics(key_type)[:limit]
+
+
+@contextlib.contextmanager
+def profile_block(cpu: bool = True, memory: bool = True) -> Iterator[ProfileResult]:
+    """Capture a cProfile profile and/or tracemalloc snapshot around a block of calls."""
+    result = ProfileResult()
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if cpu:
+        result.profile = cProfile.Profile()
+        result.profile.enable()
+    try:
+        yield result
+    finally:
+        if cpu:
+            result.profile.disable()
+        if memory:
+            result.snapshot = tracemalloc.take_snapshot()
+            result.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
@@ -0,0 +1,119 @@
+"""Thread-safe and asyncio-friendly access to a shared inventory."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .items import Ingredient, _stripe
+from .manager import Inventory
+
+
+class ConcurrentInventory:
+    """Inventory wrapper that reserves and restocks stock safely across workers.
+
+    Quantity changes take the ingredient's striped lock from ``items`` (the same
+    one ``Ingredient.use`` takes), so concurrent reservations can never oversell.
+    Adding or removing items is serialized by a separate structural lock.
+    Coroutines waiting in ``reserve_async`` park on asyncio events that
+    ``restock`` sets, so they hold no thread and can be cancelled safely.
+    """
+
+    def __init__(self, items: Optional[Union[Inventory, Iterable[Ingredient]]] = None) -> None:
+        self.inventory = items if isinstance(items, Inventory) else Inventory(items)
+        self._structure = threading.RLock()
+        self._async_waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._waiters_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.inventory)
+
+    def __iter__(self) -> Iterator[Ingredient]:
+        with self._structure:
+            return iter(list(self.inventory))
+
+    def add(self, item: Ingredient) -> None:
+        """Add an ingredient."""
+        with self._structure:
+            self.inventory.add(item)
+
+    def remove(self, item_name: str) -> Optional[Ingredient]:
+        """Remove and return the first item matching a name, or None."""
+        with self._structure:
+            return self.inventory.remove(item_name)
+
+    def check_stock(self, item_name: str) -> float:
+        """Return the current quantity for an item, or 0 when missing."""
+        item = self.inventory.get(item_name)
+        return item.quantity if item is not None else 0.0
+
+    def reserve(self, item_name: str, amount: float, timeout: Optional[float] = 0.0) -> bool:
+        """Atomically deduct stock, waiting up to ``timeout`` seconds (None waits forever)."""
+        if amount <= 0:
+            return False
+        item = self.inventory.get(item_name)
+        if item is None:
+            return False
+        condition = _stripe(item)
+        with condition:
+            if timeout == 0:
+                available = item.quantity >= amount
+            else:
+                available = condition.wait_for(lambda: item.quantity >= amount, timeout)
+            if available:
+                item.quantity -= amount
+                return True
+            return False
+
+    def restock(self, item_name: str, amount: float) -> bool:
+        """Add stock to an existing item and wake any waiting reservations."""
+        if amount <= 0:
+            return False
+        item = self.inventory.get(item_name)
+        if item is None:
+            return False
+        condition = _stripe(item)
+        with condition:
+            item.quantity += amount
+            condition.notify_all()
+        with self._waiters_lock:
+            waiters = list(self._async_waiters.get(item.key, ()))
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+        return True
+
+    async def reserve_async(self, item_name: str, amount: float, timeout: Optional[float] = None) -> bool:
+        """Awaitable ``reserve``: waits on the event loop for a ``restock`` instead of blocking a thread.
+
+        Stock is only deducted by the non-blocking check, so cancelling the
+        coroutine (e.g. through ``asyncio.wait_for``) never consumes stock.
+        """
+        item = self.inventory.get(item_name)
+        if item is None or amount <= 0:
+            return False
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            event = asyncio.Event()
+            waiter = (loop, event)
+            key = item.key
+            # Register before checking, so a restock between the check and the wait is not missed.
+            with self._waiters_lock:
+                self._async_waiters.setdefault(key, []).append(waiter)
+            try:
+                if self.reserve(item_name, amount, timeout=0):
+                    return True
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return False
+            finally:
+                with self._waiters_lock:
+                    waiters = self._async_waiters[key]
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del self._async_waiters[key]
@@ -0,0 +1,197 @@
+"""Expiry-aware demand forecasting and shopping lists."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Any, Dict, Hashable, Iterable, List, Sequence, Tuple, Union
+
+from pymixology.instrumentation import instrument
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import _normalize_ingredient
+from pymixology.recommendation.preference import ReviewStore
+
+from .items import Ingredient
+from .orders import _recipe_lookup, _requirements
+
+# Day ordinal used for items without an expiry date.
+NEVER = date.max.toordinal()
+
+_PARSED: Dict[str, int] = {}
+
+DateLike = Union[date, str, None]
+
+
+def expiry_day(value: DateLike) -> int:
+    """Return an expiry date (ISO string, date or datetime) as a day ordinal; blank means ``NEVER``."""
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    if not value or not str(value).strip():
+        return NEVER
+    day = _PARSED.get(value)
+    if day is None:
+        try:
+            day = date.fromisoformat(str(value).strip()).toordinal()
+        except ValueError:
+            raise ValueError(f"Unrecognized expiry date: {value!r}.") from None
+        _PARSED[value] = day
+    return day
+
+
+class ExpiryIndex:
+    """Inventory items sorted by expiry date, parsed once.
+
+    Items without an expiry date sort last. Ties keep inventory order, so lots
+    of the same ingredient are used first-expired-first-out.
+    """
+
+    def __init__(self, inventory_list: Iterable[Ingredient]) -> None:
+        ordered = sorted(
+            ((expiry_day(item.expiry_date), seq, item) for seq, item in enumerate(inventory_list)),
+            key=lambda entry: entry[:2],
+        )
+        self._days = array("q", (day for day, _, _ in ordered))
+        self._items: List[Ingredient] = [item for _, _, item in ordered]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def expiring_by(self, day: DateLike) -> List[Ingredient]:
+        """Return items expiring on or before ``day``, soonest first."""
+        return self._items[: bisect_right(self._days, expiry_day(day))]
+
+    def expired(self, today: DateLike = None) -> List[Ingredient]:
+        """Return items whose expiry date is before ``today``."""
+        return self._items[: bisect_left(self._days, _today(today))]
+
+    def lots(self) -> Dict[str, List[Tuple[int, Ingredient]]]:
+        """Group (expiry day, item) pairs by canonical name, soonest first."""
+        grouped: Dict[str, List[Tuple[int, Ingredient]]] = {}
+        for day, item in zip(self._days, self._items):
+            grouped.setdefault(item.key, []).append((day, item))
+        return grouped
+
+
+def demand_from_orders(orders: Iterable[Tuple[str, float]], days: float) -> Dict[str, float]:
+    """Turn (recipe name, servings) orders recorded over ``days`` into daily servings per recipe."""
+    if days <= 0:
+        raise ValueError("days must be positive.")
+    totals: Dict[str, float] = {}
+    for name, servings in orders:
+        key = name.lower().strip()
+        totals[key] = totals.get(key, 0.0) + servings
+    return {name: total / days for name, total in totals.items()}
+
+
+def demand_from_reviews(reviews_db: Any, servings_per_day: float) -> Dict[str, float]:
+    """Split ``servings_per_day`` across recipes by review volume (or rating, for a name->rating dict)."""
+    if isinstance(reviews_db, ReviewStore):
+        weights: Dict[str, float] = dict(reviews_db.counts())
+    elif isinstance(reviews_db, dict):
+        weights = {name: float(rating) for name, rating in reviews_db.items()}
+    elif isinstance(reviews_db, list):
+        weights = {}
+        for entry in reviews_db:
+            name = entry.get("cocktail")
+            if name is not None:
+                weights[name] = weights.get(name, 0.0) + 1.0
+    else:
+        raise TypeError("reviews_db must be a list, dict or ReviewStore.")
+    total = sum(weight for weight in weights.values() if weight > 0)
+    if total <= 0:
+        return {}
+    demand: Dict[str, float] = {}
+    for name, weight in weights.items():
+        if weight > 0:
+            key = name.lower().strip()
+            demand[key] = demand.get(key, 0.0) + servings_per_day * weight / total
+    return demand
+
+
+def plan_shopping(
+    inventory_list: Iterable[Ingredient],
+    recipe_db: Iterable[Dict[str, Any]],
+    demand: Dict[str, float],
+    horizon_days: int,
+    today: DateLike = None,
+    safety_days: float = 0.0,
+) -> List[Tuple[str, float]]:
+    """Return (ingredient name, amount to buy) needed to meet ``demand`` for ``horizon_days``.
+
+    ``demand`` maps recipe names to daily servings (see ``demand_from_orders``
+    and ``demand_from_reviews``). Stock is consumed first-expired-first-out and
+    a lot only counts toward the days before it expires. ``safety_days`` adds
+    that many days of demand on top. Results are most urgent first.
+    """
+    return plan_shopping_batch(
+        {None: inventory_list}, recipe_db, {None: demand}, horizon_days, today=today, safety_days=safety_days
+    )[None]
+
+
+@instrument(scans="venues")
+def plan_shopping_batch(
+    venues: Dict[Hashable, Iterable[Ingredient]],
+    recipe_db: Iterable[Dict[str, Any]],
+    demand: Dict[Hashable, Dict[str, float]],
+    horizon_days: int,
+    today: DateLike = None,
+    safety_days: float = 0.0,
+) -> Dict[Hashable, List[Tuple[str, float]]]:
+    """``plan_shopping`` for many venues at once, compiling the recipes a single time."""
+    if horizon_days < 0 or safety_days < 0:
+        raise ValueError("horizon_days and safety_days must be non-negative.")
+    start = _today(today)
+    find_recipe = _recipe_lookup(recipe_db)
+    compiled: Dict[str, Sequence[Tuple[str, float, float]]] = {}
+    names: Dict[str, str] = {}
+    plans: Dict[Hashable, List[Tuple[str, float]]] = {}
+    for venue, inventory_list in venues.items():
+        daily: Dict[str, float] = {}
+        for recipe_name, rate in demand.get(venue, {}).items():
+            if recipe_name not in compiled:
+                recipe = find_recipe(recipe_name.lower().strip())
+                compiled[recipe_name] = _requirements(recipe) if recipe is not None else ()
+                for item in recipe.get("ingredients", []) if recipe is not None else ():
+                    name = _normalize_ingredient(item)["name"]
+                    names.setdefault(canonical_name(name), name)
+            for key, amount, batch_servings in compiled[recipe_name]:
+                daily[key] = daily.get(key, 0.0) + rate * amount / batch_servings
+        plans[venue] = _shortfalls(ExpiryIndex(inventory_list).lots(), daily, names, start, horizon_days + safety_days)
+    return plans
+
+
+def _shortfalls(
+    lots: Dict[str, List[Tuple[int, Ingredient]]],
+    daily: Dict[str, float],
+    names: Dict[str, str],
+    start: int,
+    days: float,
+) -> List[Tuple[str, float]]:
+    """Amount to buy per ingredient, ordered by how soon current stock runs out."""
+    rows = []
+    for key, rate in daily.items():
+        if rate <= 0:
+            continue
+        covered = 0.0
+        for day, item in lots.get(key, ()):
+            if day < start:
+                continue
+            # A lot expiring on ``day`` can still be used that day.
+            cap = rate * min(day - start + 1, days) - covered
+            if cap <= 0:
+                continue
+            covered += min(item.quantity, cap)
+        shortfall = rate * days - covered
+        if shortfall > 1e-9:
+            name = lots[key][0][1].name if key in lots else names.get(key, key)
+            rows.append((covered / rate, name, shortfall))
+    rows.sort(key=lambda row: (row[0], row[1]))
+    return [(name, shortfall) for _, name, shortfall in rows]
+
+
+def _today(value: DateLike) -> int:
+    """Return ``value`` (default: today) as a day ordinal."""
+    return expiry_day(value) if value is not None else date.today().toordinal()
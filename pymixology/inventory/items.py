@@ -2,18 +2,100 @@
 
 from __future__ import annotations
 
-from typing import Union
+import threading
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from pymixology.names import canonical_name
+
+# Ingredients share a fixed pool of condition variables (lock striping) instead of one lock each.
+_STRIPE_COUNT = 64
+_STRIPES = tuple(threading.Condition() for _ in range(_STRIPE_COUNT))
+
+
+def _stripe(item: "Ingredient") -> threading.Condition:
+    """Return the condition variable guarding an ingredient's quantity."""
+    return _STRIPES[(id(item) >> 4) % _STRIPE_COUNT]
+
+
+def _stripes(items: Iterable["Ingredient"]) -> List[threading.Condition]:
+    """Return the distinct stripes guarding ``items`` in a fixed global order (deadlock-free to take in turn)."""
+    return [_STRIPES[index] for index in sorted({(id(item) >> 4) % _STRIPE_COUNT for item in items})]
 
 
 class Ingredient:
-    """Generic ingredient with quantity and value tracking."""
+    """Generic ingredient with quantity and value tracking.
+
+    ``key`` is the interned canonical name (see ``pymixology.names``) used to
+    match the ingredient against recipes and other inventory items; it is
+    recomputed whenever ``name`` is assigned.
+    """
+
+    __slots__ = ("_name", "key", "_quantity", "_expiry_date", "_unit_value", "_inventory")
 
     def __init__(self, name: str, quantity: float, expiry_date: str, value: float = 0.0) -> None:
+        self._inventory: Any = None
         self.name = name
         self.quantity = quantity
         self.expiry_date = expiry_date
         self.unit_value = (float(value) / quantity) if quantity else 0.0
 
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        """Slot values for copy and pickle; the owning inventory is left behind."""
+        state = {}
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if slot != "_inventory" and hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        return None, state
+
+    def __setstate__(self, state: Tuple[None, Dict[str, Any]]) -> None:
+        """Restore slot values into a detached item (see ``__getstate__``)."""
+        self._inventory = None
+        for slot, value in state[1].items():
+            setattr(self, slot, value)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        old_key = getattr(self, "key", None)
+        self._name = value
+        self.key = canonical_name(value)
+        if self._inventory is not None:
+            self._inventory._renamed(self, old_key)
+
+    @property
+    def quantity(self) -> float:
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, value: float) -> None:
+        self._quantity = value
+        if self._inventory is not None:
+            self._inventory._quantity_changed(self)
+
+    @property
+    def expiry_date(self) -> str:
+        return self._expiry_date
+
+    @expiry_date.setter
+    def expiry_date(self, value: str) -> None:
+        self._expiry_date = value
+        if self._inventory is not None:
+            self._inventory._values_changed(self)
+
+    @property
+    def unit_value(self) -> float:
+        return self._unit_value
+
+    @unit_value.setter
+    def unit_value(self, value: float) -> None:
+        self._unit_value = value
+        if self._inventory is not None:
+            self._inventory._values_changed(self)
+
     def info(self) -> str:
         """Return a short description string."""
         value = self.current_value()
@@ -24,10 +106,11 @@ class Ingredient:
         """Reduce quantity when stock is available."""
         if amount <= 0:
             return False
-        if amount > self.quantity:
-            return False
-        self.quantity -= amount
-        return True
+        with _stripe(self):
+            if amount > self.quantity:
+                return False
+            self.quantity -= amount
+            return True
 
     def current_value(self) -> float:
         """Return the current estimated value based on remaining quantity."""
@@ -37,10 +120,22 @@ class Ingredient:
 class Spirit(Ingredient):
     """Alcoholic ingredient with ABV."""
 
+    __slots__ = ("_abv",)
+
     def __init__(self, name: str, quantity: float, expiry_date: str, abv: float, value: float = 0.0) -> None:
         super().__init__(name, quantity, expiry_date, value=value)
         self.abv = abv
 
+    @property
+    def abv(self) -> float:
+        return self._abv
+
+    @abv.setter
+    def abv(self, value: float) -> None:
+        self._abv = value
+        if self._inventory is not None:
+            self._inventory._values_changed(self)
+
     def get_abv(self) -> float:
         return self.abv
 
@@ -48,9 +143,21 @@ class Spirit(Ingredient):
 class Mixer(Ingredient):
     """Non-spirit ingredient that may be carbonated."""
 
+    __slots__ = ("_is_carbonated",)
+
     def __init__(self, name: str, quantity: float, expiry_date: str, is_carbonated: bool, value: float = 0.0) -> None:
         super().__init__(name, quantity, expiry_date, value=value)
         self.is_carbonated = is_carbonated
 
+    @property
+    def is_carbonated(self) -> bool:
+        return self._is_carbonated
+
+    @is_carbonated.setter
+    def is_carbonated(self, value: bool) -> None:
+        self._is_carbonated = value
+        if self._inventory is not None:
+            self._inventory._values_changed(self)
+
     def is_fizzy(self) -> bool:
         return bool(self.is_carbonated)
@@ -0,0 +1,324 @@
+"""Append-only inventory journal with binary snapshots and time-travel reads."""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .items import Ingredient, Mixer, Spirit
+from .manager import Inventory
+
+_JOURNAL_NAME = "journal.log"
+_JOURNAL_HEADER = struct.Struct("<4sHH")
+_JOURNAL_MAGIC = b"PMXJ"
+# crc32 of the rest, payload length, event type, timestamp, item id, quantity
+_RECORD = struct.Struct("<IIBdQd")
+_SNAPSHOT_HEADER = struct.Struct("<4sHHdQQQI")
+_SNAPSHOT_MAGIC = b"PMXS"
+# item id, kind, quantity, unit value, abv / is_carbonated, name length, expiry length
+_ITEM = struct.Struct("<QBdddHH")
+_FORMAT_VERSION = 1
+_READ_CHUNK = 1 << 20
+
+ADD, REMOVE, QUANTITY = 1, 2, 3
+_KINDS = ((Spirit, 1), (Mixer, 2), (Ingredient, 0))
+
+Timestamp = Union[float, datetime]
+
+
+class JournaledInventory(Inventory):
+    """Inventory that records every add, remove, rename, quantity and value change in its journal.
+
+    Quantity events carry the absolute new quantity, so replaying an event
+    twice (e.g. after a snapshot taken mid-write) is harmless.
+    """
+
+    def __init__(self, journal: "InventoryJournal") -> None:
+        super().__init__()
+        self._journal = journal
+        self._ids: Dict[int, int] = {}
+        self._next_id = 0
+
+    def item_id(self, item: Ingredient) -> int:
+        """Return the journal id of an owned item."""
+        return self._ids[id(item)]
+
+    def add(self, item: Ingredient) -> None:
+        super().add(item)
+        item_id = self._next_id
+        self._next_id += 1
+        self._ids[id(item)] = item_id
+        self._journal._record(ADD, item_id, item.quantity, _encode_item(item_id, item))
+
+    def remove(self, item_name: str) -> Optional[Ingredient]:
+        item = super().remove(item_name)
+        if item is not None:
+            self._journal._record(REMOVE, self._ids.pop(id(item)), item.quantity)
+        return item
+
+    def _quantity_changed(self, item: Ingredient) -> None:
+        super()._quantity_changed(item)
+        self._journal._record(QUANTITY, self._ids[id(item)], item.quantity)
+
+    def _renamed(self, item: Ingredient, old_key: str) -> None:
+        super()._renamed(item, old_key)
+        self._record_item(item)
+
+    def _values_changed(self, item: Ingredient) -> None:
+        super()._values_changed(item)
+        self._record_item(item)
+
+    def _record_item(self, item: Ingredient) -> None:
+        """Journal the whole item record; re-adding under the same id replaces the item on replay."""
+        item_id = self._ids[id(item)]
+        self._journal._record(ADD, item_id, item.quantity, _encode_item(item_id, item))
+
+    def _restore(self, items: Dict[int, Ingredient], next_id: int) -> None:
+        """Adopt recovered items without journaling them again."""
+        for item_id, item in sorted(items.items()):
+            Inventory.add(self, item)
+            self._ids[id(item)] = item_id
+        self._next_id = next_id
+
+
+class InventoryJournal:
+    """Durable event log for one inventory, stored in ``directory``.
+
+    Events are appended to ``journal.log`` as CRC-checked binary records and
+    written with one ``fsync`` per ``sync_every`` events (group commit); call
+    ``sync`` to force the tail out. Every ``snapshot_every`` events the full
+    state is written to a compact binary snapshot that remembers its journal
+    offset, so opening the journal restores the newest snapshot and replays
+    only the events after it. A torn record at the end of the journal (a crash
+    mid-write) is dropped on open. Each snapshot replaces the previous ones, so
+    ``state_at`` before the newest snapshot replays the journal from the start.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        sync_every: int = 1024,
+        snapshot_every: int = 100_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if sync_every <= 0 or snapshot_every <= 0:
+            raise ValueError("sync_every and snapshot_every must be positive.")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.sync_every = sync_every
+        self.snapshot_every = snapshot_every
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._buffer = bytearray()
+        self._pending = 0
+        self._last_time = 0.0
+        path = self.directory / _JOURNAL_NAME
+        if not path.exists() or path.stat().st_size < _JOURNAL_HEADER.size:
+            with open(path, "wb") as handle:
+                handle.write(_JOURNAL_HEADER.pack(_JOURNAL_MAGIC, _FORMAT_VERSION, 0))
+                handle.flush()
+                os.fsync(handle.fileno())
+        self.inventory = JournaledInventory(self)
+        items, next_id, self.events, end, self._last_time = self._replay(float("inf"))
+        self._since_snapshot = self.events - self._latest_snapshot_events()
+        self._file: BinaryIO = open(path, "r+b")
+        self._file.truncate(end)
+        self._file.seek(end)
+        self.inventory._restore(items, next_id)
+
+    def __enter__(self) -> "InventoryJournal":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def sync(self) -> None:
+        """Write buffered events and fsync the journal."""
+        with self._lock:
+            if self._buffer:
+                self._file.write(self._buffer)
+                self._buffer.clear()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+
+    def snapshot(self) -> Path:
+        """Write a snapshot of the current state and return its path."""
+        with self._lock:
+            self.sync()
+            offset = self._file.tell()
+            items = list(self.inventory)
+            path = self.directory / f"snapshot-{self.events:016d}.bin"
+            temp = path.with_suffix(".tmp")
+            with open(temp, "wb") as handle:
+                handle.write(
+                    _SNAPSHOT_HEADER.pack(
+                        _SNAPSHOT_MAGIC, _FORMAT_VERSION, 0, self._last_time, offset,
+                        self.events, self.inventory._next_id, len(items),
+                    )
+                )
+                for item in items:
+                    handle.write(_encode_item(self.inventory.item_id(item), item))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp, path)
+            for _, older in self._snapshots():
+                if older != path:
+                    older.unlink(missing_ok=True)
+            self._since_snapshot = 0
+            return path
+
+    def state_at(self, when: Timestamp) -> Inventory:
+        """Return a detached inventory holding the stock as it was at ``when``.
+
+        Restores the snapshot if it was taken at or before ``when`` (otherwise
+        starts from the beginning) and replays the journal until the first later event.
+        """
+        cutoff = when.timestamp() if isinstance(when, datetime) else float(when)
+        with self._lock:
+            self.sync()
+            items, _, _, _, _ = self._replay(cutoff)
+        return Inventory(item for _, item in sorted(items.items()))
+
+    def close(self) -> None:
+        """Sync and close the journal file."""
+        with self._lock:
+            if not self._file.closed:
+                self.sync()
+                self._file.close()
+
+    def _record(self, event: int, item_id: int, quantity: float, payload: bytes = b"") -> None:
+        """Append one event, syncing and snapshotting on schedule."""
+        with self._lock:
+            # Timestamps never go backwards, so time-travel replay can stop at the first later event.
+            self._last_time = max(self._last_time, self._clock())
+            body = _RECORD.pack(0, len(payload), event, self._last_time, item_id, quantity)[4:] + payload
+            self._buffer += struct.pack("<I", zlib.crc32(body)) + body
+            self.events += 1
+            self._pending += 1
+            self._since_snapshot += 1
+            if self._pending >= self.sync_every:
+                self.sync()
+            if self._since_snapshot >= self.snapshot_every:
+                self.snapshot()
+
+    def _snapshots(self) -> List[Tuple[int, Path]]:
+        """Return (event count, path) for every snapshot, oldest first."""
+        found = []
+        for path in self.directory.glob("snapshot-*.bin"):
+            try:
+                found.append((int(path.stem.split("-", 1)[1]), path))
+            except ValueError:
+                continue
+        return sorted(found)
+
+    def _latest_snapshot_events(self) -> int:
+        snapshots = self._snapshots()
+        return snapshots[-1][0] if snapshots else 0
+
+    def _replay(self, cutoff: float) -> Tuple[Dict[int, Ingredient], int, int, int, float]:
+        """Rebuild state up to ``cutoff``: (items, next id, events, journal end offset, last timestamp)."""
+        items: Dict[int, Ingredient] = {}
+        next_id, events, offset, last_time = 0, 0, _JOURNAL_HEADER.size, 0.0
+        for _, path in reversed(self._snapshots()):
+            loaded = _read_snapshot(path)
+            if loaded is not None and loaded[0] <= cutoff:
+                last_time, offset, events, next_id, items = loaded
+                break
+        with open(self.directory / _JOURNAL_NAME, "rb") as handle:
+            magic, version, _ = _JOURNAL_HEADER.unpack(handle.read(_JOURNAL_HEADER.size))
+            if magic != _JOURNAL_MAGIC or version != _FORMAT_VERSION:
+                raise ValueError("Not an inventory journal.")
+            handle.seek(offset)
+            for end, event, stamp, item_id, quantity, payload in _iter_records(handle):
+                if stamp > cutoff:
+                    break
+                if event == ADD:
+                    items[item_id] = _decode_item(payload, 0)[1]
+                    next_id = max(next_id, item_id + 1)
+                elif event == REMOVE:
+                    items.pop(item_id, None)
+                elif item_id in items:
+                    items[item_id]._quantity = quantity
+                events += 1
+                offset, last_time = end, stamp
+        return items, next_id, events, offset, last_time
+
+
+def _iter_records(handle: BinaryIO) -> Iterator[Tuple[int, int, float, int, float, bytes]]:
+    """Yield (end offset, event, timestamp, item id, quantity, payload) until EOF or a torn record."""
+    size = _RECORD.size
+    unpack = _RECORD.unpack_from
+    base = handle.tell()
+    data = b""
+    while True:
+        chunk = handle.read(_READ_CHUNK)
+        if not chunk:
+            return
+        data += chunk
+        view = memoryview(data)
+        pos = 0
+        while pos + size <= len(data):
+            crc, length, event, stamp, item_id, quantity = unpack(data, pos)
+            end = pos + size + length
+            if end > len(data):
+                break
+            if zlib.crc32(view[pos + 4 : end]) != crc:
+                return
+            yield base + end, event, stamp, item_id, quantity, bytes(view[pos + size : end])
+            pos = end
+        view.release()
+        base += pos
+        data = data[pos:]
+
+
+def _encode_item(item_id: int, item: Ingredient) -> bytes:
+    """Pack one item for the journal or a snapshot."""
+    kind = next(code for cls, code in _KINDS if isinstance(item, cls))
+    extra = float(getattr(item, "abv", 0.0)) if kind == 1 else float(bool(getattr(item, "is_carbonated", False)))
+    name = item.name.encode("utf-8")
+    expiry = str(item.expiry_date or "").encode("utf-8")
+    header = _ITEM.pack(item_id, kind, float(item.quantity), float(item.unit_value), extra, len(name), len(expiry))
+    return header + name + expiry
+
+
+def _decode_item(data: bytes, pos: int) -> Tuple[int, Ingredient, int]:
+    """Unpack one item at ``pos``; returns (item id, item, next position)."""
+    item_id, kind, quantity, unit_value, extra, name_length, expiry_length = _ITEM.unpack_from(data, pos)
+    pos += _ITEM.size
+    name = bytes(data[pos : pos + name_length]).decode("utf-8")
+    pos += name_length
+    expiry = bytes(data[pos : pos + expiry_length]).decode("utf-8")
+    pos += expiry_length
+    if kind == 1:
+        item: Ingredient = Spirit(name, quantity, expiry, extra)
+    elif kind == 2:
+        item = Mixer(name, quantity, expiry, bool(extra))
+    else:
+        item = Ingredient(name, quantity, expiry)
+    # The constructors take a total value; restore the per-unit value as recorded.
+    item.unit_value = unit_value
+    return item_id, item, pos
+
+
+def _read_snapshot(path: Path) -> Optional[Tuple[float, int, int, int, Dict[int, Ingredient]]]:
+    """Load (timestamp, journal offset, events, next id, items) from a snapshot, or None if unreadable."""
+    try:
+        data = path.read_bytes()
+        magic, version, _, stamp, offset, events, next_id, count = _SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != _SNAPSHOT_MAGIC or version != _FORMAT_VERSION:
+            return None
+        items: Dict[int, Ingredient] = {}
+        pos = _SNAPSHOT_HEADER.size
+        for _ in range(count):
+            item_id, item, pos = _decode_item(data, pos)
+            items[item_id] = item
+    except (OSError, struct.error, UnicodeDecodeError):
+        return None
+    return stamp, offset, events, next_id, items
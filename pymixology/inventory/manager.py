@@ -2,43 +2,204 @@
 
 from __future__ import annotations
 
-from typing import List
+import operator
+import threading
+from array import array
+from itertools import compress, repeat
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from pymixology.instrumentation import instrument
+from pymixology.names import canonical_name
 
 from .items import Ingredient
 
 
+class Inventory:
+    """Ingredient container with a canonical-name index (case, accents and aliases folded).
+
+    Iterates in insertion order, so it can stand in for a plain inventory list.
+    With ``columnar=True`` quantity, unit value and ABV are mirrored into
+    contiguous arrays and ``total_value``/``below`` run as C-level reductions;
+    items report quantity, unit value and ABV changes back to their inventory to
+    keep the columns in sync. ``version`` increases on every add, remove or
+    quantity change, under its own lock since items in different lock stripes
+    may change concurrently.
+    """
+
+    def __init__(self, items: Optional[Iterable[Ingredient]] = None, columnar: bool = False) -> None:
+        self.columnar = columnar
+        self._items: Dict[int, Ingredient] = {}
+        self._by_name: Dict[str, List[Ingredient]] = {}
+        self._next_seq = 0
+        self.version = 0
+        self._version_lock = threading.Lock()
+        self._changed_at: Dict[str, int] = {}
+        self._seqs: Dict[int, int] = {}
+        self._rows: Dict[int, int] = {}
+        self._seq_column = array("Q")
+        self._quantity_column = array("d")
+        self._unit_value_column = array("d")
+        self._abv_column = array("d")
+        for item in items or []:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Ingredient]:
+        return iter(self._items.values())
+
+    def __contains__(self, item_name: object) -> bool:
+        return isinstance(item_name, str) and canonical_name(item_name) in self._by_name
+
+    def add(self, item: Ingredient) -> None:
+        """Add an ingredient and index it by name."""
+        if item._inventory is not None:
+            raise ValueError("Ingredient already belongs to an inventory.")
+        seq = self._next_seq
+        self._next_seq += 1
+        self._items[seq] = item
+        self._seqs[id(item)] = seq
+        self._by_name.setdefault(item.key, []).append(item)
+        if self.columnar:
+            self._rows[id(item)] = len(self._seq_column)
+            self._seq_column.append(seq)
+            self._quantity_column.append(item.quantity)
+            self._unit_value_column.append(item.unit_value)
+            self._abv_column.append(getattr(item, "abv", 0.0))
+        item._inventory = self
+        self._touch(item)
+
+    def remove(self, item_name: str) -> Optional[Ingredient]:
+        """Remove and return the first item matching a name, or None."""
+        key = canonical_name(item_name)
+        matches = self._by_name.get(key)
+        if not matches:
+            return None
+        item = matches.pop(0)
+        if not matches:
+            del self._by_name[key]
+        del self._items[self._seqs.pop(id(item))]
+        if self.columnar:
+            self._drop_row(self._rows.pop(id(item)))
+        item._inventory = None
+        self._touch(item)
+        return item
+
+    def get(self, item_name: str) -> Optional[Ingredient]:
+        """Return the first item matching a name (canonicalized), or None."""
+        matches = self._by_name.get(canonical_name(item_name))
+        return matches[0] if matches else None
+
+    def below(self, min_threshold: float) -> List[Ingredient]:
+        """Return items whose quantity is below the threshold, in insertion order."""
+        if not self.columnar:
+            return [item for item in self._items.values() if item.quantity < min_threshold]
+        low = map(operator.lt, self._quantity_column, repeat(min_threshold))
+        return [self._items[seq] for seq in sorted(compress(self._seq_column, low))]
+
+    def total_value(self) -> float:
+        """Return the summed current value of all items."""
+        if not self.columnar:
+            return sum(item.current_value() for item in self._items.values())
+        return sum(map(operator.mul, self._quantity_column, self._unit_value_column))
+
+    def last_changed(self, item_name: str) -> int:
+        """Return the inventory version at which a name's stock last changed (0 if never)."""
+        return self._changed_at.get(canonical_name(item_name), 0)
+
+    def _touch(self, item: Ingredient, *also_changed: str) -> None:
+        """Bump the inventory version and record which names changed."""
+        with self._version_lock:
+            self.version += 1
+            self._changed_at[item.key] = self.version
+            for key in also_changed:
+                self._changed_at[key] = self.version
+
+    def _quantity_changed(self, item: Ingredient) -> None:
+        """Receive a quantity update from an owned item."""
+        if self.columnar:
+            self._quantity_column[self._rows[id(item)]] = item.quantity
+        self._touch(item)
+
+    def _renamed(self, item: Ingredient, old_key: str) -> None:
+        """Receive a name change from an owned item and move it to its new key."""
+        if item.key != old_key:
+            matches = self._by_name[old_key]
+            matches.remove(item)
+            if not matches:
+                del self._by_name[old_key]
+            self._by_name.setdefault(item.key, []).append(item)
+        self._touch(item, old_key)
+
+    def _values_changed(self, item: Ingredient) -> None:
+        """Receive a unit value, ABV, carbonation or expiry update from an owned item."""
+        if self.columnar:
+            row = self._rows[id(item)]
+            self._unit_value_column[row] = item.unit_value
+            self._abv_column[row] = getattr(item, "abv", 0.0)
+
+    def _drop_row(self, row: int) -> None:
+        """Swap-remove one row from every column."""
+        last = len(self._seq_column) - 1
+        if row != last:
+            moved = self._items[self._seq_column[last]]
+            self._rows[id(moved)] = row
+            for column in (self._seq_column, self._quantity_column, self._unit_value_column, self._abv_column):
+                column[row] = column[last]
+        for column in (self._seq_column, self._quantity_column, self._unit_value_column, self._abv_column):
+            column.pop()
+
+
+@instrument()
 def add_item(inventory_list: List[Ingredient], item_object: Ingredient) -> bool:
     """Append a new Spirit or Mixer to the inventory."""
     if not isinstance(item_object, Ingredient):
         raise TypeError("item_object must be an Ingredient.")
+    if isinstance(inventory_list, Inventory):
+        inventory_list.add(item_object)
+        return True
     inventory_list.append(item_object)
     return True
 
 
+@instrument(scans="inventory_list", indexed=(Inventory,))
 def remove_item(inventory_list: List[Ingredient], item_name: str) -> bool:
     """Remove the first matching item by name."""
-    target = item_name.lower().strip()
+    if isinstance(inventory_list, Inventory):
+        return inventory_list.remove(item_name) is not None
+    target = canonical_name(item_name)
     for idx, item in enumerate(inventory_list):
-        if item.name.lower() == target:
+        if item.key is target:
             del inventory_list[idx]
             return True
     return False
 
 
+@instrument(scans="inventory_list", indexed=(Inventory,))
 def check_stock(inventory_list: List[Ingredient], item_name: str) -> float:
     """Return current quantity for an item, or 0 when missing."""
-    target = item_name.lower().strip()
+    if isinstance(inventory_list, Inventory):
+        item = inventory_list.get(item_name)
+        return item.quantity if item is not None else 0.0
+    target = canonical_name(item_name)
     for item in inventory_list:
-        if item.name.lower() == target:
+        if item.key is target:
             return item.quantity
     return 0.0
 
 
+@instrument(scans="inventory_list")
 def get_shopping_list(inventory_list: List[Ingredient], min_threshold: float) -> List[str]:
     """List names that fall below the provided threshold."""
+    if isinstance(inventory_list, Inventory):
+        return [item.name for item in inventory_list.below(min_threshold)]
     return [item.name for item in inventory_list if item.quantity < min_threshold]
 
 
+@instrument(scans="inventory_list")
 def total_value(inventory_list: List[Ingredient]) -> float:
     """Return the total estimated value of all inventory items."""
+    if isinstance(inventory_list, Inventory):
+        return inventory_list.total_value()
     return sum(item.current_value() for item in inventory_list)
@@ -0,0 +1,110 @@
+"""Batch consumption of inventory for recipe orders."""
+
+from __future__ import annotations
+
+import contextlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pymixology.instrumentation import instrument
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import RecipeCatalog, _normalize_ingredient
+
+from .items import Ingredient, _stripes
+from .manager import Inventory
+
+
+@instrument(scans="orders")
+def serve_orders(
+    inventory_list: Iterable[Ingredient],
+    recipe_db: Iterable[Dict[str, Any]],
+    orders: Sequence[Tuple[str, int]],
+    all_or_nothing: bool = False,
+) -> List[bool]:
+    """Deduct stock for a batch of (recipe name, servings) orders.
+
+    Amounts are scaled like ``scale_recipe``. Each order is all-or-nothing: it is
+    fulfilled only if every ingredient is still available after the orders ahead
+    of it. Totals for fulfilled orders are deducted in one pass at the end, so a
+    failed order never leaves stock half-deducted. With ``all_or_nothing=True``
+    nothing is deducted unless every order can be served.
+    Returns one flag per order telling whether it was fulfilled.
+    """
+    for _, servings in orders:
+        if servings <= 0:
+            raise ValueError("Servings must be positive.")
+    find_recipe = _recipe_lookup(recipe_db)
+    find_item = _item_lookup(inventory_list)
+    compiled: Dict[str, Optional[List[Tuple[str, float, float]]]] = {}
+    items: Dict[str, Optional[Ingredient]] = {}
+    plans: List[Optional[Dict[str, float]]] = []
+    for name, servings in orders:
+        key = name.lower().strip()
+        if key not in compiled:
+            recipe = find_recipe(key)
+            compiled[key] = _requirements(recipe) if recipe is not None else None
+        requirements = compiled[key]
+        needed: Optional[Dict[str, float]] = {} if requirements else None
+        for ingredient, amount, batch_servings in requirements or []:
+            if ingredient not in items:
+                items[ingredient] = find_item(ingredient)
+            if items[ingredient] is None:
+                needed = None
+                break
+            needed[ingredient] = needed.get(ingredient, 0.0) + amount * (servings / batch_servings)
+        plans.append(needed)
+
+    # Hold the stripes of every touched item from the stock check through the deduction,
+    # so concurrent ``use``/``reserve`` calls cannot slip in between.
+    with contextlib.ExitStack() as stack:
+        for condition in _stripes(item for item in items.values() if item is not None):
+            stack.enter_context(condition)
+        reserved: Dict[str, float] = {}
+        fulfilled: List[bool] = []
+        for needed in plans:
+            ok = needed is not None and all(
+                items[ingredient].quantity >= reserved.get(ingredient, 0.0) + amount
+                for ingredient, amount in needed.items()
+            )
+            if ok:
+                for ingredient, amount in needed.items():
+                    reserved[ingredient] = reserved.get(ingredient, 0.0) + amount
+            fulfilled.append(ok)
+
+        if all_or_nothing and not all(fulfilled):
+            return [False] * len(fulfilled)
+        for ingredient, amount in reserved.items():
+            if amount > 0:
+                items[ingredient].quantity -= amount
+    return fulfilled
+
+
+def _recipe_lookup(recipe_db: Iterable[Dict[str, Any]]) -> Callable[[str], Optional[Dict[str, Any]]]:
+    """Return a function resolving a lowercased name to its first matching recipe."""
+    if isinstance(recipe_db, RecipeCatalog):
+        return recipe_db.get
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for recipe in recipe_db:
+        by_name.setdefault(str(recipe.get("name", "")).lower(), recipe)
+    return by_name.get
+
+
+def _item_lookup(inventory_list: Iterable[Ingredient]) -> Callable[[str], Optional[Ingredient]]:
+    """Return a function resolving a canonical ingredient name to its first matching inventory item."""
+    if isinstance(inventory_list, Inventory):
+        return inventory_list.get
+    by_name: Dict[str, Ingredient] = {}
+    for item in inventory_list:
+        by_name.setdefault(item.key, item)
+    return by_name.get
+
+
+def _requirements(recipe: Dict[str, Any]) -> List[Tuple[str, float, float]]:
+    """Return (ingredient key, amount, recipe servings) for each ingredient of a recipe."""
+    batch_servings = recipe.get("servings", 1) or 1
+    requirements = []
+    for item in recipe.get("ingredients", []):
+        ingredient = _normalize_ingredient(item)
+        amount = ingredient.get("amount")
+        usable = isinstance(amount, (int, float)) and amount > 0
+        requirements.append((canonical_name(ingredient["name"]), float(amount) if usable else 0.0, batch_servings))
+    return requirements
@@ -0,0 +1,189 @@
+"""Menu-wide costing and menu selection against current stock."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import operator
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymixology.instrumentation import instrument
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import _normalize_ingredient
+from pymixology.recipes.tools import IngredientColumns
+
+from .items import Ingredient
+from .manager import Inventory
+
+OBJECTIVES = ("servings", "margin")
+
+
+class MenuPricing:
+    """Recipes compiled into per-serving requirement columns for bulk pricing.
+
+    Each requirement is an (ingredient slot, amount per serving) pair stored in
+    flat arrays, with one slot per distinct canonical ingredient name; a recipe
+    listing the same slot twice (directly or through an alias) gets one
+    requirement with the amounts summed, as ``serve_orders`` does. ``sync``
+    reads unit values and stock levels for the slots from an inventory, after
+    which costs and makeable servings for the whole menu are computed column-wise.
+    Amounts use the recipe's own units, exactly as ``serve_orders`` deducts them:
+    units are not converted, so recipes and stock must agree on them.
+    """
+
+    def __init__(self, recipe_db: Iterable[Dict[str, Any]]) -> None:
+        self._slot_ids: Dict[str, int] = {}
+        self._slot_keys: List[str] = []
+        self._slots = array("q")
+        self._recipes: List[Dict[str, Any]] = []
+        amounts = array("d")
+        offsets = array("q", [0])
+        for recipe in recipe_db:
+            batch_servings = recipe.get("servings", 1) or 1
+            positions: Dict[int, int] = {}
+            for item in recipe.get("ingredients", []):
+                ingredient = _normalize_ingredient(item)
+                key = canonical_name(ingredient["name"])
+                slot = self._slot_ids.get(key)
+                if slot is None:
+                    slot = len(self._slot_keys)
+                    self._slot_ids[key] = slot
+                    self._slot_keys.append(key)
+                amount = ingredient.get("amount")
+                usable = isinstance(amount, (int, float)) and amount > 0
+                per_serving = amount / batch_servings if usable else 0.0
+                position = positions.get(slot)
+                if position is not None:
+                    amounts[position] += per_serving
+                    continue
+                positions[slot] = len(amounts)
+                self._slots.append(slot)
+                amounts.append(per_serving)
+            offsets.append(len(amounts))
+            self._recipes.append(recipe)
+        self._columns = IngredientColumns({"amount": amounts}, offsets)
+        # NaN marks an ingredient that is not stocked at all.
+        self._unit_values = array("d", [math.nan]) * len(self._slot_keys)
+        self._stock = array("d", [math.nan]) * len(self._slot_keys)
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def sync(self, inventory_list: Iterable[Ingredient]) -> None:
+        """Read unit values and stock levels for every slot from an inventory."""
+        if isinstance(inventory_list, Inventory):
+            find = inventory_list.get
+        else:
+            by_key: Dict[str, Ingredient] = {}
+            for item in inventory_list:
+                by_key.setdefault(item.key, item)
+            find = by_key.get
+        for slot, key in enumerate(self._slot_keys):
+            item = find(key)
+            self._unit_values[slot] = item.unit_value if item is not None else math.nan
+            self._stock[slot] = item.quantity if item is not None else math.nan
+
+    def costs(self) -> List[Optional[float]]:
+        """Return the cost per serving of every recipe, or None when an ingredient is not stocked."""
+        unit_values = map(self._unit_values.__getitem__, self._slots)
+        priced = array("d", map(operator.mul, self._columns.columns["amount"], unit_values))
+        results: List[Optional[float]] = []
+        for part in self._columns.segments():
+            cost = sum(priced[part], 0.0)
+            results.append(None if math.isnan(cost) else cost)
+        return results
+
+    def max_servings(self) -> List[int]:
+        """Return how many servings of each recipe current stock covers on its own."""
+        return self._servings(self._stock)
+
+    def margins(self, prices: Optional[Dict[str, float]] = None) -> List[Optional[float]]:
+        """Return price minus cost per serving, using ``prices`` by name or each recipe's ``price``."""
+        results: List[Optional[float]] = []
+        for recipe, cost in zip(self._recipes, self.costs()):
+            name = recipe.get("name", "")
+            price = prices.get(name) if prices is not None else recipe.get("price")
+            results.append(None if price is None or cost is None else float(price) - cost)
+        return results
+
+    def optimize(
+        self, size: int, objective: str = "servings", prices: Optional[Dict[str, float]] = None
+    ) -> List[Tuple[str, int]]:
+        """Pick up to ``size`` recipes and servings that greedily maximize ``objective``.
+
+        ``"servings"`` maximizes total makeable servings and ``"margin"`` total
+        margin (see ``margins``). Recipes compete for shared stock: each step takes
+        the recipe whose servings from the remaining stock are worth the most and
+        deducts them. Worth only shrinks as stock is used, so candidates are kept
+        in a lazily re-scored heap instead of being re-ranked every step.
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"objective must be one of {OBJECTIVES}.")
+        if size <= 0:
+            return []
+        if objective == "servings":
+            per_serving: List[Optional[float]] = [1.0] * len(self._recipes)
+        else:
+            per_serving = self.margins(prices)
+        stock = array("d", self._stock)
+        segments = list(self._columns.segments())
+        heap = [
+            (-value * servings, rid, servings)
+            for rid, (value, servings) in enumerate(zip(per_serving, self._servings(stock)))
+            if value is not None and value > 0 and servings > 0
+        ]
+        heapq.heapify(heap)
+        chosen: List[Tuple[str, int]] = []
+        while heap and len(chosen) < size:
+            _, rid, stale = heapq.heappop(heap)
+            servings = self._recipe_servings(stock, segments[rid])
+            if servings != stale:
+                if servings > 0:
+                    heapq.heappush(heap, (-per_serving[rid] * servings, rid, servings))
+                continue
+            amounts = self._columns.columns["amount"][segments[rid]]
+            for slot, amount in zip(self._slots[segments[rid]], amounts):
+                stock[slot] -= amount * servings
+            chosen.append((self._recipes[rid].get("name", ""), servings))
+        return chosen
+
+    def _servings(self, stock: array) -> List[int]:
+        """Makeable servings of every recipe from the given stock levels."""
+        return [self._recipe_servings(stock, part) for part in self._columns.segments()]
+
+    def _recipe_servings(self, stock: array, part: slice) -> int:
+        """Makeable servings of one recipe; unstocked or unquantified-only recipes give 0."""
+        limit = math.inf
+        for slot, amount in zip(self._slots[part], self._columns.columns["amount"][part]):
+            level = stock[slot]
+            if math.isnan(level):
+                return 0
+            if amount > 0:
+                limit = min(limit, level / amount)
+        return int(limit) if limit != math.inf else 0
+
+
+@instrument(scans="recipe_db")
+def price_menu(inventory_list: Iterable[Ingredient], recipe_db: Iterable[Dict[str, Any]]) -> Dict[str, Optional[float]]:
+    """Map each recipe name to its cost per serving from inventory unit values (None if unstocked)."""
+    menu = recipe_db if isinstance(recipe_db, MenuPricing) else MenuPricing(recipe_db)
+    menu.sync(inventory_list)
+    result: Dict[str, Optional[float]] = {}
+    for recipe, cost in zip(menu._recipes, menu.costs()):
+        result.setdefault(recipe.get("name", ""), cost)
+    return result
+
+
+@instrument(scans="recipe_db")
+def optimize_menu(
+    inventory_list: Iterable[Ingredient],
+    recipe_db: Iterable[Dict[str, Any]],
+    size: int,
+    objective: str = "servings",
+    prices: Optional[Dict[str, float]] = None,
+) -> List[Tuple[str, int]]:
+    """Choose up to ``size`` cocktails (with servings) that maximize servings or margin from current stock."""
+    menu = recipe_db if isinstance(recipe_db, MenuPricing) else MenuPricing(recipe_db)
+    menu.sync(inventory_list)
+    return menu.optimize(size, objective=objective, prices=prices)
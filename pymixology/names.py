@@ -0,0 +1,59 @@
+"""Canonical ingredient names shared by the recipe catalog and the inventory."""
+
+from __future__ import annotations
+
+import functools
+import sys
+import unicodedata
+from typing import Dict
+
+# Synonyms that should match the same stock, keyed by folded name.
+ALIASES: Dict[str, str] = {
+    "fresh lime juice": "lime juice",
+    "fresh lemon juice": "lemon juice",
+    "fresh orange juice": "orange juice",
+    "sugar syrup": "simple syrup",
+    "gomme syrup": "simple syrup",
+    "club soda": "soda water",
+    "soda": "soda water",
+    "sparkling water": "soda water",
+    "angostura": "angostura bitters",
+    "peychauds bitters": "peychaud's bitters",
+    "rye whiskey": "rye",
+    "bourbon whiskey": "bourbon",
+    "scotch whisky": "scotch",
+    "whisky": "whiskey",
+    "irish whisky": "irish whiskey",
+    "espresso coffee": "espresso",
+}
+
+# Raw names remembered by ``canonical_name``; least recently used ones are evicted beyond this.
+_CACHE_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def canonical_name(name: str) -> str:
+    """Return the interned canonical key for an ingredient name.
+
+    Names are case- and accent-folded, whitespace is collapsed and ``ALIASES``
+    are applied, so "Fresh  Lime Juice" and "lime juice" give the same object.
+    Results are cached per raw string in a bounded LRU cache.
+    """
+    folded = _fold(name)
+    return sys.intern(ALIASES.get(folded, folded))
+
+
+def register_alias(alias: str, canonical: str) -> None:
+    """Map ``alias`` to ``canonical``; do this before building catalogs or inventories."""
+    source = _fold(alias)
+    target = canonical_name(canonical)
+    if source == target:
+        return
+    ALIASES[source] = target
+    canonical_name.cache_clear()
+
+
+def _fold(name: str) -> str:
+    """Casefold, strip accents and collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", str(name))
+    return " ".join("".join(char for char in decomposed if not unicodedata.combining(char)).casefold().split())
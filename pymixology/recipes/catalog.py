@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+import mmap
+import os
+import struct
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_right
 from pathlib import Path
-from typing import Iterable, List, Dict, Any
+from typing import IO, Iterable, Iterator, List, Dict, Any, Optional, Set, Union
 
+from pymixology.instrumentation import instrument
+from pymixology.names import canonical_name
 
+_NGRAM_SIZE = 3
+_CHUNK_SIZE = 1 << 16
+# Largest single recipe the streaming loader will buffer before calling the array malformed.
+_MAX_RECORD_SIZE = 1 << 24
+_BINARY_MAGIC = b"PMXC"
+_BINARY_VERSION = 1
+# magic, version, reserved, recipe count, then offsets of the index, names, name starts and base sections
+_BINARY_HEADER = struct.Struct("<4sHHIQQQQ")
+
+
+@instrument()
 def load_recipes(filepath: str) -> List[Dict[str, Any]]:
     """Load recipe data from a JSON file into a list of dicts."""
     path = Path(filepath)
@@ -17,8 +37,289 @@ def load_recipes(filepath: str) -> List[Dict[str, Any]]:
     return [_normalize_recipe(recipe) for recipe in data]
 
 
+class IndexedCatalog(ABC):
+    """Base for recipe collections that answer name and base queries themselves.
+
+    ``search_cocktail`` and ``filter_by_base`` delegate to ``search`` and
+    ``by_base`` for any subclass instead of scanning.
+    """
+
+    @abstractmethod
+    def search(self, name: str) -> List[Dict[str, Any]]:
+        """Return recipes whose name contains ``name`` (case-insensitive)."""
+
+    @abstractmethod
+    def by_base(self, base_spirit: str) -> List[Dict[str, Any]]:
+        """Return recipes with the given base spirit (case-insensitive)."""
+
+
+class RecipeCatalog(IndexedCatalog):
+    """Indexed recipe collection for fast name, base and ingredient lookups.
+
+    Built from ``load_recipes`` output. Keeps a base-spirit hash index, an
+    n-gram index over lowercased names for substring search and an
+    ingredient-to-recipe inverted index. Iterating yields recipes in insertion
+    order, so a catalog can be passed anywhere a list of recipes is accepted.
+    """
+
+    def __init__(self, recipes: Optional[Iterable[Dict[str, Any]]] = None) -> None:
+        self._recipes: Dict[int, Dict[str, Any]] = {}
+        self._names: Dict[int, str] = {}
+        self._by_object: Dict[int, Set[int]] = {}
+        self._by_name: Dict[str, Set[int]] = {}
+        self._by_base: Dict[str, Set[int]] = {}
+        self._by_ngram: Dict[str, Set[int]] = {}
+        self._by_ingredient: Dict[str, Set[int]] = {}
+        self._next_id = 0
+        self.version = 0
+        for recipe in recipes or []:
+            self.add(recipe)
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._recipes.values())
+
+    def add(self, recipe: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a recipe dict and index it; returns the stored recipe."""
+        if not isinstance(recipe, dict):
+            raise TypeError("recipe must be a dict.")
+        rid = self._next_id
+        self._next_id += 1
+        self.version += 1
+        name = str(recipe.get("name", "")).lower()
+        self._recipes[rid] = recipe
+        self._names[rid] = name
+        self._by_object.setdefault(id(recipe), set()).add(rid)
+        self._by_name.setdefault(name, set()).add(rid)
+        self._by_base.setdefault(_base_key(recipe), set()).add(rid)
+        for gram in _name_ngrams(name):
+            self._by_ngram.setdefault(gram, set()).add(rid)
+        for ingredient in _ingredient_keys(recipe):
+            self._by_ingredient.setdefault(ingredient, set()).add(rid)
+        return recipe
+
+    def remove(self, recipe: Union[str, Dict[str, Any]]) -> bool:
+        """Remove a recipe dict, or the first recipe matching a name (case-insensitive).
+
+        A dict added more than once is removed one copy at a time, first copy first.
+        """
+        if isinstance(recipe, dict):
+            rid = min(self._by_object.get(id(recipe), ()), default=None)
+        else:
+            target = str(recipe).lower().strip()
+            rid = min(self._by_name.get(target, ()), default=None)
+        if rid is None:
+            return False
+        self.version += 1
+        stored = self._recipes.pop(rid)
+        name = self._names.pop(rid)
+        _discard(self._by_object, id(stored), rid)
+        _discard(self._by_name, name, rid)
+        _discard(self._by_base, _base_key(stored), rid)
+        for gram in _name_ngrams(name):
+            _discard(self._by_ngram, gram, rid)
+        for ingredient in _ingredient_keys(stored):
+            _discard(self._by_ingredient, ingredient, rid)
+        return True
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the first recipe whose name matches exactly (case-insensitive), or None."""
+        rid = min(self._by_name.get(name.lower().strip(), ()), default=None)
+        return self._recipes[rid] if rid is not None else None
+
+    def search(self, name: str) -> List[Dict[str, Any]]:
+        """Indexed equivalent of ``search_cocktail``."""
+        query = name.lower().strip()
+        if not query:
+            return list(self._recipes.values())
+        if len(query) <= _NGRAM_SIZE:
+            return self._collect(self._by_ngram.get(query, ()))
+        grams = sorted((self._by_ngram.get(gram, set()) for gram in _query_ngrams(query)), key=len)
+        candidates = set(grams[0]).intersection(*grams[1:])
+        return self._collect(rid for rid in candidates if query in self._names[rid])
+
+    def by_base(self, base_spirit: str) -> List[Dict[str, Any]]:
+        """Indexed equivalent of ``filter_by_base``."""
+        return self._collect(self._by_base.get(base_spirit.lower().strip(), ()))
+
+    def with_ingredients(self, ingredient_names: Iterable[str]) -> List[Dict[str, Any]]:
+        """Return recipes that use any of the given ingredients (canonicalized)."""
+        matched: Set[int] = set()
+        for ingredient in ingredient_names:
+            matched.update(self._by_ingredient.get(canonical_name(ingredient), ()))
+        return self._collect(matched)
+
+    def ingredient_names(self) -> Set[str]:
+        """Return the canonical names of every ingredient used in the catalog."""
+        return set(self._by_ingredient)
+
+    def _collect(self, ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Return recipes for ids in insertion order."""
+        return [self._recipes[rid] for rid in sorted(ids)]
+
+
+def iter_recipes(filepath: str) -> Iterator[Dict[str, Any]]:
+    """Yield normalized recipes one at a time from a JSON array or JSON Lines file."""
+    path = Path(filepath)
+    with path.open("r", encoding="utf-8") as f:
+        head = f.read(_CHUNK_SIZE)
+        while head and not head.strip():
+            head = f.read(_CHUNK_SIZE)
+        if head.lstrip().startswith("["):
+            records = _iter_json_array(f, head)
+        else:
+            records = _iter_json_lines(f, head)
+        for recipe in records:
+            if not isinstance(recipe, dict):
+                raise ValueError("Recipe data must be a list of dicts.")
+            yield _normalize_recipe(recipe)
+
+
+def write_binary_catalog(recipes: Iterable[Dict[str, Any]], filepath: str) -> int:
+    """Write recipes to the memory-mappable binary catalog format; returns the recipe count."""
+    offsets = array("Q")
+    lengths = array("I")
+    starts = array("Q")
+    names = bytearray(b"\n")
+    bases: Dict[str, array] = {}
+    path = Path(filepath)
+    with path.open("wb") as f:
+        f.write(b"\0" * _BINARY_HEADER.size)
+        position = _BINARY_HEADER.size
+        for rid, recipe in enumerate(recipes):
+            record = json.dumps(_normalize_recipe(recipe), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            f.write(record)
+            offsets.append(position)
+            lengths.append(len(record))
+            position += len(record)
+            starts.append(len(names))
+            names += str(recipe.get("name", "")).lower().replace("\n", " ").encode("utf-8") + b"\n"
+            bases.setdefault(_base_key(recipe), array("I")).append(rid)
+        count = len(offsets)
+
+        index_offset = position
+        f.write(offsets.tobytes())
+        f.write(lengths.tobytes())
+        names_offset = index_offset + 12 * count
+        f.write(names)
+        starts_offset = names_offset + len(names)
+        f.write(starts.tobytes())
+        bases_offset = starts_offset + 8 * count
+
+        table: Dict[str, List[int]] = {}
+        postings = array("I")
+        for base, ids in bases.items():
+            table[base] = [len(postings), len(ids)]
+            postings.extend(ids)
+        table_bytes = json.dumps(table, ensure_ascii=False).encode("utf-8")
+        f.write(struct.pack("<I", len(table_bytes)))
+        f.write(table_bytes)
+        f.write(postings.tobytes())
+
+        f.seek(0)
+        f.write(
+            _BINARY_HEADER.pack(
+                _BINARY_MAGIC, _BINARY_VERSION, 0, count, index_offset, names_offset, starts_offset, bases_offset
+            )
+        )
+    return count
+
+
+class BinaryCatalog(IndexedCatalog):
+    """Read-only, memory-mapped view of a file written by ``write_binary_catalog``.
+
+    Name and base queries run against the mapped name blob and base postings, so
+    only matching recipes are decoded into dicts.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self._file = Path(filepath).open("rb")
+        if os.fstat(self._file.fileno()).st_size < _BINARY_HEADER.size:
+            # Also covers empty files, which cannot be mapped at all.
+            self._file.close()
+            raise ValueError("Not a binary recipe catalog.")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, index_offset, names_offset, starts_offset, bases_offset = (
+            _BINARY_HEADER.unpack_from(self._mm, 0)
+        )
+        if magic != _BINARY_MAGIC or version != _BINARY_VERSION:
+            self.close()
+            raise ValueError("Not a binary recipe catalog.")
+        view = memoryview(self._mm)
+        self._count = count
+        self._offsets = view[index_offset : index_offset + 8 * count].cast("Q")
+        self._lengths = view[index_offset + 8 * count : names_offset].cast("I")
+        self._names_range = (names_offset, starts_offset)
+        self._starts = view[starts_offset:bases_offset].cast("Q")
+        (table_size,) = struct.unpack_from("<I", self._mm, bases_offset)
+        table_start = bases_offset + 4
+        self._bases: Dict[str, List[int]] = json.loads(bytes(view[table_start : table_start + table_size]))
+        self._postings = view[table_start + table_size :].cast("I")
+        view.release()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("recipe index out of range")
+        offset = self._offsets[index]
+        return json.loads(self._mm[offset : offset + self._lengths[index]])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self[i] for i in range(self._count))
+
+    def __enter__(self) -> "BinaryCatalog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map and the underlying file."""
+        for name in ("_offsets", "_lengths", "_starts", "_postings"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def search(self, name: str) -> List[Dict[str, Any]]:
+        """Substring search over the mapped lowercased name blob."""
+        query = name.lower().strip()
+        if not query:
+            return list(self)
+        needle = query.encode("utf-8")
+        start, end = self._names_range
+        matches: List[Dict[str, Any]] = []
+        position = self._mm.find(needle, start, end)
+        while position != -1:
+            index = bisect_right(self._starts, position - start) - 1
+            matches.append(self[index])
+            if index + 1 >= self._count:
+                break
+            position = self._mm.find(needle, start + self._starts[index + 1], end)
+        return matches
+
+    def by_base(self, base_spirit: str) -> List[Dict[str, Any]]:
+        """Return recipes for a base spirit using the stored postings."""
+        entry = self._bases.get(base_spirit.lower().strip())
+        if entry is None:
+            return []
+        first, size = entry
+        return [self[index] for index in self._postings[first : first + size]]
+
+
+@instrument(scans="recipe_db", indexed=(IndexedCatalog,))
 def search_cocktail(recipe_db: Iterable[Dict[str, Any]], name: str) -> List[Dict[str, Any]]:
     """Find cocktails whose names contain the given query (case-insensitive)."""
+    if isinstance(recipe_db, IndexedCatalog):
+        return recipe_db.search(name)
     query = name.lower().strip()
     results: List[Dict[str, Any]] = []
     for recipe in recipe_db:
@@ -28,25 +329,21 @@ def search_cocktail(recipe_db: Iterable[Dict[str, Any]], name: str) -> List[Dict
     return results
 
 
+@instrument(scans="recipe_db", indexed=(IndexedCatalog,))
 def filter_by_base(recipe_db: Iterable[Dict[str, Any]], base_spirit: str) -> List[Dict[str, Any]]:
     """Filter cocktails by base spirit (case-insensitive exact match)."""
+    if isinstance(recipe_db, IndexedCatalog):
+        return recipe_db.by_base(base_spirit)
     target = base_spirit.lower().strip()
     return [recipe for recipe in recipe_db if str(recipe.get("base", "")).lower() == target]
 
 
 def display_recipe(cocktail_dict: Dict[str, Any]) -> None:
-    """Print a formatted recipe summary."""
-    name = cocktail_dict.get("name", "Unknown Cocktail")
-    ingredients = [_normalize_ingredient(item) for item in cocktail_dict.get("ingredients", [])]
-    steps = cocktail_dict.get("steps", [])
+    """Print a formatted recipe summary (see ``render.render_recipes`` for whole catalogs)."""
+    from .render import RecipeRenderer
 
-    print(f"Recipe: {name}")
-    print("Ingredients:")
-    for item in ingredients:
-        print(f"- {_format_ingredient(item)}")
-    print("Steps:")
-    for i, step in enumerate(steps, start=1):
-        print(f"{i}. {step}")
+    # One write per recipe instead of one print per line.
+    print(RecipeRenderer().recipe(cocktail_dict), end="")
 
 
 def _normalize_ingredient(ingredient: Any) -> Dict[str, Any]:
@@ -67,17 +364,99 @@ def _normalize_recipe(recipe: Dict[str, Any]) -> Dict[str, Any]:
     return normalized
 
 
-def _format_ingredient(ingredient: Dict[str, Any]) -> str:
-    """Render an ingredient dict into a human-friendly string."""
-    name = ingredient.get("name", "Unknown ingredient")
-    amount = ingredient.get("amount")
-    unit = ingredient.get("unit")
-    if amount is None:
-        return name
-    if isinstance(amount, (int, float)):
-        amount_str = f"{amount:.2f}".rstrip("0").rstrip(".")
-    else:
-        amount_str = str(amount)
-    if unit:
-        return f"{amount_str} {unit} {name}"
-    return f"{amount_str} {name}"
+def _iter_json_array(handle: IO[str], buffer: str) -> Iterator[Any]:
+    """Incrementally decode the items of a top-level JSON array."""
+    decoder = json.JSONDecoder()
+    pos = buffer.index("[") + 1
+    expect_comma = False
+    while True:
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer):
+                break
+            chunk = handle.read(_CHUNK_SIZE)
+            if not chunk:
+                raise ValueError("Unterminated recipe array.")
+            buffer, pos = buffer[pos:] + chunk, 0
+        char = buffer[pos]
+        if char == "]":
+            return
+        if expect_comma:
+            if char != ",":
+                raise ValueError("Malformed recipe array.")
+            pos += 1
+            expect_comma = False
+            continue
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                break
+            except json.JSONDecodeError as exc:
+                # Assume the item is cut off by the chunk boundary; read as much again
+                # (so retries stay linear) until it parses or exceeds the size cap.
+                pending = len(buffer) - pos
+                if pending > _MAX_RECORD_SIZE:
+                    raise ValueError("Malformed recipe array.") from exc
+                chunk = handle.read(max(_CHUNK_SIZE, pending))
+                if not chunk:
+                    raise
+                buffer, pos = buffer[pos:] + chunk, 0
+        yield item
+        pos = end
+        expect_comma = True
+        if pos > _CHUNK_SIZE:
+            buffer, pos = buffer[pos:], 0
+
+
+def _iter_json_lines(handle: IO[str], buffer: str) -> Iterator[Any]:
+    """Decode one JSON value per non-blank line.
+
+    A first line that is not a complete JSON value (e.g. the opening brace of a
+    pretty-printed object) means the file is neither an array nor JSON Lines.
+    """
+    lines = buffer.split("\n")
+    # The buffer may end mid-line, so finish its last piece from the file.
+    lines[-1] += handle.readline()
+    first = True
+    for line in itertools.chain(lines, handle):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as exc:
+            if first:
+                raise ValueError("Recipe data must be a list of dicts.") from exc
+            raise
+        first = False
+        yield value
+
+
+def _base_key(recipe: Dict[str, Any]) -> str:
+    """Return the lowercased base spirit used as the base index key."""
+    return str(recipe.get("base", "")).lower()
+
+
+def _ingredient_keys(recipe: Dict[str, Any]) -> Set[str]:
+    """Return the canonical ingredient names used by a recipe."""
+    return {canonical_name(_normalize_ingredient(item)["name"]) for item in recipe.get("ingredients", [])}
+
+
+def _name_ngrams(name: str) -> Set[str]:
+    """Return every substring of a name up to the n-gram size."""
+    return {name[i : i + n] for n in range(1, _NGRAM_SIZE + 1) for i in range(len(name) - n + 1)}
+
+
+def _query_ngrams(query: str) -> Set[str]:
+    """Return the full-size n-grams covering a query string."""
+    return {query[i : i + _NGRAM_SIZE] for i in range(len(query) - _NGRAM_SIZE + 1)}
+
+
+def _discard(index: Dict[Any, Set[int]], key: Any, rid: int) -> None:
+    """Drop a recipe id from an index bucket, removing empty buckets."""
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.discard(rid)
+    if not bucket:
+        del index[key]
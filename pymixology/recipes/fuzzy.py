@@ -0,0 +1,181 @@
+"""Typo-tolerant search over recipe and ingredient names."""
+
+from __future__ import annotations
+
+import heapq
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .catalog import _normalize_ingredient
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+RECIPE = "recipe"
+INGREDIENT = "ingredient"
+
+
+def normalize_text(text: str) -> str:
+    """Fold case and accents and collapse punctuation, e.g. "Piña-Colada" -> "pina colada"."""
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD.sub(" ", stripped.casefold()).strip()
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, or ``limit + 1`` once it must exceed ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous_row: Optional[List[int]] = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous_row, row = previous_row, row, [i] + [0] * len(b)
+        best = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before[j - 2] + 1)
+            row[j] = value
+            best = min(best, value)
+        if best > limit:
+            return limit + 1
+    return row[-1]
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    """Return every string reachable from ``word`` by up to ``distance`` deletions."""
+    results = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {item[:i] + item[i + 1 :] for item in frontier for i in range(len(item))}
+        results |= frontier
+    return results
+
+
+class FuzzyIndex:
+    """SymSpell-style deletion index over the words of recipe and ingredient names.
+
+    Every distinct word is stored once with all its deletions up to
+    ``max_distance``; a query word only has to look up its own deletions to find
+    candidate words, which are then verified with an edit distance. Names match
+    when every query word matches one of their words, and are ranked by the
+    total edit distance. Purely numeric words only match exactly.
+    """
+
+    def __init__(self, recipe_db: Iterable[Dict[str, Any]], max_distance: int = 2) -> None:
+        self.max_distance = max_distance
+        self._entries: List[Tuple[str, str, Any]] = []
+        self._entry_words: List[Tuple[int, ...]] = []
+        self._word_ids: Dict[str, int] = {}
+        self._words: List[str] = []
+        self._postings: List[List[int]] = []
+        self._deletes: Dict[str, List[int]] = {}
+        seen_ingredients: Set[str] = set()
+        for recipe in recipe_db:
+            self._add(str(recipe.get("name", "")), RECIPE, recipe)
+            for item in recipe.get("ingredients", []):
+                name = _normalize_ingredient(item)["name"]
+                key = normalize_text(name)
+                if key and key not in seen_ingredients:
+                    seen_ingredients.add(key)
+                    self._add(name, INGREDIENT, name)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, query: str, limit: int = 10, kind: Optional[str] = None) -> List[Tuple[str, str, int, Any]]:
+        """Return up to ``limit`` (name, kind, distance, payload) tuples, best first.
+
+        ``kind`` restricts results to ``"recipe"`` (payload is the recipe dict) or
+        ``"ingredient"`` (payload is the ingredient name). Results are ranked by
+        total edit distance, then by how few extra words the name has.
+        """
+        tokens = list(dict.fromkeys(normalize_text(query).split()))
+        if not tokens or limit <= 0:
+            return []
+        matches = []
+        for token in tokens:
+            similar = self._similar_words(token)
+            if not similar:
+                return []
+            matches.append(similar)
+        # Drive the scan from the token with the fewest candidate names; check the others per name.
+        matches.sort(key=lambda similar: sum(len(self._postings[word_id]) for word_id in similar))
+        driver, others = matches[0], matches[1:]
+        floor = sum(min(similar.values()) for similar in others)
+        best: List[Tuple[int, int, int]] = []  # max-heap via negated (total, extra words, entry id)
+        seen: Set[int] = set()
+        for word_id, distance in sorted(driver.items(), key=lambda pair: pair[1]):
+            if len(best) == limit and -best[0][0] < distance + floor:
+                break
+            for entry_id in self._postings[word_id]:
+                if entry_id in seen:
+                    continue
+                seen.add(entry_id)
+                if kind is not None and self._entries[entry_id][1] != kind:
+                    continue
+                total = distance
+                words = self._entry_words[entry_id]
+                for similar in others:
+                    closest = min((similar[w] for w in words if w in similar), default=None)
+                    if closest is None:
+                        break
+                    total += closest
+                else:
+                    key = (-total, -(len(words) - len(tokens)), -entry_id)
+                    if len(best) < limit:
+                        heapq.heappush(best, key)
+                    elif key > best[0]:
+                        heapq.heapreplace(best, key)
+                if len(best) == limit and -best[0][0] < distance + floor:
+                    break
+        ranked = sorted((-total, -extra, -entry_id) for total, extra, entry_id in best)
+        return [(*self._entries[entry_id][:2], total, self._entries[entry_id][2]) for total, _, entry_id in ranked]
+
+    def _add(self, name: str, kind: str, payload: Any) -> None:
+        """Index one name."""
+        entry_id = len(self._entries)
+        word_ids = []
+        for word in dict.fromkeys(normalize_text(name).split()):
+            word_id = self._word_ids.get(word)
+            if word_id is None:
+                word_id = len(self._words)
+                self._word_ids[word] = word_id
+                self._words.append(word)
+                self._postings.append([])
+                # Numbers (vintages, batch codes) only match exactly, which keeps the deletion table small.
+                if not word.isdigit():
+                    for deleted in _deletes(word, self.max_distance):
+                        self._deletes.setdefault(deleted, []).append(word_id)
+            self._postings[word_id].append(entry_id)
+            word_ids.append(word_id)
+        self._entries.append((name, kind, payload))
+        self._entry_words.append(tuple(word_ids))
+
+    def _similar_words(self, token: str) -> Dict[int, int]:
+        """Return indexed word ids within ``max_distance`` of ``token`` and their distances."""
+        exact = self._word_ids.get(token)
+        if token.isdigit() or self.max_distance == 0:
+            return {exact: 0} if exact is not None else {}
+        found: Dict[int, int] = {}
+        for deleted in _deletes(token, self.max_distance):
+            for word_id in self._deletes.get(deleted, ()):
+                if word_id in found:
+                    continue
+                distance = edit_distance(token, self._words[word_id], self.max_distance)
+                if distance <= self.max_distance:
+                    found[word_id] = distance
+        return found
+
+
+def fuzzy_search_cocktail(recipe_db: Any, name: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Typo-tolerant ``search_cocktail``: best-matching recipes for a possibly misspelled name."""
+    index = recipe_db if isinstance(recipe_db, FuzzyIndex) else FuzzyIndex(recipe_db)
+    return [payload for _, _, _, payload in index.search(name, limit=limit, kind=RECIPE)]
+
+
+def fuzzy_search_ingredient(recipe_db: Any, name: str, limit: int = 10) -> List[str]:
+    """Typo-tolerant lookup of ingredient names used in the catalog."""
+    index = recipe_db if isinstance(recipe_db, FuzzyIndex) else FuzzyIndex(recipe_db)
+    return [payload for _, _, _, payload in index.search(name, limit=limit, kind=INGREDIENT)]
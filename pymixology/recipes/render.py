@@ -0,0 +1,227 @@
+"""Bulk rendering of recipes to text, Markdown, CSV and HTML menus or prep sheets."""
+
+from __future__ import annotations
+
+import html
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple, Union
+
+from pymixology.instrumentation import instrument
+
+FORMATS = ("text", "markdown", "csv", "html")
+CSV_COLUMNS = ("recipe", "servings", "ingredient", "amount", "unit")
+
+# Recipes rendered between writes, and cached fragments kept before the caches are reset.
+_CHUNK = 512
+_CACHE_SIZE = 1 << 16
+
+_IngredientKey = Tuple[Any, Any, Any]
+_NEEDS_QUOTES = re.compile(r'[,"\r\n]')
+
+
+class RecipeRenderer:
+    """Streams recipes into one output format with buffered writes.
+
+    Each recipe becomes one string built from cached pieces: the formatted
+    ingredient line for every distinct (name, amount, unit) is computed once,
+    so a catalog reusing "1.5 oz Gin" formats it once; step lists are cached
+    the same way. With ``servings`` set,
+    amounts are scaled per recipe while rendering (as ``ScaledRecipe`` would)
+    without copying recipes. Output is written every ``chunk`` recipes and the
+    caches are reset when they grow past ``cache_size`` entries, so memory stays
+    bounded however many recipes are streamed.
+    """
+
+    def __init__(
+        self,
+        fmt: str = "text",
+        servings: Optional[int] = None,
+        title: str = "Menu",
+        chunk: int = _CHUNK,
+        cache_size: int = _CACHE_SIZE,
+    ) -> None:
+        if fmt not in FORMATS:
+            raise ValueError(f"fmt must be one of {FORMATS}.")
+        if servings is not None and servings <= 0:
+            raise ValueError("Servings must be positive.")
+        if chunk <= 0:
+            raise ValueError("chunk must be positive.")
+        self.fmt = fmt
+        self.servings = servings
+        self.title = title
+        self.chunk = chunk
+        self.cache_size = cache_size
+        self._cache: Dict[_IngredientKey, str] = {}
+        self._step_cache: Dict[Tuple[Any, ...], str] = {}
+        self._line: Callable[[str, Optional[str], Any], str] = getattr(self, f"_{fmt}_line")
+        self._steps: Callable[[Iterable[Any]], str] = getattr(self, f"_{fmt}_steps")
+        self._block: Callable[[Any, Any, List[str], str], str] = getattr(self, f"_{fmt}_block")
+
+    def header(self) -> str:
+        """Text written before the first recipe."""
+        if self.fmt == "csv":
+            return _csv_fields(CSV_COLUMNS) + "\n"
+        if self.fmt == "html":
+            title = html.escape(self.title)
+            return (
+                f'<!DOCTYPE html>\n<html>\n<head><meta charset="utf-8"><title>{title}</title></head>\n'
+                f"<body>\n<h1>{title}</h1>\n"
+            )
+        if self.fmt == "markdown":
+            return f"# {self.title}\n\n"
+        return ""
+
+    def footer(self) -> str:
+        """Text written after the last recipe."""
+        return "</body>\n</html>\n" if self.fmt == "html" else ""
+
+    def recipe(self, recipe: Dict[str, Any]) -> str:
+        """Render one recipe."""
+        factor = 1.0
+        servings = recipe.get("servings")
+        if self.servings is not None:
+            factor = self.servings / (servings or 1)
+            servings = self.servings
+        cache = self._cache
+        if len(cache) + len(self._step_cache) > self.cache_size:
+            cache.clear()
+            self._step_cache.clear()
+        lines = []
+        append = lines.append
+        lookup = cache.get
+        for item in recipe.get("ingredients", ()):
+            if isinstance(item, dict):
+                amount = item.get("amount")
+                if factor != 1.0 and isinstance(amount, (int, float)):
+                    amount *= factor
+                key: _IngredientKey = (item.get("name", ""), amount, item.get("unit"))
+            else:
+                key = (item, None, None)
+            try:
+                line = lookup(key)
+            except TypeError:
+                # Unhashable values (e.g. a list amount) are formatted without caching.
+                append(self._line(str(key[0]), _format_amount(key[1]), key[2]))
+                continue
+            if line is None:
+                line = cache[key] = self._line(str(key[0]), _format_amount(key[1]), key[2])
+            append(line)
+        steps = recipe.get("steps", ())
+        try:
+            steps_key = tuple(steps)
+            text = self._step_cache.get(steps_key)
+            if text is None:
+                text = self._step_cache[steps_key] = self._steps(steps)
+        except TypeError:
+            text = self._steps(steps)
+        return self._block(recipe.get("name", "Unknown Cocktail"), servings, lines, text)
+
+    def render(self, recipe_db: Iterable[Dict[str, Any]], output: Union[str, Path, TextIO]) -> int:
+        """Write every recipe to ``output`` (a path or text stream) and return how many were rendered."""
+        if isinstance(output, (str, Path)):
+            with open(output, "w", encoding="utf-8", newline="") as handle:
+                return self.render(recipe_db, handle)
+        output.write(self.header())
+        parts: List[str] = []
+        count = 0
+        separator = "\n" if self.fmt == "text" else ""
+        for recipe in recipe_db:
+            if count and separator:
+                parts.append(separator)
+            parts.append(self.recipe(recipe))
+            count += 1
+            if len(parts) >= self.chunk:
+                output.write("".join(parts))
+                parts.clear()
+        parts.append(self.footer())
+        output.write("".join(parts))
+        return count
+
+    def _text_line(self, name: str, amount: Optional[str], unit: Any) -> str:
+        return f"- {_ingredient_text(name, amount, unit)}\n"
+
+    def _text_steps(self, steps: Iterable[Any]) -> str:
+        return "".join(f"{i}. {step}\n" for i, step in enumerate(steps, start=1))
+
+    def _text_block(self, name: Any, servings: Any, lines: List[str], steps: str) -> str:
+        serves = f"Servings: {servings}\n" if self.servings is not None else ""
+        return f"Recipe: {name}\n{serves}Ingredients:\n{''.join(lines)}Steps:\n{steps}"
+
+    def _markdown_line(self, name: str, amount: Optional[str], unit: Any) -> str:
+        return f"- {_ingredient_text(name, amount, unit)}\n"
+
+    def _markdown_steps(self, steps: Iterable[Any]) -> str:
+        text = "".join(f"{i}. {step}\n" for i, step in enumerate(steps, start=1))
+        return text + "\n" if text else ""
+
+    def _markdown_block(self, name: Any, servings: Any, lines: List[str], steps: str) -> str:
+        serves = f"*Serves {servings}*\n\n" if servings is not None else ""
+        ingredients = "".join(lines) + "\n" if lines else ""
+        return f"## {name}\n\n{serves}{ingredients}{steps}"
+
+    def _html_line(self, name: str, amount: Optional[str], unit: Any) -> str:
+        return f"<li>{html.escape(_ingredient_text(name, amount, unit))}</li>\n"
+
+    def _html_steps(self, steps: Iterable[Any]) -> str:
+        text = "".join(f"<li>{html.escape(str(step))}</li>\n" for step in steps)
+        return f"<ol>\n{text}</ol>\n" if text else ""
+
+    def _html_block(self, name: Any, servings: Any, lines: List[str], steps: str) -> str:
+        serves = f'<p class="servings">Serves {html.escape(str(servings))}</p>\n' if servings is not None else ""
+        return (
+            f'<section class="recipe">\n<h2>{html.escape(str(name))}</h2>\n{serves}'
+            f"<ul>\n{''.join(lines)}</ul>\n{steps}</section>\n"
+        )
+
+    def _csv_line(self, name: str, amount: Optional[str], unit: Any) -> str:
+        return _csv_fields((name, amount or "", unit or ""))
+
+    def _csv_steps(self, steps: Iterable[Any]) -> str:
+        # Prep-sheet CSV lists ingredients only.
+        return ""
+
+    def _csv_block(self, name: Any, servings: Any, lines: List[str], steps: str) -> str:
+        prefix = _csv_fields((name, servings)) + ","
+        if not lines:
+            return prefix + ",,\n"
+        return "".join([prefix + line + "\n" for line in lines])
+
+
+def _format_amount(amount: Any) -> Optional[str]:
+    """Format an amount with at most two decimals and no trailing zeros (None stays None)."""
+    if amount is None:
+        return None
+    if isinstance(amount, (int, float)):
+        return f"{amount:.2f}".rstrip("0").rstrip(".")
+    return str(amount)
+
+
+def _ingredient_text(name: str, amount: Optional[str], unit: Any) -> str:
+    """One ingredient as "<amount> <unit> <name>"; shared by every format and ``display_recipe``."""
+    if amount is None:
+        return name
+    return f"{amount} {unit} {name}" if unit else f"{amount} {name}"
+
+
+def _csv_fields(values: Iterable[Any]) -> str:
+    """Encode one CSV row without its line terminator (quoting like ``csv.writer``)."""
+    fields = []
+    for value in values:
+        text = "" if value is None else str(value)
+        if _NEEDS_QUOTES.search(text):
+            text = '"' + text.replace('"', '""') + '"'
+        fields.append(text)
+    return ",".join(fields)
+
+
+@instrument(scans="recipe_db")
+def render_recipes(
+    recipe_db: Iterable[Dict[str, Any]],
+    output: Union[str, Path, TextIO],
+    fmt: str = "text",
+    servings: Optional[int] = None,
+    title: str = "Menu",
+) -> int:
+    """Stream recipes to ``output`` as a text, Markdown, CSV or HTML menu; returns the recipe count."""
+    return RecipeRenderer(fmt, servings=servings, title=title).render(recipe_db, output)
@@ -0,0 +1,293 @@
+"""Sharded recipe catalogs loaded and queried by a pool of worker processes."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import multiprocessing
+import time
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .catalog import IndexedCatalog, RecipeCatalog, _normalize_recipe, iter_recipes
+
+# Bytes of records a candidate array boundary must parse through before it is trusted.
+_SYNC_WINDOW = 1 << 16
+_WHITESPACE = b" \t\r\n"
+
+ShardSpec = Union[str, Tuple[str, int, int]]
+
+
+def split_catalog(filepath: str, output_dir: str, shard_size: int) -> List[Path]:
+    """Stream a catalog into contiguous JSON Lines shards of ``shard_size`` recipes."""
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive.")
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: List[Path] = []
+    handle = None
+    try:
+        for position, recipe in enumerate(iter_recipes(filepath)):
+            if position % shard_size == 0:
+                if handle is not None:
+                    handle.close()
+                paths.append(directory / f"shard-{len(paths):05d}.jsonl")
+                handle = paths[-1].open("w", encoding="utf-8")
+            handle.write(json.dumps(recipe, ensure_ascii=False) + "\n")
+    finally:
+        if handle is not None:
+            handle.close()
+    return paths
+
+
+def shard_ranges(filepath: str, shards: int) -> List[Tuple[int, int]]:
+    """Split a catalog file into at most ``shards`` byte ranges that each start on a record.
+
+    Nothing is parsed up front: each cut seeks to an even offset and moves to
+    the next line (JSON Lines) or the next top-level array item (JSON array).
+    An array cut is accepted only where records parse cleanly from it for
+    ``_SYNC_WINDOW`` bytes or to the closing bracket, which rules out objects
+    nested inside a recipe and braces inside strings. Small files give fewer ranges.
+    """
+    if shards <= 0:
+        raise ValueError("shards must be positive.")
+    size = Path(filepath).stat().st_size
+    if size == 0:
+        return []
+    with open(filepath, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        first = 0
+        while first < size and data[first] in _WHITESPACE:
+            first += 1
+        is_array = data[first : first + 1] == b"["
+        bounds = [first + 1 if is_array else first]
+        for shard in range(1, shards):
+            guess = max(bounds[0] + (size - bounds[0]) * shard // shards, bounds[-1] + 1)
+            cut = _next_item(data, guess, size) if is_array else _next_line(data, guess)
+            if cut is None:
+                break
+            bounds.append(cut)
+    return list(zip(bounds, bounds[1:] + [size]))
+
+
+def _next_line(data: mmap.mmap, guess: int) -> Optional[int]:
+    """Offset of the first line starting at or after ``guess``."""
+    newline = data.find(b"\n", guess - 1)
+    return newline + 1 if 0 <= newline < len(data) - 1 else None
+
+
+def _next_item(data: mmap.mmap, guess: int, size: int) -> Optional[int]:
+    """Offset of the first top-level array item starting at or after ``guess``."""
+    decoder = json.JSONDecoder()
+    position = guess
+    while True:
+        candidate = data.find(b"{", position)
+        if candidate < 0:
+            return None
+        before = candidate - 1
+        while before > 0 and data[before] in _WHITESPACE:
+            before -= 1
+        if data[before : before + 1] in (b",", b"[") and _parses_as_items(data, candidate, size, decoder):
+            return candidate
+        position = candidate + 1
+
+
+def _parses_as_items(data: mmap.mmap, start: int, size: int, decoder: json.JSONDecoder) -> bool:
+    """Whether comma-separated objects parse from ``start`` for ``_SYNC_WINDOW`` bytes or to the array end."""
+    window = data[start : start + 2 * _SYNC_WINDOW]
+    reaches_end = start + len(window) >= size
+    text = window.decode("utf-8", errors="ignore")
+    position = 0
+    while True:
+        try:
+            value, position = decoder.raw_decode(text, position)
+        except ValueError:
+            return False
+        if not isinstance(value, dict):
+            return False
+        while position < len(text) and text[position].isspace():
+            position += 1
+        if position >= _SYNC_WINDOW:
+            return True
+        if text[position : position + 1] == "]":
+            # Only the closing bracket of the whole file may end the run.
+            return reaches_end and not text[position + 1 :].strip()
+        if text[position : position + 1] != ",":
+            return False
+        position += 1
+        while position < len(text) and text[position].isspace():
+            position += 1
+
+
+def _iter_range(filepath: str, start: int, end: int) -> Iterator[Dict[str, Any]]:
+    """Yield normalized recipes from one byte range produced by ``shard_ranges``."""
+    with open(filepath, "rb") as handle:
+        head = handle.read(64).lstrip(_WHITESPACE)
+        handle.seek(start)
+        text = handle.read(end - start).decode("utf-8")
+    if head.startswith(b"["):
+        records = _iter_array_items(text)
+    else:
+        records = (json.loads(line) for line in text.split("\n") if line.strip())
+    for recipe in records:
+        if not isinstance(recipe, dict):
+            raise ValueError("Recipe data must be a list of dicts.")
+        yield _normalize_recipe(recipe)
+
+
+def _iter_array_items(text: str) -> Iterator[Any]:
+    """Decode the comma-separated items of a slice of a JSON array, stopping at its closing bracket."""
+    decoder = json.JSONDecoder()
+    position = 0
+    expect_value = True
+    while True:
+        while position < len(text) and text[position].isspace():
+            position += 1
+        if position >= len(text) or text[position] == "]":
+            return
+        if not expect_value:
+            if text[position] != ",":
+                raise ValueError("Malformed recipe array.")
+            position += 1
+            expect_value = True
+            continue
+        value, position = decoder.raw_decode(text, position)
+        expect_value = False
+        yield value
+
+
+class ShardedCatalog(IndexedCatalog):
+    """Catalog split across worker processes, one shard per worker.
+
+    A shard is a file path or a (path, start, end) byte range of one catalog
+    file. Each worker parses, normalizes and indexes its own shard in parallel,
+    then answers queries against it. Queries are sent to every worker before
+    any reply is read, so shards are searched concurrently; replies are merged
+    in shard order, which matches catalog order for ``shard_ranges`` and
+    ``split_catalog`` shards.
+    """
+
+    def __init__(self, shard_paths: Sequence[ShardSpec], context: Optional[str] = None) -> None:
+        ctx = multiprocessing.get_context(context)
+        self._connections: List[Connection] = []
+        self._workers = []
+        for shard in shard_paths:
+            spec = shard if isinstance(shard, tuple) else str(shard)
+            parent, child = ctx.Pipe()
+            worker = ctx.Process(target=_serve_shard, args=(child, spec), daemon=True)
+            worker.start()
+            child.close()
+            self._connections.append(parent)
+            self._workers.append(worker)
+        ready = self._gather(None)
+        self._sizes = [size for size, _ in ready]
+        # CPU seconds each worker spent loading; the largest bounds load time on dedicated cores.
+        self.load_cpu_seconds = [seconds for _, seconds in ready]
+
+    @classmethod
+    def from_file(cls, filepath: str, shards: int, context: Optional[str] = None) -> "ShardedCatalog":
+        """Start up to ``shards`` workers that each parse one byte range of a catalog file in place."""
+        return cls([(str(filepath), start, end) for start, end in shard_ranges(filepath, shards)], context=context)
+
+    def __len__(self) -> int:
+        return sum(self._sizes)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for connection in self._connections:
+            connection.send(("all", None))
+            yield from connection.recv()
+
+    def __enter__(self) -> "ShardedCatalog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._connections)
+
+    def search(self, name: str) -> List[Dict[str, Any]]:
+        """Fan ``search_cocktail`` out to every shard and merge the results."""
+        return self._merge(self._gather(("search", name)))
+
+    def by_base(self, base_spirit: str) -> List[Dict[str, Any]]:
+        """Fan ``filter_by_base`` out to every shard and merge the results."""
+        return self._merge(self._gather(("by_base", base_spirit)))
+
+    def makeable(self, inventory_list: Iterable[Any]) -> List[str]:
+        """Fan ``get_makeable_cocktails`` out to every shard for one inventory snapshot."""
+        stock = {}
+        for item in inventory_list:
+            stock[item.key] = item.quantity
+        return self._merge(self._gather(("makeable", stock)))
+
+    def close(self) -> None:
+        """Stop the workers."""
+        for connection in self._connections:
+            try:
+                connection.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for worker in self._workers:
+            worker.join(timeout=5)
+        self._connections = []
+        self._workers = []
+
+    def _gather(self, command: Optional[tuple]) -> List[Any]:
+        """Send a command to every worker, then collect the replies in shard order."""
+        if command is not None:
+            for connection in self._connections:
+                connection.send(command)
+        replies = [connection.recv() for connection in self._connections]
+        for reply in replies:
+            if isinstance(reply, BaseException):
+                raise reply
+        return replies
+
+    @staticmethod
+    def _merge(parts: List[List[Any]]) -> List[Any]:
+        merged: List[Any] = []
+        for part in parts:
+            merged.extend(part)
+        return merged
+
+
+def _serve_shard(connection: Connection, shard: ShardSpec) -> None:
+    """Worker loop: load one shard, then answer queries until told to close."""
+    # Imported here because the suggester module imports this one.
+    from pymixology.inventory.items import Ingredient
+    from pymixology.recommendation.suggester import MakeableIndex
+
+    start = time.process_time()
+    try:
+        recipes = list(_iter_range(*shard) if isinstance(shard, tuple) else iter_recipes(shard))
+        catalog = RecipeCatalog(recipes)
+        makeable = MakeableIndex(recipes)
+    except Exception as exc:  # reported to the parent instead of dying silently
+        connection.send(exc)
+        return
+    connection.send((len(catalog), time.process_time() - start))
+    while True:
+        try:
+            command, argument = connection.recv()
+        except EOFError:
+            return
+        if command == "close":
+            return
+        try:
+            if command == "search":
+                reply: Any = catalog.search(argument)
+            elif command == "by_base":
+                reply = catalog.by_base(argument)
+            elif command == "makeable":
+                makeable.sync(Ingredient(name, quantity, "") for name, quantity in argument.items())
+                reply = makeable.makeable()
+            elif command == "all":
+                reply = recipes
+            else:
+                reply = ValueError(f"Unknown shard command: {command}")
+        except Exception as exc:
+            reply = exc
+        connection.send(reply)
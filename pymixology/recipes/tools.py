@@ -3,10 +3,59 @@
 from __future__ import annotations
 
 import copy
-from typing import Dict, List, Any
+import operator
+from array import array
+from collections.abc import Mapping
+from collections.abc import Sequence as SequenceABC
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Any, Sequence, Union
 
 _OZ_TO_ML = 29.5735
 
+# Millilitres per unit; unit_converter and convert_units share this table.
+UNIT_TABLE: Dict[str, float] = {
+    "ml": 1.0,
+    "cl": 10.0,
+    "l": 1000.0,
+    "oz": _OZ_TO_ML,
+    "tsp": _OZ_TO_ML / 6,
+    "tbsp": _OZ_TO_ML / 2,
+    "barspoon": 5.0,
+    "dash": _OZ_TO_ML / 32,
+}
+
+
+class IngredientColumns:
+    """Columnar layout of many ingredient lists for the batch helpers.
+
+    Each requested field becomes one flat ``array('d')`` (missing keys read as
+    0, like ``dict.get(key, 0)``) and ``offsets[i]:offsets[i + 1]`` is the slice
+    belonging to the i-th ingredient list.
+    """
+
+    def __init__(self, columns: Dict[str, array], offsets: array) -> None:
+        self.columns = columns
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @classmethod
+    def from_lists(cls, batches: Iterable[List[Dict[str, float]]], fields: Sequence[str]) -> "IngredientColumns":
+        """Build columns for ``fields`` from a list of ingredient lists."""
+        columns = {field: array("d") for field in fields}
+        offsets = array("q", [0])
+        for ingredients in batches:
+            for field, column in columns.items():
+                column.extend(item.get(field, 0) for item in ingredients)
+            offsets.append(offsets[-1] + len(ingredients))
+        return cls(columns, offsets)
+
+    def segments(self) -> Iterable[slice]:
+        """Yield the slice of each ingredient list."""
+        offsets = self.offsets
+        return (slice(offsets[i], offsets[i + 1]) for i in range(len(offsets) - 1))
+
 
 def calculate_abv(ingredients: List[Dict[str, float]]) -> float:
     """Estimate final ABV using a volume-weighted average."""
@@ -31,16 +80,58 @@ def estimate_cost(ingredients: List[Dict[str, float]]) -> float:
 
 
 def unit_converter(amount: float, from_unit: str, to_unit: str) -> float:
-    """Convert volumes between ml and oz."""
+    """Convert volumes between any two units in ``UNIT_TABLE`` (ml, oz, cl, dash, ...)."""
     f_unit = from_unit.lower()
     t_unit = to_unit.lower()
     if f_unit == t_unit:
         return amount
-    if f_unit == "oz" and t_unit == "ml":
-        return amount * _OZ_TO_ML
-    if f_unit == "ml" and t_unit == "oz":
-        return amount / _OZ_TO_ML
-    raise ValueError("Unsupported unit conversion.")
+    if f_unit not in UNIT_TABLE or t_unit not in UNIT_TABLE:
+        raise ValueError("Unsupported unit conversion.")
+    return amount * UNIT_TABLE[f_unit] / UNIT_TABLE[t_unit]
+
+
+def calculate_abv_batch(batch: Union[IngredientColumns, Iterable[List[Dict[str, float]]]]) -> List[float]:
+    """Batch ``calculate_abv`` over many ingredient lists (or prebuilt columns)."""
+    if not isinstance(batch, IngredientColumns):
+        batch = IngredientColumns.from_lists(batch, ("vol", "abv"))
+    vol = batch.columns["vol"]
+    weighted = array("d", map(operator.mul, vol, batch.columns["abv"]))
+    results = []
+    for part in batch.segments():
+        total_volume = sum(vol[part])
+        results.append(sum(weighted[part]) / total_volume if total_volume > 0 else 0.0)
+    return results
+
+
+def estimate_cost_batch(batch: Union[IngredientColumns, Iterable[List[Dict[str, float]]]]) -> List[float]:
+    """Batch ``estimate_cost`` over many ingredient lists (or prebuilt columns)."""
+    if not isinstance(batch, IngredientColumns):
+        batch = IngredientColumns.from_lists(batch, ("price_per_bottle", "bottle_vol", "used_vol"))
+    bottle_vol = batch.columns["bottle_vol"]
+    if bottle_vol and min(bottle_vol) <= 0:
+        raise ValueError("Bottle volume must be greater than zero.")
+    unit_price = map(operator.truediv, batch.columns["price_per_bottle"], bottle_vol)
+    costs = array("d", map(operator.mul, unit_price, batch.columns["used_vol"]))
+    return [sum(costs[part], 0.0) for part in batch.segments()]
+
+
+def convert_units(amounts: Sequence[float], from_units: Union[str, Sequence[str]], to_unit: str) -> List[float]:
+    """Batch ``unit_converter``: convert many amounts (with one or per-amount source units)."""
+    t_unit = to_unit.lower()
+    if t_unit not in UNIT_TABLE:
+        raise ValueError("Unsupported unit conversion.")
+    if isinstance(from_units, str):
+        from_units = repeat(from_units, len(amounts))
+    factors = []
+    for unit in from_units:
+        f_unit = unit.lower()
+        if f_unit not in UNIT_TABLE:
+            raise ValueError("Unsupported unit conversion.")
+        factors.append(UNIT_TABLE[f_unit])
+    if len(factors) != len(amounts):
+        raise ValueError("amounts and from_units must have the same length.")
+    target = UNIT_TABLE[t_unit]
+    return list(map(operator.truediv, map(operator.mul, amounts, factors), repeat(target)))
 
 
 def scale_recipe(cocktail_dict: Dict[str, Any], servings: int) -> Dict[str, Any]:
@@ -63,3 +154,89 @@ def scale_recipe(cocktail_dict: Dict[str, Any], servings: int) -> Dict[str, Any]
     new_recipe["ingredients"] = scaled_ingredients
     new_recipe["servings"] = servings
     return new_recipe
+
+
+class ScaledRecipe(Mapping):
+    """Read-only view of a recipe scaled to a number of servings.
+
+    Shares the original recipe's data; ingredient amounts are multiplied by the
+    scale factor only when read. Like ``scale_recipe`` it always has
+    ``ingredients`` (empty if the recipe has none) and ``servings`` keys, and
+    ``to_dict()`` gives the same result as ``scale_recipe``.
+    """
+
+    __slots__ = ("recipe", "servings", "factor")
+
+    def __init__(self, recipe: Dict[str, Any], servings: int) -> None:
+        if servings <= 0:
+            raise ValueError("Servings must be positive.")
+        self.recipe = recipe
+        self.servings = servings
+        self.factor = servings / (recipe.get("servings", 1) or 1)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "servings":
+            return self.servings
+        if key == "ingredients":
+            return _ScaledIngredients(self.recipe.get("ingredients", []), self.factor)
+        return self.recipe[key]
+
+    def __iter__(self) -> Iterator[str]:
+        # Same key order as ``scale_recipe``: original keys, then any added ones.
+        yield from self.recipe
+        if "ingredients" not in self.recipe:
+            yield "ingredients"
+        if "servings" not in self.recipe:
+            yield "servings"
+
+    def __len__(self) -> int:
+        return len(self.recipe) + ("ingredients" not in self.recipe) + ("servings" not in self.recipe)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize an independent dict, equal to ``scale_recipe(recipe, servings)``."""
+        new_recipe = copy.deepcopy(self.recipe)
+        new_recipe["ingredients"] = list(_ScaledIngredients(new_recipe.get("ingredients", []), self.factor))
+        new_recipe["servings"] = self.servings
+        return new_recipe
+
+
+class _ScaledIngredients(SequenceABC):
+    """Sequence view that scales ingredient amounts on access."""
+
+    __slots__ = ("_items", "_factor")
+
+    def __init__(self, items: List[Any], factor: float) -> None:
+        self._items = items
+        self._factor = factor
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._scale(item) for item in self._items[index]]
+        return self._scale(self._items[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, SequenceABC)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def _scale(self, ingredient: Any) -> Any:
+        if isinstance(ingredient, dict) and "amount" in ingredient:
+            scaled_item = ingredient.copy()
+            amount = scaled_item.get("amount")
+            if isinstance(amount, (int, float)):
+                scaled_item["amount"] = amount * self._factor
+            return scaled_item
+        return ingredient
+
+
+def scale_catalog(recipe_db: Iterable[Dict[str, Any]], servings: int) -> List[ScaledRecipe]:
+    """Scale every recipe to ``servings`` as lazy views, without copying recipes."""
+    if servings <= 0:
+        raise ValueError("Servings must be positive.")
+    return [ScaledRecipe(recipe, servings) for recipe in recipe_db]
@@ -0,0 +1,134 @@
+"""Memoized recommendation queries with inventory-aware invalidation."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Union
+
+from pymixology.inventory.items import Ingredient
+from pymixology.inventory.manager import Inventory
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import RecipeCatalog
+
+from . import suggester
+from .preference import ProfileRegistry, resolve_profile
+
+
+class _Entry:
+    """One cached result and the state it was computed against."""
+
+    __slots__ = ("result", "catalog", "inventory", "inventory_version", "depends_on")
+
+    def __init__(
+        self,
+        result: List[str],
+        catalog: RecipeCatalog,
+        inventory: Optional[Inventory],
+        depends_on: FrozenSet[str],
+    ) -> None:
+        self.result = result
+        self.catalog = catalog
+        self.inventory = inventory
+        self.inventory_version = inventory.version if inventory is not None else 0
+        self.depends_on = depends_on
+
+
+class RecommendationCache:
+    """Bounded LRU cache for ``suggester`` queries over a ``RecipeCatalog``.
+
+    Entries are keyed on the catalog's ``version`` (so catalog edits miss) and,
+    for inventory-dependent queries, validated against ``Inventory.version``.
+    When the inventory has moved on, an entry is dropped only if one of the
+    ingredients it depends on changed since it was computed. Plain lists carry
+    no version, so queries on them are computed without caching.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and eviction counters plus the current size."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        """Drop every cached result (counters are kept)."""
+        self._entries.clear()
+
+    def get_makeable_cocktails(
+        self, inventory_list: Union[Inventory, List[Ingredient]], recipe_db: Iterable[Dict[str, Any]]
+    ) -> List[str]:
+        """Cached ``suggester.get_makeable_cocktails``."""
+        compute = lambda: suggester.get_makeable_cocktails(inventory_list, recipe_db)  # noqa: E731
+        if not isinstance(inventory_list, Inventory) or not isinstance(recipe_db, RecipeCatalog):
+            return compute()
+        key = ("makeable", id(recipe_db), recipe_db.version, id(inventory_list))
+        return self._lookup(key, recipe_db, inventory_list, lambda: frozenset(recipe_db.ingredient_names()), compute)
+
+    def find_cocktails_with_ingredients(
+        self, target_ingredients: List[str], recipe_db: Iterable[Dict[str, Any]]
+    ) -> List[str]:
+        """Cached ``suggester.find_cocktails_with_ingredients`` (catalog-only, never stock-invalidated)."""
+        compute = lambda: suggester.find_cocktails_with_ingredients(target_ingredients, recipe_db)  # noqa: E731
+        if not isinstance(recipe_db, RecipeCatalog):
+            return compute()
+        targets = tuple(sorted({canonical_name(name) for name in target_ingredients}))
+        key = ("with_ingredients", id(recipe_db), recipe_db.version, targets)
+        return self._lookup(key, recipe_db, None, frozenset, compute)
+
+    def recommend_by_flavor(
+        self,
+        user_profile: Union[str, Dict[str, int]],
+        recipe_db: Iterable[Dict[str, Any]],
+        registry: Optional[ProfileRegistry] = None,
+    ) -> List[str]:
+        """Cached ``suggester.recommend_by_flavor`` (catalog-only, never stock-invalidated)."""
+        profile = resolve_profile(user_profile, registry)
+        compute = lambda: suggester.recommend_by_flavor(profile, recipe_db)  # noqa: E731
+        if not isinstance(recipe_db, RecipeCatalog):
+            return compute()
+        key = ("flavor", id(recipe_db), recipe_db.version, tuple(sorted(profile.items())))
+        return self._lookup(key, recipe_db, None, frozenset, compute)
+
+    def _lookup(
+        self,
+        key: Hashable,
+        catalog: RecipeCatalog,
+        inventory: Optional[Inventory],
+        depends_on: Callable[[], FrozenSet[str]],
+        compute: Callable[[], List[str]],
+    ) -> List[str]:
+        """Return a valid cached result or compute, store and return a fresh one."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.catalog is catalog and entry.inventory is inventory and self._still_valid(entry):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry.result)
+        self.misses += 1
+        entry = _Entry(compute(), catalog, inventory, depends_on())
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return list(entry.result)
+
+    @staticmethod
+    def _still_valid(entry: _Entry) -> bool:
+        """Check that no ingredient the entry depends on changed since it was computed."""
+        inventory = entry.inventory
+        if inventory is None or inventory.version == entry.inventory_version:
+            return True
+        since = entry.inventory_version
+        if any(inventory.last_changed(name) > since for name in entry.depends_on):
+            return False
+        entry.inventory_version = inventory.version
+        return True
@@ -0,0 +1,208 @@
+"""Flavor-vector embeddings of recipes and top-k profile matching."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import _normalize_ingredient
+from pymixology.recipes.tools import UNIT_TABLE, calculate_abv
+
+from .preference import ProfileRegistry, resolve_profile
+
+FLAVOR_DIMENSIONS = ("sweet", "sour", "bitter", "strong")
+
+_KEYWORDS = {
+    "sweet": ("syrup", "sugar", "liqueur", "grenadine", "orgeat", "honey", "cream", "cola", "puree", "creme", "curacao",
+              "triple sec", "pineapple", "orange juice", "cranberry", "drambuie", "benedictine"),
+    "sour": ("lime", "lemon", "grapefruit", "passion fruit", "tomato"),
+    "bitter": ("bitters", "campari", "aperol", "amaro", "chartreuse", "absinthe", "espresso", "coffee", "vermouth"),
+}
+_ABV_KEYWORDS = (
+    (("gin", "rum", "vodka", "tequila", "whiskey", "whisky", "bourbon", "rye", "scotch", "cognac", "brandy", "cachaca",
+      "mezcal", "absinthe"), 0.40),
+    (("chartreuse", "liqueur", "curacao", "triple sec", "drambuie", "benedictine", "amaro", "campari"), 0.25),
+    (("vermouth", "aperol", "lillet"), 0.15),
+    (("champagne", "prosecco", "wine"), 0.12),
+)
+# Keywords match whole words of the canonical name, so "gin" does not match "ginger beer".
+_KEYWORD_PATTERNS = {
+    dimension: re.compile(r"\b(?:%s)\b" % "|".join(map(re.escape, words))) for dimension, words in _KEYWORDS.items()
+}
+_ABV_PATTERNS = tuple(
+    (re.compile(r"\b(?:%s)\b" % "|".join(map(re.escape, words))), abv) for words, abv in _ABV_KEYWORDS
+)
+# Volume assumed for ingredients without a convertible amount (garnish, rinse, pinch...).
+_TRACE_VOLUME = 1.0
+# ABV treated as fully "strong".
+_STRONG_ABV = 0.30
+# Weight added to the dimension named by a recipe's ``flavor`` tag.
+_TAG_BOOST = 0.5
+# Cells per dimension at each level of the FlavorIndex tree, and the node size worth splitting.
+_GRID_LEVELS = (2, 4, 8, 16, 32, 64, 128, 256)
+_LEAF_SIZE = 16
+
+# (per-dimension maxima, child nodes or None, member recipe ids or None)
+_Node = Tuple[Tuple[float, ...], Optional[List[Any]], Optional[array]]
+
+
+def flavor_vector(recipe: Dict[str, Any]) -> Tuple[float, float, float, float]:
+    """Embed a recipe as a unit-length (sweet, sour, bitter, strong) vector."""
+    volumes = []
+    shares = dict.fromkeys(FLAVOR_DIMENSIONS, 0.0)
+    for item in recipe.get("ingredients", []):
+        ingredient = _normalize_ingredient(item)
+        name = canonical_name(ingredient["name"])
+        volume = _volume_ml(ingredient)
+        volumes.append({"vol": volume, "abv": _estimate_abv(name)})
+        for dimension, pattern in _KEYWORD_PATTERNS.items():
+            if pattern.search(name):
+                shares[dimension] += volume
+    total = sum(item["vol"] for item in volumes)
+    if total > 0:
+        for dimension in _KEYWORDS:
+            shares[dimension] /= total
+    shares["strong"] = min(calculate_abv(volumes) / _STRONG_ABV, 1.0)
+    tag = str(recipe.get("flavor", "")).lower()
+    if tag in shares:
+        shares[tag] += _TAG_BOOST
+    vector = [shares[dimension] for dimension in FLAVOR_DIMENSIONS]
+    norm = math.sqrt(sum(value * value for value in vector))
+    return tuple(value / norm for value in vector) if norm else (0.0, 0.0, 0.0, 0.0)
+
+
+class FlavorIndex:
+    """Recipes embedded as flavor vectors for top-k profile retrieval.
+
+    Vectors live in one flat row-major ``array('d')`` (n x 4). Because vectors
+    are unit length, ranking by dot product equals ranking by cosine similarity.
+    Recipes are also grouped into a tree of ever finer grid cells over the
+    vector space, each node storing the per-dimension maximum of its members.
+    For non-negative profile weights that maximum bounds every member's score,
+    so ``top_k`` expands the most promising nodes first and stops once no
+    remaining node can beat the current k-th score.
+    """
+
+    def __init__(self, recipe_db: Iterable[Dict[str, Any]]) -> None:
+        self._names: List[str] = []
+        self._vectors = array("d")
+        for recipe in recipe_db:
+            self._names.append(recipe.get("name", ""))
+            self._vectors.extend(flavor_vector(recipe))
+        self._root = self._build(range(len(self._names)), 0)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def vector(self, index: int) -> Tuple[float, ...]:
+        """Return the flavor vector of the recipe at ``index``."""
+        width = len(FLAVOR_DIMENSIONS)
+        return tuple(self._vectors[index * width : (index + 1) * width])
+
+    def top_k(self, user_profile: Dict[str, int], k: int = 10) -> List[Tuple[str, float]]:
+        """Return up to k (name, score) pairs with a positive match, best first."""
+        weights = [float(user_profile.get(dimension, 0)) for dimension in FLAVOR_DIMENSIONS]
+        if k <= 0 or not any(weights) or not self._names:
+            return []
+        if min(weights) < 0:
+            return self._scan(weights, k)
+        w0, w1, w2, w3 = weights
+        vectors = self._vectors
+        best: List[Tuple[float, int]] = []
+        frontier: List[Tuple[float, int, _Node]] = [(0.0, 0, self._root)]
+        pushed = 0
+        while frontier:
+            negative_bound, _, (_, children, members) = heapq.heappop(frontier)
+            if len(best) == k and best[0][0] >= -negative_bound:
+                break
+            if children is not None:
+                for child in children:
+                    m = child[0]
+                    bound = w0 * m[0] + w1 * m[1] + w2 * m[2] + w3 * m[3]
+                    if bound <= 0 or (len(best) == k and bound <= best[0][0]):
+                        continue
+                    pushed += 1
+                    heapq.heappush(frontier, (-bound, pushed, child))
+                continue
+            for rid in members:
+                base = rid * 4
+                score = w0 * vectors[base] + w1 * vectors[base + 1] + w2 * vectors[base + 2] + w3 * vectors[base + 3]
+                if score <= 0:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (score, -rid))
+                elif (score, -rid) > best[0]:
+                    heapq.heapreplace(best, (score, -rid))
+        return [(self._names[-neg_rid], score) for score, neg_rid in sorted(best, reverse=True)]
+
+    def top_k_batch(
+        self,
+        user_profiles: Sequence[Union[str, Dict[str, int]]],
+        k: int = 10,
+        registry: Optional[ProfileRegistry] = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """Run ``top_k`` for many users (profile dicts or user IDs in ``registry``)."""
+        if registry is not None:
+            registry.load_many([user for user in user_profiles if isinstance(user, str)])
+        return [self.top_k(resolve_profile(user, registry), k) for user in user_profiles]
+
+    def _build(self, ids: Iterable[int], level: int) -> "_Node":
+        """Build the cell tree node covering ``ids``."""
+        ids = array("i", ids)
+        vectors = self._vectors
+        width = len(FLAVOR_DIMENSIONS)
+        maxima = tuple(max((vectors[rid * width + d] for rid in ids), default=0.0) for d in range(width))
+        if level == len(_GRID_LEVELS) or len(ids) <= _LEAF_SIZE:
+            return (maxima, None, ids)
+        grid = _GRID_LEVELS[level]
+        cells: Dict[Tuple[int, ...], List[int]] = {}
+        for rid in ids:
+            key = tuple(int(vectors[rid * width + d] * grid) for d in range(width))
+            cells.setdefault(key, []).append(rid)
+        return (maxima, [self._build(members, level + 1) for members in cells.values()], None)
+
+    def _scan(self, weights: List[float], k: int) -> List[Tuple[str, float]]:
+        """Exhaustive scoring, used when a weight is negative and the bounds do not hold."""
+        width = len(FLAVOR_DIMENSIONS)
+        vectors = self._vectors
+        scored = (
+            (sum(weights[d] * vectors[rid * width + d] for d in range(width)), -rid) for rid in range(len(self._names))
+        )
+        best = heapq.nlargest(k, (entry for entry in scored if entry[0] > 0))
+        return [(self._names[-neg_rid], score) for score, neg_rid in best]
+
+
+def rank_by_flavor_profile(
+    user_profile: Union[str, Dict[str, int]],
+    recipe_db: Iterable[Dict[str, Any]],
+    top_k: int = 10,
+    registry: Optional[ProfileRegistry] = None,
+) -> List[str]:
+    """Return names of the recipes whose flavor vectors best match the whole profile.
+
+    ``user_profile`` may be a profile dict or a user ID stored in ``registry``.
+    """
+    user_profile = resolve_profile(user_profile, registry)
+    index = recipe_db if isinstance(recipe_db, FlavorIndex) else FlavorIndex(recipe_db)
+    return [name for name, _ in index.top_k(user_profile, top_k)]
+
+
+def _volume_ml(ingredient: Dict[str, Any]) -> float:
+    """Return an ingredient's volume in ml, or a trace volume when not convertible."""
+    amount = ingredient.get("amount")
+    unit = str(ingredient.get("unit") or "ml").lower()
+    if isinstance(amount, (int, float)) and amount > 0 and unit in UNIT_TABLE:
+        return amount * UNIT_TABLE[unit]
+    return _TRACE_VOLUME
+
+
+def _estimate_abv(name: str) -> float:
+    """Guess an ingredient's ABV from whole-word keywords in its canonical name."""
+    for pattern, abv in _ABV_PATTERNS:
+        if pattern.search(name):
+            return abv
+    return 0.0
@@ -2,48 +2,247 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Any
+import heapq
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Union
+
+from pymixology.instrumentation import instrument
 
 user_profile: Dict[str, int] = {}
 
+_PROFILE_KEYS = ("sweet", "sour", "bitter", "strong")
+# SQLite's default limit on bound parameters per statement is 999.
+_SQL_BATCH = 900
+
+
+class ProfileRegistry:
+    """Flavor profiles keyed by user ID, with an LRU cache over a SQLite store.
+
+    Lets one process serve many users without the shared module-level
+    ``user_profile``. Writes go through to the database; reads hit the cache
+    first and ``load_many`` fetches cache misses in batched queries. Profiles
+    are handed out as copies, so callers cannot edit the cache behind the store.
+    """
+
+    def __init__(self, path: str = ":memory:", cache_size: int = 1024) -> None:
+        if cache_size <= 0:
+            raise ValueError("cache_size must be positive.")
+        self.path = path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS profiles ("
+            "user_id TEXT PRIMARY KEY, sweet INTEGER, sour INTEGER, bitter INTEGER, strong INTEGER)"
+        )
+        self._conn.commit()
+
+    def __contains__(self, user_id: object) -> bool:
+        return isinstance(user_id, str) and self.get(user_id) is not None
+
+    def __enter__(self) -> "ProfileRegistry":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def set(self, user_id: str, profile: Dict[str, int]) -> Dict[str, int]:
+        """Store a user's profile and return the normalized copy."""
+        normalized = {key: int(profile.get(key, 0)) for key in _PROFILE_KEYS}
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO profiles (user_id, sweet, sour, bitter, strong) VALUES (?, ?, ?, ?, ?)",
+                    (user_id, *(normalized[key] for key in _PROFILE_KEYS)),
+                )
+            self._remember(user_id, dict(normalized))
+        return normalized
+
+    def get(self, user_id: str) -> Optional[Dict[str, int]]:
+        """Return a user's profile, or None if unknown."""
+        return self.load_many([user_id]).get(user_id)
+
+    def load_many(self, user_ids: Iterable[str]) -> Dict[str, Dict[str, int]]:
+        """Return profiles for the known users among ``user_ids``, warming the cache."""
+        found: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            missing = []
+            for user_id in user_ids:
+                profile = self._cache.get(user_id)
+                if profile is None:
+                    missing.append(user_id)
+                else:
+                    self._cache.move_to_end(user_id)
+                    found[user_id] = dict(profile)
+            for start in range(0, len(missing), _SQL_BATCH):
+                chunk = missing[start : start + _SQL_BATCH]
+                rows = self._conn.execute(
+                    f"SELECT user_id, sweet, sour, bitter, strong FROM profiles "
+                    f"WHERE user_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for user_id, *values in rows:
+                    profile = dict(zip(_PROFILE_KEYS, values))
+                    self._remember(user_id, profile)
+                    found[user_id] = dict(profile)
+        return found
+
+    def _remember(self, user_id: str, profile: Dict[str, int]) -> None:
+        """Insert into the LRU cache, evicting the least recently used entry."""
+        self._cache[user_id] = profile
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+def resolve_profile(user: Union[str, Dict[str, int]], registry: Optional[ProfileRegistry] = None) -> Dict[str, int]:
+    """Return a profile dict given either the dict itself or a user ID in ``registry``."""
+    if isinstance(user, dict):
+        return user
+    if registry is None:
+        raise ValueError("A ProfileRegistry is required to look up a user ID.")
+    profile = registry.get(user)
+    if profile is None:
+        raise KeyError(f"Unknown user ID: {user}")
+    return profile
 
-def set_flavor_profile(sweet: int, sour: int, bitter: int, strong: int) -> Dict[str, int]:
-    """Save a simple flavor profile."""
+
+class ReviewStore:
+    """SQLite-backed review log with per-cocktail aggregates.
+
+    Every rating is appended to ``reviews``; ``aggregates`` keeps count, total and
+    mean per cocktail, indexed by mean so top-N reads walk the index instead of
+    sorting. Data survives restarts when ``path`` is a file.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS reviews (cocktail TEXT NOT NULL, rating INTEGER NOT NULL);
+            CREATE TABLE IF NOT EXISTS aggregates (
+                cocktail TEXT PRIMARY KEY,
+                count INTEGER NOT NULL,
+                total INTEGER NOT NULL,
+                mean REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS aggregates_by_mean ON aggregates (mean DESC, count DESC, cocktail);
+            """
+        )
+
+    def __enter__(self) -> "ReviewStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def add(self, cocktail_name: str, rating: int) -> None:
+        """Record one rating."""
+        self.add_many([(cocktail_name, rating)])
+
+    def add_many(self, ratings: Iterable[Tuple[str, int]]) -> None:
+        """Record many ratings in a single transaction."""
+        rows = [(name, int(rating)) for name, rating in ratings]
+        with self._conn:
+            self._conn.executemany("INSERT INTO reviews (cocktail, rating) VALUES (?, ?)", rows)
+            self._conn.executemany(
+                """
+                INSERT INTO aggregates (cocktail, count, total, mean) VALUES (?1, 1, ?2, ?2)
+                ON CONFLICT (cocktail) DO UPDATE SET
+                    count = count + 1,
+                    total = total + excluded.total,
+                    mean = CAST(total + excluded.total AS REAL) / (count + 1)
+                """,
+                rows,
+            )
+
+    def stats(self, cocktail_name: str) -> Optional[Tuple[int, float]]:
+        """Return (count, mean) for a cocktail, or None if it has no reviews."""
+        row = self._conn.execute("SELECT count, mean FROM aggregates WHERE cocktail = ?", (cocktail_name,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of ratings recorded per cocktail."""
+        return dict(self._conn.execute("SELECT cocktail, count FROM aggregates").fetchall())
+
+    def means(self) -> Dict[str, float]:
+        """Return the mean rating per cocktail."""
+        return dict(self._conn.execute("SELECT cocktail, mean FROM aggregates").fetchall())
+
+    def top(self, top_n: int = 3) -> List[Tuple[str, float]]:
+        """Return (cocktail, mean) pairs for the best-rated cocktails."""
+        return self._conn.execute(
+            "SELECT cocktail, mean FROM aggregates ORDER BY mean DESC, count DESC, cocktail LIMIT ?",
+            (max(int(top_n), 0),),
+        ).fetchall()
+
+
+def set_flavor_profile(
+    sweet: int,
+    sour: int,
+    bitter: int,
+    strong: int,
+    user_id: Optional[str] = None,
+    registry: Optional[ProfileRegistry] = None,
+) -> Dict[str, int]:
+    """Save a simple flavor profile (per user when ``user_id`` and ``registry`` are given)."""
     global user_profile
-    user_profile = {
+    profile = {
         "sweet": int(sweet),
         "sour": int(sour),
         "bitter": int(bitter),
         "strong": int(strong),
     }
+    if user_id is not None:
+        if registry is None:
+            raise ValueError("A ProfileRegistry is required to store a per-user profile.")
+        return registry.set(user_id, profile)
+    user_profile = profile
     return user_profile
 
 
+@instrument()
 def record_review(reviews_db: Any, cocktail_name: str, rating: int):
-    """Record a rating in a list or dict store."""
+    """Record a rating in a list, dict or ReviewStore."""
     rating_value = int(rating)
+    if isinstance(reviews_db, ReviewStore):
+        reviews_db.add(cocktail_name, rating_value)
+        return reviews_db
     if isinstance(reviews_db, dict):
         reviews_db[cocktail_name] = rating_value
         return reviews_db
     if isinstance(reviews_db, list):
         reviews_db.append({"cocktail": cocktail_name, "rating": rating_value})
         return reviews_db
-    raise TypeError("reviews_db must be a list or dict.")
+    raise TypeError("reviews_db must be a list, dict or ReviewStore.")
 
 
+@instrument(scans="reviews_db", indexed=(ReviewStore,))
 def get_top_favorites(reviews_db: Any, top_n: int = 3) -> List[str]:
-    """Return the top N cocktail names sorted by rating."""
-    pairs = []
+    """Return the top N cocktail names sorted by rating (mean rating for a ReviewStore)."""
+    if isinstance(reviews_db, ReviewStore):
+        return [name for name, _ in reviews_db.top(top_n)]
     if isinstance(reviews_db, dict):
-        pairs = list(reviews_db.items())
+        pairs: Iterable[Tuple[str, Any]] = reviews_db.items()
     elif isinstance(reviews_db, list):
-        for entry in reviews_db:
-            name = entry.get("cocktail")
-            rating = entry.get("rating", 0)
-            if name is not None:
-                pairs.append((name, rating))
+        pairs = (
+            (entry.get("cocktail"), entry.get("rating", 0)) for entry in reviews_db if entry.get("cocktail") is not None
+        )
     else:
-        raise TypeError("reviews_db must be a list or dict.")
+        raise TypeError("reviews_db must be a list, dict or ReviewStore.")
 
-    sorted_pairs = sorted(pairs, key=lambda item: item[1], reverse=True)
-    return [name for name, _ in sorted_pairs[:top_n]]
+    # nlargest keeps the same tie order as a stable descending sort, in O(N log k).
+    best = heapq.nlargest(max(top_n, 0), pairs, key=lambda item: item[1])
+    return [name for name, _ in best]
@@ -0,0 +1,254 @@
+"""Constant-time weighted random recipe draws (Vose's alias method)."""
+
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from pymixology.inventory.items import Ingredient
+
+from .flavor import FLAVOR_DIMENSIONS, flavor_vector
+from .preference import ProfileRegistry, ReviewStore, resolve_profile
+
+# Blocks never shrink below this many recipes, so small catalogs use one or two tables.
+_MIN_BLOCK = 64
+# Consecutive repeats tolerated by ``sample`` before it zeroes drawn weights instead of rejecting.
+_MAX_REJECTS = 8
+
+_AliasTable = Tuple[array, array]
+
+
+def _alias_table(weights: Sequence[float]) -> Optional[_AliasTable]:
+    """Build Vose's (probability, alias) arrays, or None when every weight is zero."""
+    n = len(weights)
+    total = math.fsum(weights)
+    if n == 0 or total <= 0:
+        return None
+    scaled = [weight * n / total for weight in weights]
+    prob = array("d", [1.0]) * n
+    alias = array("q", range(n))
+    small = [i for i, value in enumerate(scaled) if value < 1.0]
+    large = [i for i, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] = (scaled[more] + scaled[less]) - 1.0
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Leftovers are 1.0 up to rounding error.
+    return prob, alias
+
+
+def _alias_draw(table: _AliasTable, rng: random.Random) -> int:
+    """Draw one index from an alias table in O(1)."""
+    prob, alias = table
+    column = int(rng.random() * len(prob))
+    return column if rng.random() < prob[column] else alias[column]
+
+
+class RecipeSampler:
+    """Weighted random draws over a catalog in constant time.
+
+    Recipes are split into blocks of about ``sqrt(n)``; each block has its own
+    alias table and a top-level alias table picks the block by its total
+    weight. A draw is two O(1) alias lookups, and changing a weight only
+    rebuilds one block plus the top table, O(sqrt(n)) instead of O(n).
+    """
+
+    def __init__(
+        self,
+        recipe_db: Iterable[Dict[str, Any]],
+        weights: Optional[Sequence[float]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self._recipes: List[Dict[str, Any]] = list(recipe_db)
+        if weights is None:
+            weights = [1.0] * len(self._recipes)
+        if len(weights) != len(self._recipes):
+            raise ValueError("weights must have one entry per recipe.")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("weights must be non-negative.")
+        self._weights = array("d", weights)
+        self._positive = sum(1 for weight in self._weights if weight > 0)
+        self._rng = rng if rng is not None else random.Random()
+        self._by_name: Dict[str, List[int]] = {}
+        for index, recipe in enumerate(self._recipes):
+            self._by_name.setdefault(str(recipe.get("name", "")).lower(), []).append(index)
+        self._block = max(_MIN_BLOCK, math.isqrt(len(self._recipes)))
+        block_count = -(-len(self._recipes) // self._block)
+        self._tables: List[Optional[_AliasTable]] = [None] * block_count
+        self._totals = array("d", [0.0]) * block_count
+        for block in range(block_count):
+            self._rebuild_block(block)
+        self._top = _alias_table(self._totals)
+        self._makeable: Any = None
+        self._makeable_ids: Optional[frozenset] = None
+        self._makeable_sampler: Optional["RecipeSampler"] = None
+
+    @classmethod
+    def from_preferences(
+        cls,
+        recipe_db: Iterable[Dict[str, Any]],
+        reviews_db: Any = None,
+        user_profile: Union[str, Dict[str, int], None] = None,
+        registry: Optional[ProfileRegistry] = None,
+        default_rating: float = 3.0,
+        rng: Optional[random.Random] = None,
+    ) -> "RecipeSampler":
+        """Build a sampler weighted by ``preference_weights``."""
+        recipes = list(recipe_db)
+        weights = preference_weights(recipes, reviews_db, user_profile, registry, default_rating)
+        return cls(recipes, weights, rng=rng)
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def weight(self, name: str) -> float:
+        """Return the weight of the first recipe with this name (case-insensitive)."""
+        indices = self._by_name.get(name.lower().strip())
+        if not indices:
+            raise KeyError(f"Unknown recipe: {name}")
+        return self._weights[indices[0]]
+
+    def set_weights(self, weights: Dict[str, float]) -> None:
+        """Change the weight of every recipe with each given name, rebuilding only touched blocks."""
+        touched = set()
+        for name, weight in weights.items():
+            if weight < 0:
+                raise ValueError("weights must be non-negative.")
+            for index in self._by_name.get(name.lower().strip(), ()):
+                self._positive += (weight > 0) - (self._weights[index] > 0)
+                self._weights[index] = weight
+                touched.add(index // self._block)
+        self._refresh(touched)
+        self._makeable_ids = None
+
+    def draw(self) -> Dict[str, Any]:
+        """Return one recipe with probability proportional to its weight."""
+        return self._recipes[self._draw_index()]
+
+    def sample(self, count: int) -> List[Dict[str, Any]]:
+        """Return ``count`` distinct recipes (a "flight"), drawn by weight without replacement.
+
+        Draws are rejected while repeats are rare; once they are not, drawn
+        recipes get weight zero for the rest of the flight and are restored after.
+        """
+        if count < 0:
+            raise ValueError("count must be non-negative.")
+        if count > self._positive:
+            raise ValueError("Not enough recipes with a positive weight.")
+        chosen: Dict[int, None] = {}
+        saved: Dict[int, float] = {}
+        rejects = 0
+        while len(chosen) < count:
+            index = self._draw_index()
+            if index not in chosen:
+                chosen[index] = None
+                rejects = 0
+                if saved:
+                    self._suppress(saved, [index])
+                continue
+            rejects += 1
+            if rejects >= _MAX_REJECTS and not saved:
+                self._suppress(saved, list(chosen))
+        if saved:
+            for index, weight in saved.items():
+                self._weights[index] = weight
+            self._refresh({index // self._block for index in saved})
+        return [self._recipes[index] for index in chosen]
+
+    def makeable(self, inventory_list: Iterable[Ingredient]) -> "RecipeSampler":
+        """Return a sampler restricted to recipes makeable from ``inventory_list``.
+
+        Makeability is tracked with an incremental ``MakeableIndex``; the
+        restricted sampler is rebuilt only when the makeable set changes.
+        """
+        from .suggester import MakeableIndex
+
+        if self._makeable is None:
+            self._makeable = MakeableIndex(self._recipes)
+        self._makeable.sync(inventory_list)
+        ready = frozenset(self._makeable.ready_ids())
+        if ready != self._makeable_ids:
+            ids = sorted(ready)
+            self._makeable_sampler = RecipeSampler(
+                [self._recipes[index] for index in ids], [self._weights[index] for index in ids], rng=self._rng
+            )
+            self._makeable_ids = ready
+        return self._makeable_sampler
+
+    def _draw_index(self) -> int:
+        """Draw one recipe index by weight."""
+        if self._top is None:
+            raise ValueError("No recipes available.")
+        block = _alias_draw(self._top, self._rng)
+        return block * self._block + _alias_draw(self._tables[block], self._rng)
+
+    def _suppress(self, saved: Dict[int, float], indices: List[int]) -> None:
+        """Zero the weights of ``indices`` for the rest of a flight, remembering the originals."""
+        for index in indices:
+            saved.setdefault(index, self._weights[index])
+            self._weights[index] = 0.0
+        self._refresh({index // self._block for index in indices})
+
+    def _refresh(self, blocks: Iterable[int]) -> None:
+        """Rebuild the given blocks and the top-level table."""
+        rebuilt = False
+        for block in blocks:
+            self._rebuild_block(block)
+            rebuilt = True
+        if rebuilt:
+            self._top = _alias_table(self._totals)
+
+    def _rebuild_block(self, block: int) -> None:
+        """Rebuild one block's alias table and total weight."""
+        weights = self._weights[block * self._block : (block + 1) * self._block]
+        self._tables[block] = _alias_table(weights)
+        self._totals[block] = math.fsum(weights)
+
+
+def preference_weights(
+    recipe_db: Iterable[Dict[str, Any]],
+    reviews_db: Any = None,
+    user_profile: Union[str, Dict[str, int], None] = None,
+    registry: Optional[ProfileRegistry] = None,
+    default_rating: float = 3.0,
+) -> List[float]:
+    """Weight each recipe by its mean rating times its flavor match.
+
+    Ratings come from a list, dict or ``ReviewStore`` (unreviewed recipes get
+    ``default_rating``). The flavor match is the ``FlavorIndex`` score of the
+    recipe's flavor vector against ``user_profile``, clipped at zero.
+    """
+    ratings = _mean_ratings(reviews_db) if reviews_db is not None else {}
+    profile = None
+    if user_profile is not None:
+        resolved = resolve_profile(user_profile, registry)
+        profile = [float(resolved.get(dimension, 0)) for dimension in FLAVOR_DIMENSIONS]
+    weights = []
+    for recipe in recipe_db:
+        weight = float(ratings.get(str(recipe.get("name", "")), default_rating))
+        if profile is not None:
+            weight *= max(sum(w * v for w, v in zip(profile, flavor_vector(recipe))), 0.0)
+        weights.append(max(weight, 0.0))
+    return weights
+
+
+def _mean_ratings(reviews_db: Any) -> Dict[str, float]:
+    """Mean rating per cocktail from a list, dict or ReviewStore."""
+    if isinstance(reviews_db, ReviewStore):
+        return reviews_db.means()
+    if isinstance(reviews_db, dict):
+        return {name: float(rating) for name, rating in reviews_db.items()}
+    if isinstance(reviews_db, list):
+        totals: Dict[str, List[float]] = {}
+        for entry in reviews_db:
+            name = entry.get("cocktail")
+            if name is not None:
+                pair = totals.setdefault(name, [0.0, 0.0])
+                pair[0] += entry.get("rating", 0)
+                pair[1] += 1
+        return {name: total / count for name, (total, count) in totals.items()}
+    raise TypeError("reviews_db must be a list, dict or ReviewStore.")
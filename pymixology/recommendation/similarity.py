@@ -0,0 +1,222 @@
+"""Similar-cocktail search with MinHash signatures and an LSH banding index."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import _normalize_ingredient
+
+# Largest Mersenne prime below 2**64; hash functions are (a * x + b) mod this.
+_PRIME = (1 << 61) - 1
+# Buckets larger than this are verified against their first member only in ``near_duplicates``.
+_MAX_BUCKET = 64
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two sets (0.0 when both are empty)."""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+class SimilarityIndex:
+    """MinHash/LSH index over recipe ingredient sets, built once.
+
+    Recipes sharing an ingredient set share one entry. Each distinct set gets a
+    ``num_perm``-value MinHash signature, cut into ``bands`` bands whose hashes
+    key one bucket table per band. Sets sharing a bucket in any band are
+    candidates, which are then ranked by exact Jaccard similarity, so lookups
+    touch a few buckets instead of every recipe. Pairs with similarity s are
+    found with probability ``1 - (1 - s**rows)**bands``, about 0.88 at s = 0.5
+    with the defaults (3 rows per band).
+    """
+
+    def __init__(
+        self, recipe_db: Iterable[Dict[str, Any]], num_perm: int = 48, bands: int = 16, seed: int = 533
+    ) -> None:
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands.")
+        self.num_perm = num_perm
+        self.bands = bands
+        self._rows = num_perm // bands
+        rng = random.Random(seed)
+        self._coefficients = [(rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(num_perm)]
+        self._token_hashes: Dict[str, Tuple[int, ...]] = {}
+        self._names: List[str] = []
+        self._by_name: Dict[str, int] = {}
+        self._recipe_sets: List[int] = []
+        self._set_ids: Dict[FrozenSet[str], int] = {}
+        self._sets: List[FrozenSet[str]] = []
+        self._members: List[List[int]] = []
+        self._by_ingredient: Dict[str, List[int]] = {}
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        for recipe in recipe_db:
+            self._add(recipe)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def similar(self, name: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """Return up to ``top_k`` (name, Jaccard) pairs most like the named recipe, excluding itself."""
+        rid = self._by_name.get(name.lower().strip())
+        if rid is None:
+            raise KeyError(f"Unknown recipe: {name}")
+        ingredients = self._sets[self._recipe_sets[rid]]
+        if not ingredients or top_k <= 0:
+            return []
+        return self._rank(ingredients, self._candidates(ingredients, top_k + 1), top_k, exclude=rid)
+
+    def closest(self, ingredient_names: Iterable[str], top_k: int = 10) -> List[Tuple[str, float]]:
+        """Return up to ``top_k`` (name, Jaccard) pairs whose ingredient sets best match ``ingredient_names``."""
+        query = frozenset(canonical_name(name) for name in ingredient_names)
+        if not query or top_k <= 0:
+            return []
+        return self._rank(query, self._candidates(query, top_k), top_k)
+
+    def near_duplicates(self, threshold: float = 0.8) -> List[List[str]]:
+        """Group recipes whose ingredient sets are at least ``threshold`` similar.
+
+        Recipes with identical sets are grouped directly; distinct sets are
+        compared only within shared LSH buckets and merged with union-find, so
+        the pass never compares all pairs. Groups are returned in catalog order.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1].")
+        parent = list(range(len(self._sets)))
+
+        def find(sid: int) -> int:
+            while parent[sid] != sid:
+                parent[sid] = parent[parent[sid]]
+                sid = parent[sid]
+            return sid
+
+        checked: Set[Tuple[int, int]] = set()
+        for buckets in self._buckets:
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                pairs = (
+                    ((a, b) for i, a in enumerate(members) for b in members[i + 1 :])
+                    if len(members) <= _MAX_BUCKET
+                    else ((members[0], b) for b in members[1:])
+                )
+                for pair in pairs:
+                    if pair in checked:
+                        continue
+                    checked.add(pair)
+                    if jaccard(self._sets[pair[0]], self._sets[pair[1]]) >= threshold:
+                        root_a, root_b = find(pair[0]), find(pair[1])
+                        if root_a != root_b:
+                            parent[max(root_a, root_b)] = min(root_a, root_b)
+        groups: Dict[int, List[int]] = {}
+        for sid, ingredients in enumerate(self._sets):
+            if ingredients:
+                groups.setdefault(find(sid), []).extend(self._members[sid])
+        return [
+            [self._names[rid] for rid in sorted(rids)]
+            for rids in sorted(groups.values(), key=min)
+            if len(rids) > 1
+        ]
+
+    def _add(self, recipe: Dict[str, Any]) -> None:
+        """Index one recipe."""
+        rid = len(self._names)
+        name = str(recipe.get("name", ""))
+        ingredients = frozenset(
+            canonical_name(_normalize_ingredient(item)["name"]) for item in recipe.get("ingredients", [])
+        )
+        self._names.append(name)
+        self._by_name.setdefault(name.lower(), rid)
+        sid = self._set_ids.get(ingredients)
+        if sid is None:
+            sid = len(self._sets)
+            self._set_ids[ingredients] = sid
+            self._sets.append(ingredients)
+            self._members.append([])
+            for key in ingredients:
+                self._by_ingredient.setdefault(key, []).append(sid)
+            if ingredients:
+                for band, key in enumerate(self._band_keys(ingredients)):
+                    self._buckets[band].setdefault(key, []).append(sid)
+        self._members[sid].append(rid)
+        self._recipe_sets.append(sid)
+
+    def _signature(self, ingredients: FrozenSet[str]) -> Sequence[int]:
+        """MinHash signature: the element-wise minimum of the members' hash vectors."""
+        vectors = [self._token_vector(key) for key in ingredients]
+        return vectors[0] if len(vectors) == 1 else tuple(map(min, *vectors))
+
+    def _token_vector(self, key: str) -> Tuple[int, ...]:
+        """Hash values of one ingredient under every hash function (computed once per ingredient)."""
+        vector = self._token_hashes.get(key)
+        if vector is None:
+            x = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+            vector = tuple((a * x + b) % _PRIME for a, b in self._coefficients)
+            self._token_hashes[key] = vector
+        return vector
+
+    def _band_keys(self, ingredients: FrozenSet[str]) -> List[int]:
+        """Return one bucket key per band."""
+        signature = self._signature(ingredients)
+        rows = self._rows
+        return [hash(tuple(signature[start : start + rows])) for start in range(0, self.num_perm, rows)]
+
+    def _candidates(self, ingredients: FrozenSet[str], wanted: int) -> Set[int]:
+        """Distinct sets sharing a band bucket with ``ingredients``.
+
+        When banding yields fewer than ``wanted`` recipes (a rare set, or a long
+        ingredient list where every Jaccard score is low) sets sharing the
+        query's rarest ingredients are added until short result lists are filled.
+        """
+        candidates: Set[int] = set()
+        for band, key in enumerate(self._band_keys(ingredients)):
+            candidates.update(self._buckets[band].get(key, ()))
+        found = sum(len(self._members[sid]) for sid in candidates)
+        # Rarest ingredients first, stopping as soon as there are enough recipes.
+        for key in sorted(ingredients, key=lambda key: len(self._by_ingredient.get(key, ()))):
+            if found >= wanted:
+                break
+            for sid in self._by_ingredient.get(key, ()):
+                if sid not in candidates:
+                    candidates.add(sid)
+                    found += len(self._members[sid])
+        return candidates
+
+    def _rank(
+        self, query: FrozenSet[str], candidates: Iterable[int], top_k: int, exclude: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """Top ``top_k`` recipes from candidate sets by exact Jaccard similarity, ties in catalog order."""
+        if top_k <= 0:
+            return []
+        scored = sorted(
+            ((score, sid) for sid in candidates for score in (jaccard(query, self._sets[sid]),) if score > 0),
+            reverse=True,
+        )
+        best: List[Tuple[float, int]] = []
+        for score, sid in scored:
+            # Sets scoring below the k-th recipe collected so far cannot enter the result.
+            if len(best) >= top_k and score < best[-1][0]:
+                break
+            best.extend((score, rid) for rid in self._members[sid] if rid != exclude)
+        best.sort(key=lambda entry: (-entry[0], entry[1]))
+        return [(self._names[rid], score) for score, rid in best[:top_k]]
+
+
+def similar_cocktails(recipe_db: Any, name: str, top_k: int = 10) -> List[Tuple[str, float]]:
+    """Cocktails most like ``name`` by ingredient Jaccard similarity."""
+    index = recipe_db if isinstance(recipe_db, SimilarityIndex) else SimilarityIndex(recipe_db)
+    return index.similar(name, top_k)
+
+
+def closest_cocktails(ingredient_names: Iterable[str], recipe_db: Any, top_k: int = 10) -> List[Tuple[str, float]]:
+    """Cocktails whose ingredient sets best match ``ingredient_names`` (e.g. what is in stock)."""
+    index = recipe_db if isinstance(recipe_db, SimilarityIndex) else SimilarityIndex(recipe_db)
+    return index.closest(ingredient_names, top_k)
+
+
+def find_near_duplicates(recipe_db: Any, threshold: float = 0.8) -> List[List[str]]:
+    """Groups of recipe names with near-identical ingredient sets."""
+    index = recipe_db if isinstance(recipe_db, SimilarityIndex) else SimilarityIndex(recipe_db)
+    return index.near_duplicates(threshold)
@@ -3,25 +3,18 @@
 from __future__ import annotations
 
 import random
-from typing import Iterable, List, Dict, Any
+from array import array
+from itertools import islice
+from typing import Iterable, List, Dict, Any, Optional, Set, Tuple, Union
 
+from pymixology.instrumentation import instrument
 from pymixology.inventory.items import Ingredient
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import RecipeCatalog, _normalize_ingredient
+from pymixology.recipes.sharding import ShardedCatalog
 
-
-def _normalize_ingredient(item: Any) -> Dict[str, Any]:
-    """Normalize ingredient representation to a consistent dict."""
-    if isinstance(item, dict):
-        return {
-            "name": str(item.get("name", "")),
-            "amount": item.get("amount"),
-            "unit": item.get("unit"),
-        }
-    return {"name": str(item), "amount": None, "unit": None}
-
-
-def _ingredient_name(item: Any) -> str:
-    """Normalize ingredient representation to a name string."""
-    return _normalize_ingredient(item).get("name", "")
+from .preference import ProfileRegistry, resolve_profile
+from .sampler import RecipeSampler
 
 
 def _has_required_amount(required: Dict[str, Any], inventory_item: Ingredient) -> bool:
@@ -32,9 +25,122 @@ def _has_required_amount(required: Dict[str, Any], inventory_item: Ingredient) -
     return True
 
 
+def _amount_satisfied(stock: Optional[float], required: Optional[float]) -> bool:
+    """Check a stock level against a compiled requirement (None stock means missing)."""
+    if stock is None:
+        return False
+    return required is None or stock >= required
+
+
+class MakeableIndex:
+    """Recipes precompiled into integer ingredient ids for incremental makeability.
+
+    Each recipe keeps a count of unmet requirements and each ingredient id keeps
+    a posting list of the requirements that reference it, so a change to one
+    stock level only touches the recipes using that ingredient. ``sync`` diffs an
+    inventory against the last seen stock levels, which picks up ``add_item``,
+    ``remove_item`` and ``Ingredient.use`` changes without a full recompute.
+    """
+
+    def __init__(self, recipe_db: Iterable[Dict[str, Any]]) -> None:
+        self._ingredient_ids: Dict[str, int] = {}
+        self._ingredient_names: List[str] = []
+        self._postings: List[List[Tuple[int, Optional[float]]]] = []
+        self._stock: List[Optional[float]] = []
+        self._recipe_names: List[str] = []
+        self._requirements: List[List[Tuple[int, Optional[float]]]] = []
+        self._missing = array("i")
+        self._ready: Set[int] = set()
+        for recipe in recipe_db:
+            self._compile(recipe)
+
+    def __len__(self) -> int:
+        return len(self._recipe_names)
+
+    def _compile(self, recipe: Dict[str, Any]) -> None:
+        """Translate one recipe into (ingredient id, required amount) pairs."""
+        rid = len(self._recipe_names)
+        requirements = []
+        for item in recipe.get("ingredients", []):
+            ingredient = _normalize_ingredient(item)
+            key = canonical_name(ingredient["name"])
+            iid = self._ingredient_ids.get(key)
+            if iid is None:
+                iid = len(self._ingredient_names)
+                self._ingredient_ids[key] = iid
+                self._ingredient_names.append(ingredient["name"])
+                self._postings.append([])
+                self._stock.append(None)
+            amount = ingredient.get("amount")
+            required = amount if isinstance(amount, (int, float)) and amount > 0 else None
+            requirements.append((iid, required))
+            self._postings[iid].append((rid, required))
+        self._recipe_names.append(recipe.get("name", ""))
+        self._requirements.append(requirements)
+        # Recipes without ingredients are never makeable, so they stay "missing" forever.
+        self._missing.append(len(requirements) if requirements else -1)
+
+    def update(self, ingredient_name: str, quantity: Optional[float]) -> None:
+        """Apply a single stock level change; ``None`` means the item is gone."""
+        iid = self._ingredient_ids.get(canonical_name(ingredient_name))
+        if iid is None:
+            return
+        previous = self._stock[iid]
+        if previous == quantity:
+            return
+        self._stock[iid] = quantity
+        missing = self._missing
+        for rid, required in self._postings[iid]:
+            before = _amount_satisfied(previous, required)
+            after = _amount_satisfied(quantity, required)
+            if before == after:
+                continue
+            missing[rid] += -1 if after else 1
+            if missing[rid] == 0:
+                self._ready.add(rid)
+            else:
+                self._ready.discard(rid)
+
+    def sync(self, inventory_list: Iterable[Ingredient]) -> None:
+        """Bring stock levels in line with an inventory, touching only what changed."""
+        current = {item.key: item.quantity for item in inventory_list}
+        for key, iid in self._ingredient_ids.items():
+            quantity = current.get(key)
+            if self._stock[iid] != quantity:
+                self.update(key, quantity)
+
+    def makeable(self) -> List[str]:
+        """Return names of recipes whose requirements are all met."""
+        return [self._recipe_names[rid] for rid in sorted(self._ready)]
+
+    def ready_ids(self) -> List[int]:
+        """Return the positions (in catalog order) of recipes whose requirements are all met."""
+        return sorted(self._ready)
+
+    def missing_at_most(self, max_missing: int) -> Dict[str, List[str]]:
+        """Map recipe names missing at most ``max_missing`` ingredients to what they lack."""
+        if max_missing < 0:
+            raise ValueError("max_missing must be non-negative.")
+        result: Dict[str, List[str]] = {}
+        for rid, count in enumerate(self._missing):
+            if 0 <= count <= max_missing:
+                result[self._recipe_names[rid]] = [
+                    self._ingredient_names[iid]
+                    for iid, required in self._requirements[rid]
+                    if not _amount_satisfied(self._stock[iid], required)
+                ]
+        return result
+
+
+@instrument(scans="recipe_db", indexed=(MakeableIndex, ShardedCatalog))
 def get_makeable_cocktails(inventory_list: List[Ingredient], recipe_db: Iterable[Dict[str, Any]]) -> List[str]:
     """Return cocktail names that can be made with current inventory."""
-    inventory_lookup = {item.name.lower(): item for item in inventory_list}
+    if isinstance(recipe_db, MakeableIndex):
+        recipe_db.sync(inventory_list)
+        return recipe_db.makeable()
+    if isinstance(recipe_db, ShardedCatalog):
+        return recipe_db.makeable(inventory_list)
+    inventory_lookup = {item.key: item for item in inventory_list}
     ready: List[str] = []
     for recipe in recipe_db:
         normalized_ingredients = [_normalize_ingredient(item) for item in recipe.get("ingredients", [])]
@@ -42,7 +148,7 @@ def get_makeable_cocktails(inventory_list: List[Ingredient], recipe_db: Iterable
             continue
         can_make = True
         for ingredient in normalized_ingredients:
-            name = ingredient.get("name", "").lower()
+            name = canonical_name(ingredient.get("name", ""))
             inventory_item = inventory_lookup.get(name)
             if not inventory_item or not _has_required_amount(ingredient, inventory_item):
                 can_make = False
@@ -52,19 +158,39 @@ def get_makeable_cocktails(inventory_list: List[Ingredient], recipe_db: Iterable
     return ready
 
 
+@instrument(scans="recipe_db", indexed=(MakeableIndex,))
+def get_nearly_makeable_cocktails(
+    inventory_list: List[Ingredient], recipe_db: Iterable[Dict[str, Any]], max_missing: int = 1
+) -> Dict[str, List[str]]:
+    """Return cocktails missing at most ``max_missing`` ingredients, with the missing names."""
+    index = recipe_db if isinstance(recipe_db, MakeableIndex) else MakeableIndex(recipe_db)
+    index.sync(inventory_list)
+    return index.missing_at_most(max_missing)
+
+
+@instrument(scans="recipe_db", indexed=(RecipeCatalog,))
 def find_cocktails_with_ingredients(target_ingredients: List[str], recipe_db: Iterable[Dict[str, Any]]) -> List[str]:
     """Recommend cocktails that include any of the target ingredients."""
-    targets = {item.lower() for item in target_ingredients}
+    if isinstance(recipe_db, RecipeCatalog):
+        return [recipe.get("name", "") for recipe in recipe_db.with_ingredients(target_ingredients)]
+    targets = {canonical_name(item) for item in target_ingredients}
     matches = []
     for recipe in recipe_db:
-        ingredients = {_normalize_ingredient(item).get("name", "").lower() for item in recipe.get("ingredients", [])}
+        names = (_normalize_ingredient(item).get("name", "") for item in recipe.get("ingredients", []))
+        ingredients = {canonical_name(name) for name in names}
         if ingredients & targets:
             matches.append(recipe.get("name", ""))
     return matches
 
 
-def recommend_by_flavor(user_profile: Dict[str, int], recipe_db: Iterable[Dict[str, Any]]) -> List[str]:
-    """Match recipes against user flavor preferences."""
+@instrument(scans="recipe_db")
+def recommend_by_flavor(
+    user_profile: Union[str, Dict[str, int]],
+    recipe_db: Iterable[Dict[str, Any]],
+    registry: Optional[ProfileRegistry] = None,
+) -> List[str]:
+    """Match recipes against user flavor preferences (a profile dict or a user ID in ``registry``)."""
+    user_profile = resolve_profile(user_profile, registry)
     scored = []
     for recipe in recipe_db:
         flavor_key = str(recipe.get("flavor", "")).lower()
@@ -75,9 +201,43 @@ def recommend_by_flavor(user_profile: Dict[str, int], recipe_db: Iterable[Dict[s
     return [name for _, name in scored]
 
 
-def surprise_me(recipe_db: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
-    """Return a random cocktail dict."""
-    recipes = list(recipe_db)
-    if not recipes:
+def surprise_me(
+    recipe_db: Iterable[Dict[str, Any]], inventory_list: Optional[Iterable[Ingredient]] = None
+) -> Dict[str, Any]:
+    """Return a random cocktail dict, optionally one makeable from ``inventory_list``.
+
+    A ``RecipeSampler`` draws by weight in constant time; other catalogs are
+    sampled uniformly without being copied.
+    """
+    if isinstance(recipe_db, RecipeSampler):
+        sampler = recipe_db if inventory_list is None else recipe_db.makeable(inventory_list)
+        return sampler.draw()
+    if inventory_list is not None:
+        names = set(get_makeable_cocktails(inventory_list, recipe_db))
+        recipe_db = [recipe for recipe in recipe_db if recipe.get("name", "") in names]
+    if hasattr(recipe_db, "__getitem__") and hasattr(recipe_db, "__len__"):
+        if not len(recipe_db):
+            raise ValueError("No recipes available.")
+        return random.choice(recipe_db)
+    if hasattr(recipe_db, "__len__"):
+        if not len(recipe_db):
+            raise ValueError("No recipes available.")
+        return next(islice(recipe_db, random.randrange(len(recipe_db)), None))
+    # Reservoir sampling: one pass, no copy of the catalog.
+    chosen = None
+    for seen, recipe in enumerate(recipe_db, start=1):
+        if random.randrange(seen) == 0:
+            chosen = recipe
+    if chosen is None:
         raise ValueError("No recipes available.")
-    return random.choice(recipes)
+    return chosen
+
+
+def surprise_flight(
+    recipe_db: Iterable[Dict[str, Any]], count: int, inventory_list: Optional[Iterable[Ingredient]] = None
+) -> List[Dict[str, Any]]:
+    """Return ``count`` distinct random cocktails, weighted when given a ``RecipeSampler``."""
+    sampler = recipe_db if isinstance(recipe_db, RecipeSampler) else RecipeSampler(recipe_db)
+    if inventory_list is not None:
+        sampler = sampler.makeable(inventory_list)
+    return sampler.sample(count)
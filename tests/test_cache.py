@@ -0,0 +1,104 @@
+"""Tests for pymixology.recommendation.cache."""
+
+from __future__ import annotations
+
+import unittest
+
+from pymixology.inventory.items import Mixer, Spirit
+from pymixology.inventory.manager import Inventory
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.recommendation import suggester
+from pymixology.recommendation.cache import RecommendationCache
+
+RECIPES = [
+    {
+        "name": "Gimlet",
+        "flavor": "Sour",
+        "ingredients": [{"name": "Gin", "amount": 60}, {"name": "Lime Juice", "amount": 20}],
+    },
+    {"name": "Daiquiri", "flavor": "Sour", "ingredients": [{"name": "Rum", "amount": 60}, {"name": "Lime Juice"}]},
+    {"name": "Gin Neat", "flavor": "Strong", "ingredients": [{"name": "Gin", "amount": 60}]},
+]
+
+
+class RecommendationCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.catalog = RecipeCatalog(RECIPES)
+        self.inventory = Inventory(
+            [
+                Spirit("Gin", 700, "", 0.4),
+                Mixer("Fresh Lime Juice", 100, "", False),
+                Mixer("Soda Water", 500, "", True),
+            ]
+        )
+        self.cache = RecommendationCache()
+
+    def makeable(self):
+        return self.cache.get_makeable_cocktails(self.inventory, self.catalog)
+
+    def test_repeated_queries_hit(self) -> None:
+        self.assertEqual(self.makeable(), ["Gimlet", "Gin Neat"])
+        self.assertEqual(self.makeable(), ["Gimlet", "Gin Neat"])
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 1, "evictions": 0, "size": 1})
+
+    def test_results_are_copies(self) -> None:
+        self.makeable().append("Martini")
+        self.assertEqual(self.makeable(), ["Gimlet", "Gin Neat"])
+
+    def test_used_ingredient_change_invalidates(self) -> None:
+        self.makeable()
+        self.inventory.get("gin").quantity = 0
+        self.assertEqual(self.makeable(), [])
+        self.assertEqual(self.cache.misses, 2)
+        self.inventory.add(Spirit("Rum", 700, "", 0.4))
+        self.assertEqual(self.makeable(), ["Daiquiri"])
+        self.assertEqual(self.makeable(), suggester.get_makeable_cocktails(self.inventory, self.catalog))
+
+    def test_unrelated_ingredient_change_keeps_entry(self) -> None:
+        self.makeable()
+        self.inventory.get("soda water").quantity = 0
+        self.inventory.add(Mixer("Tonic Water", 200, "", True))
+        self.assertEqual(self.makeable(), ["Gimlet", "Gin Neat"])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_catalog_edits_miss(self) -> None:
+        self.makeable()
+        self.catalog.add({"name": "Gin Rickey", "ingredients": [{"name": "Gin"}, {"name": "Soda Water"}]})
+        self.assertEqual(self.makeable(), ["Gimlet", "Gin Neat", "Gin Rickey"])
+        self.catalog.remove("Gimlet")
+        self.assertEqual(self.makeable(), ["Gin Neat", "Gin Rickey"])
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_catalog_only_queries(self) -> None:
+        for _ in range(2):
+            with_lime = self.cache.find_cocktails_with_ingredients(["lime juice"], self.catalog)
+            self.assertEqual(with_lime, ["Gimlet", "Daiquiri"])
+            self.assertEqual(self.cache.recommend_by_flavor({"sour": 5}, self.catalog), ["Gimlet", "Daiquiri"])
+        self.inventory.get("gin").quantity = 0
+        self.cache.find_cocktails_with_ingredients(["Fresh Lime Juice"], self.catalog)
+        self.assertEqual(self.cache.stats(), {"hits": 3, "misses": 2, "evictions": 0, "size": 2})
+
+    def test_plain_lists_are_not_cached(self) -> None:
+        items = list(self.inventory)
+        for _ in range(2):
+            self.assertEqual(self.cache.get_makeable_cocktails(items, RECIPES), ["Gimlet", "Gin Neat"])
+            self.assertEqual(self.cache.get_makeable_cocktails(self.inventory, RECIPES), ["Gimlet", "Gin Neat"])
+            self.cache.find_cocktails_with_ingredients(["gin"], RECIPES)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.misses, 0)
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = RecommendationCache(max_entries=2)
+        for targets in (["gin"], ["rum"], ["gin"], ["lime juice"]):
+            cache.find_cocktails_with_ingredients(targets, self.catalog)
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 3, "evictions": 1, "size": 2})
+        cache.find_cocktails_with_ingredients(["gin"], self.catalog)
+        self.assertEqual(cache.hits, 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            RecommendationCache(max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
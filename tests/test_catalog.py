@@ -0,0 +1,201 @@
+"""Tests for pymixology.recipes.catalog."""
+
+from __future__ import annotations
+
+import json
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.generators import synthetic_recipes, write_synthetic_catalog
+from pymixology.recipes import catalog as catalog_module
+from pymixology.recipes.catalog import (
+    BinaryCatalog,
+    RecipeCatalog,
+    filter_by_base,
+    iter_recipes,
+    load_recipes,
+    search_cocktail,
+    write_binary_catalog,
+)
+
+DATA = Path(__file__).resolve().parent.parent / "pymixology" / "data" / "cocktails.json"
+
+
+def names(recipes):
+    return [recipe["name"] for recipe in recipes]
+
+
+class RecipeCatalogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.recipes = load_recipes(str(DATA))
+        self.catalog = RecipeCatalog(self.recipes)
+
+    def test_iterates_in_insertion_order(self) -> None:
+        self.assertEqual(len(self.catalog), len(self.recipes))
+        self.assertEqual(list(self.catalog), self.recipes)
+
+    def test_search_matches_list_path(self) -> None:
+        for query in ("", "m", "mar", "mart", "MARTINI", "  sour ", "ti", "no such drink"):
+            with self.subTest(query=query):
+                self.assertEqual(
+                    names(search_cocktail(self.catalog, query)), names(search_cocktail(self.recipes, query))
+                )
+
+    def test_filter_by_base_matches_list_path(self) -> None:
+        bases = {recipe.get("base", "") for recipe in self.recipes} | {"GIN", " rum ", "Absinthe"}
+        for base in bases:
+            with self.subTest(base=base):
+                self.assertEqual(names(filter_by_base(self.catalog, base)), names(filter_by_base(self.recipes, base)))
+
+    def test_add_and_remove_keep_indexes_current(self) -> None:
+        version = self.catalog.version
+        recipe = self.catalog.add(
+            {"name": "Test Fizz", "base": "Gin", "ingredients": [{"name": "Fresh Lime Juice", "amount": 20}]}
+        )
+        self.assertGreater(self.catalog.version, version)
+        self.assertIn(recipe, self.catalog.search("test fiz"))
+        self.assertIn(recipe, self.catalog.by_base("gin"))
+        self.assertIn(recipe, self.catalog.with_ingredients(["lime juice"]))
+        self.assertIs(self.catalog.get("TEST FIZZ"), recipe)
+
+        self.assertTrue(self.catalog.remove("test fizz"))
+        self.assertFalse(self.catalog.remove("test fizz"))
+        self.assertEqual(self.catalog.search("test fiz"), [])
+        self.assertNotIn(recipe, self.catalog.by_base("gin"))
+        self.assertIsNone(self.catalog.get("test fizz"))
+
+    def test_remove_by_dict_only_removes_that_recipe(self) -> None:
+        first = self.catalog.add({"name": "Twin", "base": "Rum"})
+        second = self.catalog.add({"name": "Twin", "base": "Rum"})
+        self.assertTrue(self.catalog.remove(second))
+        self.assertEqual(self.catalog.search("twin"), [first])
+
+    def test_same_dict_added_twice_is_removed_once_per_copy(self) -> None:
+        recipe = {"name": "Echo", "base": "Gin", "ingredients": ["Gin"]}
+        self.catalog.add(recipe)
+        self.catalog.add(recipe)
+        self.assertEqual(self.catalog.search("echo"), [recipe, recipe])
+        self.assertTrue(self.catalog.remove(recipe))
+        self.assertEqual(self.catalog.search("echo"), [recipe])
+        self.assertTrue(self.catalog.remove(recipe))
+        self.assertFalse(self.catalog.remove(recipe))
+        self.assertEqual(self.catalog.search("echo"), [])
+        self.assertEqual(list(self.catalog), self.recipes)
+
+    def test_rejects_non_dict_recipes(self) -> None:
+        with self.assertRaises(TypeError):
+            self.catalog.add(["not", "a", "recipe"])
+
+
+class StreamingLoaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+
+    def write(self, name: str, text: str) -> str:
+        path = self.dir / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    def test_json_array_matches_load_recipes(self) -> None:
+        self.assertEqual(list(iter_recipes(str(DATA))), load_recipes(str(DATA)))
+
+    def test_json_lines_and_array_agree(self) -> None:
+        array_path, lines_path = self.dir / "a.json", self.dir / "a.jsonl"
+        write_synthetic_catalog(array_path, 300)
+        write_synthetic_catalog(lines_path, 300, json_lines=True)
+        self.assertEqual(list(iter_recipes(str(array_path))), list(iter_recipes(str(lines_path))))
+        self.assertEqual(list(iter_recipes(str(array_path))), load_recipes(str(array_path)))
+
+    def test_items_larger_than_a_chunk(self) -> None:
+        recipes = [{"name": f"Long {i}", "steps": ["x" * 100_000]} for i in range(3)]
+        path = self.write("long.json", json.dumps(recipes, indent=2))
+        self.assertEqual(list(iter_recipes(path)), load_recipes(path))
+
+    def test_blank_leading_chunk_and_empty_array(self) -> None:
+        path = self.write("blank.json", " " * 200_000 + "[]")
+        self.assertEqual(list(iter_recipes(path)), [])
+
+    def test_rejects_a_single_object(self) -> None:
+        path = self.write("object.json", json.dumps({"name": "Solo", "ingredients": []}, indent=2))
+        with self.assertRaisesRegex(ValueError, "list of dicts"):
+            list(iter_recipes(path))
+        with self.assertRaisesRegex(ValueError, "list of dicts"):
+            load_recipes(path)
+
+    def test_rejects_non_dict_items(self) -> None:
+        for text in ("[1, 2]", "42\n", '"name"\n'):
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, "list of dicts"):
+                    list(iter_recipes(self.write("bad.json", text)))
+
+    def test_malformed_array(self) -> None:
+        for text in ('[{"name": "A"} {"name": "B"}]', '[{"name": "A"},', '[{"name": "A"'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    list(iter_recipes(self.write("bad.json", text)))
+
+    def test_malformed_item_stops_at_the_size_cap(self) -> None:
+        good = json.dumps({"name": "Filler", "steps": ["y" * 1000]})
+        text = '[{"name": "Broken", "x": [1,}, ' + ", ".join([good] * 200) + "]"
+        path = self.write("broken.json", text)
+        original = catalog_module._MAX_RECORD_SIZE
+        catalog_module._MAX_RECORD_SIZE = 1 << 12
+        try:
+            with self.assertRaisesRegex(ValueError, "Malformed recipe array"):
+                list(iter_recipes(path))
+        finally:
+            catalog_module._MAX_RECORD_SIZE = original
+
+
+class BinaryCatalogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = str(Path(self._tmp.name) / "catalog.bin")
+        self.recipes = load_recipes(str(DATA)) + [
+            {"name": "Caf\u00e9 Ol\u00e9\nSpecial", "base": "Rum", "ingredients": ["Rum"], "steps": []},
+            {"name": "", "ingredients": []},
+        ]
+        self.count = write_binary_catalog(self.recipes, self.path)
+        self.catalog = BinaryCatalog(self.path)
+        self.addCleanup(self.catalog.close)
+        self.expected = [catalog_module._normalize_recipe(recipe) for recipe in self.recipes]
+
+    def test_round_trip(self) -> None:
+        self.assertEqual(self.count, len(self.recipes))
+        self.assertEqual(len(self.catalog), len(self.recipes))
+        self.assertEqual(list(self.catalog), self.expected)
+        self.assertEqual(self.catalog[-1], self.expected[-1])
+        with self.assertRaises(IndexError):
+            self.catalog[len(self.recipes)]
+
+    def test_queries_match_list_path(self) -> None:
+        for query in ("", "mar", "MARTINI", "caf\u00e9", "special", "zzz"):
+            with self.subTest(query=query):
+                self.assertEqual(search_cocktail(self.catalog, query), search_cocktail(self.expected, query))
+        for base in ("gin", "Rum", "", "absinthe"):
+            with self.subTest(base=base):
+                self.assertEqual(filter_by_base(self.catalog, base), filter_by_base(self.expected, base))
+
+    def test_large_synthetic_round_trip(self) -> None:
+        recipes = synthetic_recipes(2000)
+        write_binary_catalog(iter(recipes), self.path + "2")
+        with BinaryCatalog(self.path + "2") as binary:
+            self.assertEqual(list(binary), recipes)
+            self.assertEqual(names(binary.search("gin 1")), names(search_cocktail(recipes, "gin 1")))
+
+    def test_rejects_other_files(self) -> None:
+        other = Path(self._tmp.name) / "other.bin"
+        for data in (b"", b"PMX", struct.pack("<4sHHIQQQQ", b"NOPE", 1, 0, 0, 0, 0, 0, 0)):
+            other.write_bytes(data)
+            with self.subTest(data=data):
+                with self.assertRaisesRegex(ValueError, "Not a binary recipe catalog"):
+                    BinaryCatalog(str(other))
+
+
+if __name__ == "__main__":
+    unittest.main()
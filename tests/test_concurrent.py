@@ -0,0 +1,141 @@
+"""Tests for pymixology.inventory.concurrent."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+
+from pymixology.inventory.concurrent import ConcurrentInventory
+from pymixology.inventory.items import Mixer, Spirit
+from pymixology.inventory.orders import serve_orders
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class ReserveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stock = ConcurrentInventory([Spirit("Gin", 1000, "", 0.4), Mixer("Lime Juice", 0, "", False)])
+
+    def test_concurrent_reservations_never_oversell(self) -> None:
+        granted = []
+
+        def worker() -> None:
+            granted.extend(self.stock.reserve("gin", 7) for _ in range(50))
+
+        run_threads(worker, 8)
+        self.assertEqual(sum(granted), 1000 // 7)
+        self.assertEqual(self.stock.check_stock("Gin"), 1000 % 7)
+
+    def test_version_counts_every_change_across_stripes(self) -> None:
+        class SlowVersion(int):
+            """Yields to other threads between reading and storing the incremented version."""
+
+            def __add__(self, other):
+                time.sleep(0.0001)
+                return SlowVersion(int(self) + other)
+
+        stock = ConcurrentInventory([Mixer(f"Syrup {i}", 10_000, "", False) for i in range(8)])
+        stock.inventory.version = SlowVersion(stock.inventory.version)
+        start = stock.inventory.version
+        names = iter([f"Syrup {i}" for i in range(8)])
+
+        def worker() -> None:
+            name = next(names)
+            for _ in range(50):
+                stock.reserve(name, 1)
+
+        run_threads(worker, 8)
+        self.assertEqual(stock.inventory.version, start + 8 * 50)
+
+    def test_rejects_bad_requests(self) -> None:
+        self.assertFalse(self.stock.reserve("gin", 0))
+        self.assertFalse(self.stock.reserve("missing", 1))
+        self.assertFalse(self.stock.restock("missing", 1))
+        self.assertFalse(self.stock.restock("gin", -1))
+        self.assertEqual(self.stock.check_stock("missing"), 0.0)
+
+    def test_reserve_waits_for_restock(self) -> None:
+        threading.Timer(0.05, self.stock.restock, ("lime juice", 30)).start()
+        self.assertTrue(self.stock.reserve("Lime Juice", 20, timeout=5))
+        self.assertEqual(self.stock.check_stock("lime juice"), 10)
+
+    def test_reserve_times_out(self) -> None:
+        start = time.monotonic()
+        self.assertFalse(self.stock.reserve("Lime Juice", 20, timeout=0.05))
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_shares_stripes_with_serve_orders(self) -> None:
+        recipes = [{"name": "Shot", "ingredients": [{"name": "Gin", "amount": 10}]}]
+        served = []
+
+        def orders() -> None:
+            served.extend(serve_orders(self.stock.inventory, recipes, [("Shot", 1)] * 20))
+
+        def reservations() -> None:
+            served.extend(self.stock.reserve("gin", 10) for _ in range(20))
+
+        threads = [threading.Thread(target=orders if i % 2 else reservations) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(served), 100)
+        self.assertEqual(self.stock.check_stock("gin"), 0)
+
+    def test_structural_changes(self) -> None:
+        self.stock.add(Mixer("Soda Water", 5, "", True))
+        self.assertEqual(len(self.stock), 3)
+        self.assertEqual(self.stock.remove("club soda").name, "Soda Water")
+        self.assertEqual([item.name for item in self.stock], ["Gin", "Lime Juice"])
+
+
+class ReserveAsyncTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stock = ConcurrentInventory([Mixer("Lime Juice", 0, "", False)])
+
+    def test_wakes_on_restock_from_another_thread(self) -> None:
+        async def scenario() -> bool:
+            threading.Timer(0.05, self.stock.restock, ("lime juice", 30)).start()
+            return await self.stock.reserve_async("Lime Juice", 20, timeout=5)
+
+        self.assertTrue(asyncio.run(scenario()))
+        self.assertEqual(self.stock.check_stock("lime juice"), 10)
+        self.assertEqual(self.stock._async_waiters, {})
+
+    def test_many_waiters_share_a_restock(self) -> None:
+        async def scenario():
+            waiters = [asyncio.ensure_future(self.stock.reserve_async("lime juice", 10, timeout=0.2)) for _ in range(5)]
+            await asyncio.sleep(0.01)
+            self.stock.restock("lime juice", 30)
+            return await asyncio.gather(*waiters)
+
+        self.assertEqual(sorted(asyncio.run(scenario())), [False, False, True, True, True])
+        self.assertEqual(self.stock.check_stock("lime juice"), 0)
+
+    def test_timeout_returns_false(self) -> None:
+        self.assertFalse(asyncio.run(self.stock.reserve_async("lime juice", 10, timeout=0.02)))
+        self.assertFalse(asyncio.run(self.stock.reserve_async("missing", 10)))
+        self.assertEqual(self.stock._async_waiters, {})
+
+    def test_cancellation_never_consumes_stock(self) -> None:
+        async def scenario() -> None:
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(self.stock.reserve_async("lime juice", 10), 0.02)
+            self.stock.restock("lime juice", 10)
+            await asyncio.sleep(0.01)
+
+        asyncio.run(scenario())
+        self.assertEqual(self.stock.check_stock("lime juice"), 10)
+        self.assertEqual(self.stock._async_waiters, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
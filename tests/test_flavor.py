@@ -0,0 +1,89 @@
+"""Tests for pymixology.recommendation.flavor."""
+
+from __future__ import annotations
+
+import math
+import random
+import unittest
+
+from benchmarks.generators import synthetic_recipes
+from pymixology.recommendation.flavor import FLAVOR_DIMENSIONS, FlavorIndex, flavor_vector, rank_by_flavor_profile
+
+
+def brute_force(recipes, profile, k):
+    """Reference top-k: score every recipe, keep positive scores, ties broken by catalog order."""
+    weights = [profile.get(dimension, 0) for dimension in FLAVOR_DIMENSIONS]
+    scored = []
+    for rid, recipe in enumerate(recipes):
+        score = sum(w * v for w, v in zip(weights, flavor_vector(recipe)))
+        if score > 0:
+            scored.append((-score, rid, recipe["name"]))
+    return [(name, -negative) for negative, _, name in sorted(scored)[:k]]
+
+
+class FlavorIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.recipes = synthetic_recipes(3000)
+        cls.index = FlavorIndex(cls.recipes)
+
+    def assert_same_ranking(self, got, expected) -> None:
+        self.assertEqual([name for name, _ in got], [name for name, _ in expected])
+        for (_, score), (_, want) in zip(got, expected):
+            self.assertAlmostEqual(score, want)
+
+    def test_vectors_are_unit_length(self) -> None:
+        for index in range(0, len(self.recipes), 97):
+            vector = self.index.vector(index)
+            self.assertAlmostEqual(math.sqrt(sum(value * value for value in vector)), 1.0)
+            self.assertEqual(vector, flavor_vector(self.recipes[index]))
+        self.assertEqual(flavor_vector({"name": "Nothing"}), (0.0, 0.0, 0.0, 0.0))
+
+    def test_keywords_match_whole_words(self) -> None:
+        mule = {
+            "name": "Moscow Mule",
+            "ingredients": [
+                {"name": "Vodka", "amount": 45, "unit": "ml"},
+                {"name": "Ginger Beer", "amount": 120, "unit": "ml"},
+                {"name": "Lime Juice", "amount": 10, "unit": "ml"},
+            ],
+        }
+        # Only the vodka counts: 45 ml at 40% in 175 ml.
+        strong = min(45 * 0.40 / 175 / 0.30, 1.0)
+        sour = 10 / 175
+        norm = math.hypot(strong, sour)
+        for got, want in zip(flavor_vector(mule), (0.0, sour / norm, 0.0, strong / norm)):
+            self.assertAlmostEqual(got, want)
+        for name in ("Ginger Beer", "Ginger Ale", "Ginger Syrup"):
+            with self.subTest(name=name):
+                self.assertEqual(flavor_vector({"ingredients": [name, "Lime Juice"]})[3], 0.0)
+        self.assertEqual(flavor_vector({"ingredients": ["Old Tom Gin"]}), (0.0, 0.0, 0.0, 1.0))
+        self.assertGreater(flavor_vector({"ingredients": ["Triple Sec"]})[0], 0.0)
+
+    def test_top_k_matches_brute_force(self) -> None:
+        rng = random.Random(5)
+        profiles = [{"sweet": 4, "sour": 7, "bitter": 6, "strong": 8}, {"bitter": 1}, {"sweet": 10, "strong": 0}]
+        profiles += [{dimension: rng.randint(0, 10) for dimension in FLAVOR_DIMENSIONS} for _ in range(10)]
+        for profile in profiles:
+            for k in (1, 10, 250):
+                with self.subTest(profile=profile, k=k):
+                    self.assert_same_ranking(self.index.top_k(profile, k), brute_force(self.recipes, profile, k))
+
+    def test_negative_weights_fall_back_to_a_scan(self) -> None:
+        profile = {"sweet": -5, "sour": 3, "bitter": 0, "strong": 2}
+        self.assert_same_ranking(self.index.top_k(profile, 20), brute_force(self.recipes, profile, 20))
+
+    def test_empty_results(self) -> None:
+        self.assertEqual(self.index.top_k({"sweet": 5}, 0), [])
+        self.assertEqual(self.index.top_k({}, 5), [])
+        self.assertEqual(FlavorIndex([]).top_k({"sweet": 5}, 5), [])
+
+    def test_rank_by_flavor_profile(self) -> None:
+        profile = {"sour": 9, "sweet": 2}
+        expected = [name for name, _ in brute_force(self.recipes, profile, 5)]
+        self.assertEqual(rank_by_flavor_profile(profile, self.recipes, 5), expected)
+        self.assertEqual(rank_by_flavor_profile(profile, self.index, 5), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
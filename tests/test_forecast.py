@@ -0,0 +1,128 @@
+"""Tests for pymixology.inventory.forecast."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date, datetime, timedelta
+
+from pymixology.inventory.forecast import (
+    NEVER,
+    ExpiryIndex,
+    demand_from_orders,
+    demand_from_reviews,
+    expiry_day,
+    plan_shopping,
+    plan_shopping_batch,
+)
+from pymixology.inventory.items import Mixer, Spirit
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.recommendation.preference import ReviewStore
+
+TODAY = date(2026, 3, 1)
+
+RECIPES = [
+    {
+        "name": "Gimlet",
+        "ingredients": [
+            {"name": "Gin", "amount": 60, "unit": "ml"},
+            {"name": "Lime Juice", "amount": 20, "unit": "ml"},
+        ],
+    },
+    {"name": "Punch", "servings": 4, "ingredients": [{"name": "Dark Rum", "amount": 200}, "Ice"]},
+]
+
+
+def day(offset):
+    return (TODAY + timedelta(days=offset)).isoformat()
+
+
+def stock():
+    return [
+        Spirit("Gin", 300, day(2), 0.4),
+        Mixer("Fresh Lime Juice", 50, day(-1), False),
+        Spirit("Gin", 100, "", 0.4),
+        Mixer("Fresh Lime Juice", 100, day(10), False),
+    ]
+
+
+class ExpiryTest(unittest.TestCase):
+    def test_expiry_day(self) -> None:
+        self.assertEqual(expiry_day("2026-03-01"), TODAY.toordinal())
+        self.assertEqual(expiry_day(" 2026-03-01 "), TODAY.toordinal())
+        self.assertEqual(expiry_day(TODAY), TODAY.toordinal())
+        self.assertEqual(expiry_day(datetime(2026, 3, 1, 23, 59)), TODAY.toordinal())
+        for blank in ("", "  ", None):
+            self.assertEqual(expiry_day(blank), NEVER)
+        with self.assertRaises(ValueError):
+            expiry_day("next tuesday")
+
+    def test_index_orders_soonest_first_keeping_ties(self) -> None:
+        items = stock() + [Mixer("Tonic", 10, day(2), True)]
+        index = ExpiryIndex(items)
+        self.assertEqual(len(index), 5)
+        self.assertEqual(index.expired(TODAY), [items[1]])
+        self.assertEqual(index.expiring_by(day(2)), [items[1], items[0], items[4]])
+        self.assertEqual(index.expiring_by(day(1)), [items[1]])
+        lots = index.lots()
+        self.assertEqual([item for _, item in lots["gin"]], [items[0], items[2]])
+        self.assertEqual(lots["gin"][-1][0], NEVER)
+
+
+class DemandTest(unittest.TestCase):
+    def test_from_orders(self) -> None:
+        demand = demand_from_orders([("Gimlet", 4), (" gimlet ", 2), ("Punch", 1)], 2)
+        self.assertEqual(demand, {"gimlet": 3.0, "punch": 0.5})
+        with self.assertRaises(ValueError):
+            demand_from_orders([], 0)
+
+    def test_from_reviews(self) -> None:
+        self.assertEqual(demand_from_reviews({"Gimlet": 3, "Punch": 1, "Bad": 0}, 8), {"gimlet": 6.0, "punch": 2.0})
+        reviews = [{"cocktail": "Gimlet"}, {"cocktail": "Gimlet"}, {"cocktail": "Punch"}, {"rating": 5}]
+        self.assertEqual(demand_from_reviews(reviews, 6), {"gimlet": 4.0, "punch": 2.0})
+        with ReviewStore() as store:
+            store.add_many([("Gimlet", 5), ("Gimlet", 1), ("Punch", 3)])
+            self.assertEqual(demand_from_reviews(store, 6), {"gimlet": 4.0, "punch": 2.0})
+        self.assertEqual(demand_from_reviews({}, 6), {})
+        with self.assertRaises(TypeError):
+            demand_from_reviews("reviews", 6)
+
+
+class PlanShoppingTest(unittest.TestCase):
+    def test_fifo_with_expiry(self) -> None:
+        # Two Gimlets a day for five days need 600 ml gin and 200 ml lime juice.
+        # The gin lot expiring on day 2 can only cover 3 days (360 ml), so all 300 ml count;
+        # the undated lot adds 100. The lime lot that already expired is ignored.
+        plan = plan_shopping(stock(), RECIPES, {"gimlet": 2}, 5, today=TODAY)
+        self.assertEqual(plan, [("Fresh Lime Juice", 100.0), ("Gin", 200.0)])
+
+    def test_expiring_lot_only_covers_days_before_it_expires(self) -> None:
+        items = [Spirit("Gin", 10_000, day(0), 0.4)]
+        plan = plan_shopping(items, RECIPES[:1], {"gimlet": 1}, 3, today=TODAY)
+        self.assertEqual(plan[0], ("Lime Juice", 60.0))
+        self.assertEqual(plan[1], ("Gin", 120.0))
+
+    def test_unstocked_ingredients_use_recipe_names_and_servings(self) -> None:
+        plan = plan_shopping([], RECIPES, {"punch": 2, "unknown": 5}, 3, today=TODAY, safety_days=1)
+        self.assertEqual(plan, [("Dark Rum", 400.0)])
+
+    def test_covered_demand_needs_nothing(self) -> None:
+        items = [Spirit("Gin", 1000, "", 0.4), Mixer("Lime Juice", 1000, "", False)]
+        self.assertEqual(plan_shopping(items, RecipeCatalog(RECIPES), {"Gimlet": 1}, 10, today=TODAY), [])
+        self.assertEqual(plan_shopping(items, RECIPES, {"gimlet": 1}, 0, today=TODAY), [])
+        with self.assertRaises(ValueError):
+            plan_shopping(items, RECIPES, {"gimlet": 1}, -1, today=TODAY)
+
+    def test_batch_matches_single_venue_plans(self) -> None:
+        venues = {"north": stock(), "south": stock()[2:], "empty": []}
+        demand = {"north": {"gimlet": 2}, "south": {"gimlet": 1, "punch": 4}, "empty": {"punch": 1}}
+        plans = plan_shopping_batch(venues, RECIPES, demand, 7, today=TODAY, safety_days=2)
+        self.assertEqual(set(plans), set(venues))
+        for venue, items in venues.items():
+            with self.subTest(venue=venue):
+                self.assertEqual(
+                    plans[venue], plan_shopping(items, RECIPES, demand[venue], 7, today=TODAY, safety_days=2)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""Tests for pymixology.recipes.fuzzy."""
+
+from __future__ import annotations
+
+import random
+import unittest
+from pathlib import Path
+
+from pymixology.recipes.catalog import load_recipes
+from pymixology.recipes.fuzzy import (
+    INGREDIENT,
+    RECIPE,
+    FuzzyIndex,
+    edit_distance,
+    fuzzy_search_cocktail,
+    fuzzy_search_ingredient,
+    normalize_text,
+)
+
+DATA = Path(__file__).resolve().parent.parent / "pymixology" / "data" / "cocktails.json"
+
+
+def osa_distance(a, b):
+    """Unbounded optimal string alignment distance."""
+    rows = [[i + j if i * j == 0 else 0 for j in range(len(b) + 1)] for i in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            rows[i][j] = min(rows[i - 1][j] + 1, rows[i][j - 1] + 1, rows[i - 1][j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                rows[i][j] = min(rows[i][j], rows[i - 2][j - 2] + 1)
+    return rows[-1][-1]
+
+
+def word_distance(token, word, max_distance):
+    """Numeric words only match exactly; other words by OSA distance."""
+    if token.isdigit() or word.isdigit():
+        return 0 if token == word else max_distance + 1
+    return osa_distance(token, word)
+
+
+def brute_force(index, query, limit, kind=None, max_distance=2):
+    """Rank every indexed name by total per-word distance, then extra words, then insertion order."""
+    tokens = list(dict.fromkeys(normalize_text(query).split()))
+    ranked = []
+    for entry_id, (name, entry_kind, _) in enumerate(index._entries):
+        if kind is not None and entry_kind != kind:
+            continue
+        words = list(dict.fromkeys(normalize_text(name).split()))
+        total = 0
+        for token in tokens:
+            closest = min((word_distance(token, word, max_distance) for word in words), default=max_distance + 1)
+            if closest > max_distance:
+                break
+            total += closest
+        else:
+            ranked.append((total, len(words) - len(tokens), entry_id, name))
+    return [(name, total) for total, _, _, name in sorted(ranked)[:limit]] if tokens else []
+
+
+class EditDistanceTest(unittest.TestCase):
+    def test_exact_within_limit(self) -> None:
+        rng = random.Random(3)
+        for _ in range(2000):
+            a = "".join(rng.choice("abc") for _ in range(rng.randint(0, 6)))
+            b = "".join(rng.choice("abc") for _ in range(rng.randint(0, 6)))
+            limit = rng.randint(0, 3)
+            with self.subTest(a=a, b=b, limit=limit):
+                expected = osa_distance(a, b)
+                if expected <= limit:
+                    self.assertEqual(edit_distance(a, b, limit), expected)
+                else:
+                    self.assertGreater(edit_distance(a, b, limit), limit)
+
+    def test_transposition_counts_once(self) -> None:
+        self.assertEqual(edit_distance("mojtio", "mojito", 2), 1)
+        self.assertEqual(edit_distance("ca", "abc", 5), 3)
+
+    def test_normalize_text(self) -> None:
+        self.assertEqual(normalize_text("  Piña-Colada!! "), "pina colada")
+        self.assertEqual(normalize_text("CRÈME de Cassis"), "creme de cassis")
+
+
+class FuzzyIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.recipes = load_recipes(str(DATA))
+        cls.index = FuzzyIndex(cls.recipes)
+
+    def test_typos_find_the_recipe(self) -> None:
+        for query, expected in (("margarta", "Margarita"), ("mojtio", "Mojito"), ("NEGORNI", "Negroni")):
+            with self.subTest(query=query):
+                found = [recipe["name"] for recipe in fuzzy_search_cocktail(self.index, query, limit=1)]
+                if any(recipe["name"] == expected for recipe in self.recipes):
+                    self.assertEqual(found, [expected])
+
+    def test_matches_brute_force(self) -> None:
+        names = [name for name, _, _ in self.index._entries]
+        rng = random.Random(9)
+        queries = ["", "lime", "lmie juice", "gin", "sour mix", "xyzzy", "a", "old fashioned"]
+        for name in rng.sample(names, 20):
+            chars = list(normalize_text(name))
+            if chars:
+                position = rng.randrange(len(chars))
+                chars[position] = rng.choice("aeiou")
+            queries.append("".join(chars))
+        for query in queries:
+            for kind in (None, RECIPE, INGREDIENT):
+                with self.subTest(query=query, kind=kind):
+                    got = [(name, distance) for name, _, distance, _ in self.index.search(query, 5, kind)]
+                    self.assertEqual(got, brute_force(self.index, query, 5, kind))
+
+    def test_kind_filter_and_payloads(self) -> None:
+        for name, kind, _, payload in self.index.search("juice", 50, INGREDIENT):
+            self.assertEqual(kind, INGREDIENT)
+            self.assertEqual(payload, name)
+        recipes = fuzzy_search_cocktail(self.recipes, "martin", limit=3)
+        self.assertTrue(all(recipe in self.recipes for recipe in recipes))
+        by_list = fuzzy_search_ingredient(self.recipes, "lime juice")
+        self.assertEqual(by_list, fuzzy_search_ingredient(self.index, "lime juice"))
+
+    def test_numbers_match_exactly(self) -> None:
+        index = FuzzyIndex([{"name": "Punch 1990"}, {"name": "Punch 1991"}, {"name": "Punch"}])
+        self.assertEqual([name for name, _, _, _ in index.search("punch 1990")], ["Punch 1990"])
+        self.assertEqual(index.search("punch 1999"), [])
+        self.assertEqual([name for name, _, _, _ in index.search("pnch")], ["Punch", "Punch 1990", "Punch 1991"])
+
+    def test_limits(self) -> None:
+        self.assertEqual(self.index.search("lime", 0), [])
+        self.assertEqual(FuzzyIndex(self.recipes, max_distance=0).search("lmie"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
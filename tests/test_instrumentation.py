@@ -0,0 +1,104 @@
+"""Tests for pymixology.instrumentation."""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+
+from pymixology import instrumentation
+from pymixology.instrumentation import InMemorySink, LogSink, PrometheusFileSink, Sink, instrument, profile_block
+from pymixology.inventory.items import Spirit
+from pymixology.inventory.manager import Inventory, check_stock
+from pymixology.recipes.catalog import RecipeCatalog, search_cocktail
+
+RECIPES = [{"name": "Martini"}, {"name": "Mojito"}, {"name": "Manhattan"}]
+
+
+@instrument(name="tests.count", scans="items")
+def count(items, extra=0):
+    return sum(1 for _ in items) + extra
+
+
+class InstrumentTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sink = InMemorySink()
+        instrumentation.enable(self.sink)
+        self.addCleanup(instrumentation.disable)
+
+    def test_records_calls_and_items_scanned(self) -> None:
+        self.assertTrue(instrumentation.is_enabled())
+        count([1, 2, 3])
+        count(items=[1], extra=1)
+        count(iter([1, 2]))
+        stats = self.sink.snapshot()["tests.count"]
+        self.assertEqual(stats["calls"], 3)
+        self.assertEqual(stats["items_scanned"], 4)
+        self.assertEqual(sum(stats["buckets"].values()), 3)
+
+    def test_index_fast_paths_report_zero_scanned(self) -> None:
+        search_cocktail(RECIPES, "ma")
+        search_cocktail(RecipeCatalog(RECIPES), "ma")
+        items = [Spirit("Gin", 700, "", 0.4), Spirit("Rum", 700, "", 0.4)]
+        check_stock(items, "gin")
+        check_stock(Inventory(items), "gin")
+        stats = self.sink.snapshot()
+        self.assertEqual(stats["pymixology.recipes.catalog.search_cocktail"]["calls"], 2)
+        self.assertEqual(stats["pymixology.recipes.catalog.search_cocktail"]["items_scanned"], len(RECIPES))
+        self.assertEqual(stats["pymixology.inventory.manager.check_stock"]["items_scanned"], 2)
+
+    def test_disabled_calls_are_not_recorded(self) -> None:
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual(count([1, 2]), 2)
+        self.assertEqual(self.sink.snapshot(), {})
+
+    def test_exceptions_are_still_recorded(self) -> None:
+        with self.assertRaises(TypeError):
+            count(None)
+        self.assertEqual(self.sink.snapshot()["tests.count"]["calls"], 1)
+
+    def test_every_sink_receives_records(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "metrics.prom"
+            prometheus = PrometheusFileSink(str(path))
+            logger = logging.getLogger("tests.instrumentation")
+            instrumentation.enable(self.sink, prometheus, LogSink(logger, logging.INFO))
+            with self.assertLogs(logger, logging.INFO) as logs:
+                count([1, 2])
+            instrumentation.disable()
+            self.assertIn("tests.count took", logs.output[0])
+            text = path.read_text(encoding="utf-8")
+            instrumentation.enable(self.sink)
+        self.assertIn('pymixology_items_scanned_total{function="tests.count"} 2', text)
+        self.assertIn('pymixology_call_seconds_bucket{function="tests.count",le="+Inf"} 1', text)
+        self.assertEqual(self.sink.snapshot()["tests.count"]["calls"], 1)
+
+    def test_sink_is_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            Sink()
+
+    def test_default_sink(self) -> None:
+        sinks = instrumentation.enable()
+        self.assertEqual(len(sinks), 1)
+        self.assertIsInstance(sinks[0], InMemorySink)
+
+
+class ProfileBlockTest(unittest.TestCase):
+    def test_captures_cpu_and_memory(self) -> None:
+        with profile_block() as result:
+            sorted(str(i) for i in range(20000))
+        self.assertIn("function calls", result.stats())
+        self.assertTrue(result.top_allocations(3))
+        self.assertGreater(result.peak_bytes, 0)
+
+    def test_can_skip_either_part(self) -> None:
+        with profile_block(cpu=False, memory=False) as result:
+            pass
+        self.assertEqual(result.stats(), "")
+        self.assertEqual(result.top_allocations(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
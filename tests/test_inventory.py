@@ -0,0 +1,138 @@
+"""Tests for pymixology.inventory.items and pymixology.inventory.manager."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+import unittest
+
+from benchmarks.generators import synthetic_inventory
+from pymixology.inventory.items import Ingredient, Mixer, Spirit
+from pymixology.inventory.manager import (
+    Inventory,
+    add_item,
+    check_stock,
+    get_shopping_list,
+    remove_item,
+    total_value,
+)
+
+
+class InventoryParityTest(unittest.TestCase):
+    """Every manager function gives the same answer for a list and an Inventory."""
+
+    def setUp(self) -> None:
+        self.items = synthetic_inventory(300)
+        self.inventories = {
+            "plain": Inventory(synthetic_inventory(300)),
+            "columnar": Inventory(synthetic_inventory(300), columnar=True),
+        }
+
+    def assert_parity(self) -> None:
+        for label, inventory in self.inventories.items():
+            with self.subTest(inventory=label):
+                self.assertEqual([item.name for item in inventory], [item.name for item in self.items])
+                for name in ("Gin", "gin", "Ingredient 42", "Ingredient 43", "Missing"):
+                    self.assertEqual(check_stock(inventory, name), check_stock(self.items, name))
+                for threshold in (0, 51, 1000, 10_000):
+                    self.assertEqual(get_shopping_list(inventory, threshold), get_shopping_list(self.items, threshold))
+                self.assertAlmostEqual(total_value(inventory), total_value(self.items))
+
+    def test_initial_state(self) -> None:
+        self.assert_parity()
+
+    def test_quantity_changes(self) -> None:
+        for target in [self.items, *self.inventories.values()]:
+            for i, item in enumerate(target):
+                if i % 4 == 0:
+                    item.use(min(item.quantity, 25))
+                elif i % 4 == 1:
+                    item.quantity = i * 3.5
+        self.assert_parity()
+
+    def test_add_and_remove(self) -> None:
+        for target in [self.items, *self.inventories.values()]:
+            self.assertTrue(remove_item(target, "GIN"))
+            self.assertFalse(remove_item(target, "Missing"))
+            add_item(target, Mixer("Tonic Water", 80, "2030-01-01", True, value=8))
+            add_item(target, Spirit("Gin", 300, "2030-01-01", 0.47, value=30))
+        self.assert_parity()
+
+    def test_value_changes_reach_the_columns(self) -> None:
+        for target in [self.items, *self.inventories.values()]:
+            for item in target:
+                item.unit_value = item.unit_value * 2 + 1
+        self.assert_parity()
+
+    def test_add_item_rejects_non_ingredients(self) -> None:
+        for target in [self.items, *self.inventories.values()]:
+            with self.assertRaises(TypeError):
+                add_item(target, "Gin")
+
+
+class InventoryTest(unittest.TestCase):
+    def test_name_lookup_is_canonical(self) -> None:
+        inventory = Inventory([Mixer("Fresh  Lime Juice", 100, "2030-01-01", False)])
+        self.assertIn("lime juice", inventory)
+        self.assertIs(inventory.get("LIME JUICE"), inventory.get("fresh lime juice"))
+        self.assertNotIn(42, inventory)
+
+    def test_items_belong_to_one_inventory(self) -> None:
+        item = Ingredient("Salt", 10, "")
+        first = Inventory([item])
+        with self.assertRaises(ValueError):
+            Inventory([item])
+        first.remove("salt")
+        Inventory([item])
+
+    def test_removed_items_stop_reporting(self) -> None:
+        inventory = Inventory([Spirit("Rum", 10, "", 0.4, value=20)], columnar=True)
+        item = inventory.remove("rum")
+        version = inventory.version
+        item.quantity = 99
+        item.abv = 0.5
+        self.assertEqual(inventory.version, version)
+        self.assertEqual(inventory.total_value(), 0)
+
+    def test_copies_are_detached(self) -> None:
+        for columnar in (False, True):
+            inventory = Inventory([Spirit("Gin", 700, "2027-01-01", 0.4, value=35)], columnar=columnar)
+            gin = inventory.get("gin")
+            version = inventory.version
+            for clone in (copy.copy(gin), copy.deepcopy(gin), pickle.loads(pickle.dumps(gin))):
+                with self.subTest(columnar=columnar, clone=clone):
+                    self.assertIsNot(clone, gin)
+                    self.assertEqual((clone.name, clone.key, clone.quantity, clone.abv), ("Gin", "gin", 700, 0.4))
+                    self.assertEqual((clone.unit_value, clone.expiry_date), (gin.unit_value, "2027-01-01"))
+                    clone.quantity = 1
+                    clone.unit_value = 2.0
+                    clone.name = "Old Tom"
+                    self.assertEqual(inventory.version, version)
+                    self.assertEqual(inventory.total_value(), 35)
+                    Inventory([clone])
+
+    def test_version_and_last_changed(self) -> None:
+        inventory = Inventory([Spirit("Gin", 700, "", 0.4), Mixer("Tonic", 500, "", True)])
+        gin_version = inventory.last_changed("gin")
+        tonic = inventory.get("tonic")
+        tonic.use(100)
+        self.assertEqual(inventory.last_changed("gin"), gin_version)
+        self.assertEqual(inventory.last_changed("TONIC"), inventory.version)
+        self.assertEqual(inventory.last_changed("missing"), 0)
+
+    def test_columnar_below_keeps_insertion_order(self) -> None:
+        items = [Mixer(f"Syrup {i}", (i * 37) % 100, "", False) for i in range(50)]
+        inventory = Inventory(items, columnar=True)
+        inventory.remove("Syrup 3")
+        inventory.remove("Syrup 10")
+        expected = [item for item in items if item.quantity < 50 and item.name not in ("Syrup 3", "Syrup 10")]
+        self.assertEqual(inventory.below(50), expected)
+
+    def test_slots(self) -> None:
+        for item in (Ingredient("Salt", 1, ""), Spirit("Gin", 1, "", 0.4), Mixer("Soda", 1, "", True)):
+            with self.subTest(item=type(item).__name__):
+                self.assertFalse(hasattr(item, "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""Tests for pymixology.inventory.journal."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pymixology.inventory.items import Ingredient, Mixer, Spirit
+from pymixology.inventory.journal import InventoryJournal
+
+
+class Clock:
+    """Deterministic clock advanced by hand."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def state(inventory):
+    return {
+        item.name: (type(item).__name__, item.quantity, item.unit_value, item.expiry_date, getattr(item, "abv", None))
+        for item in inventory
+    }
+
+
+class JournalTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.clock = Clock()
+
+    def open(self, **kwargs) -> InventoryJournal:
+        journal = InventoryJournal(self.dir, clock=self.clock, **kwargs)
+        self.addCleanup(journal.close)
+        return journal
+
+    def populate(self, journal) -> None:
+        inventory = journal.inventory
+        inventory.add(Spirit("Gin", 700, "2027-01-01", 0.4, value=35))
+        inventory.add(Mixer("Tonic", 1000, "", True, value=4))
+        inventory.add(Ingredient("Mint", 20, "2026-11-01"))
+        inventory.get("gin").quantity -= 60
+        inventory.get("tonic").quantity = 880
+        inventory.remove("mint")
+
+    def test_reopen_recovers_state(self) -> None:
+        with InventoryJournal(self.dir, clock=self.clock) as journal:
+            self.populate(journal)
+            expected = state(journal.inventory)
+            events = journal.events
+        journal = self.open()
+        self.assertEqual(state(journal.inventory), expected)
+        self.assertEqual(journal.events, events)
+        journal.inventory.add(Mixer("Soda Water", 500, "", True))
+        self.assertEqual(journal.inventory.item_id(journal.inventory.get("soda water")), 3)
+
+    def test_torn_tail_is_dropped(self) -> None:
+        with InventoryJournal(self.dir, clock=self.clock) as journal:
+            self.populate(journal)
+            expected = state(journal.inventory)
+        path = self.dir / "journal.log"
+        size = path.stat().st_size
+        for tail in (b"\x01", b"\x00" * 40, b"garbage that is long enough to look like a record header"):
+            with self.subTest(tail=tail):
+                with open(path, "ab") as handle:
+                    handle.write(tail)
+                with InventoryJournal(self.dir, clock=self.clock) as journal:
+                    self.assertEqual(state(journal.inventory), expected)
+                self.assertEqual(path.stat().st_size, size)
+
+    def test_corrupt_last_record_is_dropped_and_writes_continue(self) -> None:
+        with InventoryJournal(self.dir, clock=self.clock) as journal:
+            self.populate(journal)
+            expected = state(journal.inventory)
+            journal.inventory.get("gin").quantity = 1
+        path = self.dir / "journal.log"
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+        with InventoryJournal(self.dir, clock=self.clock) as journal:
+            self.assertEqual(state(journal.inventory), expected)
+            journal.inventory.get("gin").quantity = 2
+        journal = self.open()
+        self.assertEqual(journal.inventory.get("gin").quantity, 2)
+
+    def test_snapshots_and_replay(self) -> None:
+        with InventoryJournal(self.dir, clock=self.clock, sync_every=3, snapshot_every=4) as journal:
+            self.populate(journal)
+            for quantity in range(10):
+                journal.inventory.get("gin").quantity = quantity
+            expected = state(journal.inventory)
+            events = journal.events
+        snapshots = [path.name for path in self.dir.glob("snapshot-*.bin")]
+        self.assertEqual(snapshots, [f"snapshot-{events // 4 * 4:016d}.bin"])
+        journal = self.open(sync_every=3, snapshot_every=4)
+        self.assertEqual(state(journal.inventory), expected)
+        self.assertEqual(journal.events, events)
+
+    def test_value_and_expiry_changes_survive_reopen(self) -> None:
+        with InventoryJournal(self.dir, clock=self.clock) as journal:
+            self.populate(journal)
+            gin, tonic = journal.inventory.get("gin"), journal.inventory.get("tonic")
+            gin.unit_value = 1.0
+            gin.abv = 0.47
+            gin.expiry_date = "2030-01-01"
+            tonic.is_carbonated = False
+            expected = state(journal.inventory)
+            total = journal.inventory.total_value()
+        journal = self.open()
+        self.assertEqual(state(journal.inventory), expected)
+        self.assertFalse(journal.inventory.get("tonic").is_fizzy())
+        self.assertEqual(journal.inventory.total_value(), total)
+
+    def test_unreadable_snapshot_falls_back(self) -> None:
+        with InventoryJournal(self.dir, clock=self.clock) as journal:
+            self.populate(journal)
+            journal.snapshot()
+            journal.inventory.get("gin").quantity = 5
+            expected = state(journal.inventory)
+            newest = journal.snapshot()
+        newest.write_bytes(b"PMXS broken")
+        journal = self.open()
+        self.assertEqual(state(journal.inventory), expected)
+
+    def test_state_at(self) -> None:
+        journal = self.open(snapshot_every=3)
+        inventory = journal.inventory
+        history = []
+        for step in range(12):
+            self.clock.now = 1000.0 + step
+            if step == 0:
+                inventory.add(Spirit("Gin", 700, "", 0.4, value=35))
+            elif step == 5:
+                inventory.add(Mixer("Tonic", 1000, "", True))
+            elif step == 9:
+                inventory.remove("tonic")
+            else:
+                inventory.get("gin").quantity -= 10
+            history.append((self.clock.now, state(inventory)))
+        self.assertEqual(state(journal.state_at(999.0)), {})
+        for stamp, expected in history:
+            with self.subTest(stamp=stamp):
+                self.assertEqual(state(journal.state_at(stamp)), expected)
+                self.assertEqual(state(journal.state_at(stamp + 0.5)), expected)
+        when = datetime.fromtimestamp(1004.0, tz=timezone.utc)
+        self.assertEqual(state(journal.state_at(when)), history[4][1])
+        detached = journal.state_at(1003.0)
+        detached.get("gin").quantity = 0
+        self.assertEqual(inventory.get("gin").quantity, 610)
+
+    def test_clock_never_goes_backwards(self) -> None:
+        journal = self.open()
+        journal.inventory.add(Spirit("Gin", 700, "", 0.4))
+        self.clock.now = 500.0
+        journal.inventory.get("gin").quantity = 1
+        self.assertEqual(journal.state_at(1000.0).get("gin").quantity, 1)
+
+    def test_rejects_bad_files_and_settings(self) -> None:
+        with self.assertRaises(ValueError):
+            InventoryJournal(self.dir, sync_every=0)
+        with self.assertRaises(ValueError):
+            InventoryJournal(self.dir, snapshot_every=0)
+        (self.dir / "journal.log").write_bytes(b"NOPE\x01\x00\x00\x00")
+        with self.assertRaises(ValueError):
+            InventoryJournal(self.dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
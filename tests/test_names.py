@@ -0,0 +1,73 @@
+"""Tests for pymixology.names."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+
+from pymixology import names
+from pymixology.inventory.items import Mixer, Spirit
+from pymixology.inventory.journal import InventoryJournal
+from pymixology.inventory.manager import Inventory
+from pymixology.names import canonical_name, register_alias
+
+
+class CanonicalNameTest(unittest.TestCase):
+    def test_folds_case_accents_whitespace_and_aliases(self) -> None:
+        for raw in ("Lime Juice", "  fresh   LIME juice ", "Fresh Lime Juice"):
+            with self.subTest(raw=raw):
+                self.assertEqual(canonical_name(raw), "lime juice")
+        self.assertEqual(canonical_name("Crème de Cassis"), "creme de cassis")
+        self.assertEqual(canonical_name("Club Soda"), canonical_name("sparkling water"))
+
+    def test_returns_one_interned_object(self) -> None:
+        self.assertIs(canonical_name("Fresh Lime Juice"), canonical_name("lime " + "juice"))
+
+    def test_cache_is_bounded(self) -> None:
+        self.assertEqual(canonical_name.cache_info().maxsize, names._CACHE_SIZE)
+
+    def test_register_alias_clears_cached_names(self) -> None:
+        self.addCleanup(canonical_name.cache_clear)
+        self.addCleanup(names.ALIASES.pop, "house gin", None)
+        self.assertEqual(canonical_name("House Gin"), "house gin")
+        register_alias("House  Gin", "Gin")
+        self.assertEqual(canonical_name("House Gin"), "gin")
+        register_alias("Gin", "gin")
+        self.assertNotIn("gin", names.ALIASES)
+
+
+class RenameTest(unittest.TestCase):
+    def test_rename_rekeys_the_inventory(self) -> None:
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                inventory = Inventory([Spirit("Gin", 700, "", 0.4), Mixer("Tonic", 200, "", True)], columnar=columnar)
+                version = inventory.version
+                item = inventory.get("gin")
+                item.name = "Fresh Lime Juice"
+                self.assertEqual(item.key, "lime juice")
+                self.assertIsNone(inventory.get("gin"))
+                self.assertIs(inventory.get("lime juice"), item)
+                self.assertGreater(inventory.last_changed("gin"), version)
+                self.assertGreater(inventory.last_changed("lime juice"), version)
+                self.assertEqual([i.name for i in inventory.below(1000)], ["Fresh Lime Juice", "Tonic"])
+
+    def test_detached_items_rename_freely(self) -> None:
+        item = Spirit("Gin", 700, "", 0.4)
+        item.name = "Rye Whiskey"
+        self.assertEqual((item.name, item.key), ("Rye Whiskey", "rye"))
+
+    def test_rename_survives_journal_replay(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            with InventoryJournal(tmp) as journal:
+                journal.inventory.add(Spirit("Gin", 700, "", 0.4))
+                journal.inventory.get("gin").name = "Bourbon Whiskey"
+                journal.inventory.get("bourbon").quantity = 650
+            with InventoryJournal(tmp) as journal:
+                self.assertIsNone(journal.inventory.get("gin"))
+                item = journal.inventory.get("bourbon")
+                self.assertEqual((item.name, item.quantity, item.abv), ("Bourbon Whiskey", 650, 0.4))
+                self.assertEqual(len(journal.inventory), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Tests for pymixology.inventory.orders."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+
+from pymixology.inventory.items import Mixer, Spirit
+from pymixology.inventory.manager import Inventory
+from pymixology.inventory.orders import serve_orders
+from pymixology.recipes.catalog import RecipeCatalog
+
+RECIPES = [
+    {
+        "name": "Gimlet",
+        "ingredients": [
+            {"name": "Gin", "amount": 60, "unit": "ml"},
+            {"name": "Lime Juice", "amount": 20, "unit": "ml"},
+        ],
+    },
+    {
+        "name": "Punch",
+        "servings": 4,
+        "ingredients": [
+            {"name": "Rum", "amount": 200, "unit": "ml"},
+            {"name": "Lime Juice", "amount": 80, "unit": "ml"},
+        ],
+    },
+    {"name": "Gin Neat", "ingredients": [{"name": "Gin", "amount": 60, "unit": "ml"}, "Ice"]},
+    {"name": "Nothing", "ingredients": []},
+]
+
+
+def stock():
+    return [
+        Spirit("Gin", 150, "", 0.4),
+        Spirit("Rum", 500, "", 0.4),
+        Mixer("Fresh Lime Juice", 100, "", False),
+        Mixer("Ice", 0, "", False),
+    ]
+
+
+class ServeOrdersTest(unittest.TestCase):
+    def quantities(self, items):
+        return {item.name: item.quantity for item in items}
+
+    def test_fulfils_in_order_and_deducts_totals(self) -> None:
+        items = stock()
+        result = serve_orders(items, RECIPES, [("Gimlet", 1), ("gimlet", 1), ("Gimlet", 1)])
+        self.assertEqual(result, [True, True, False])
+        self.assertEqual(self.quantities(items), {"Gin": 30, "Rum": 500, "Fresh Lime Juice": 60, "Ice": 0})
+
+    def test_scales_by_recipe_servings(self) -> None:
+        items = stock()
+        self.assertEqual(serve_orders(items, RECIPES, [("Punch", 2)]), [True])
+        self.assertEqual(self.quantities(items)["Rum"], 400)
+        self.assertEqual(self.quantities(items)["Fresh Lime Juice"], 60)
+
+    def test_failed_order_leaves_no_partial_deduction(self) -> None:
+        items = stock()
+        # Gin is available but the lime runs out, so nothing of the second Gimlet is taken.
+        self.assertEqual(serve_orders(items, RECIPES, [("Punch", 5), ("Gimlet", 1)]), [True, False])
+        self.assertEqual(self.quantities(items)["Gin"], 150)
+
+    def test_unknown_recipes_and_missing_items(self) -> None:
+        items = stock()[:3]
+        self.assertEqual(serve_orders(items, RECIPES, [("Unknown", 1), ("Nothing", 1), ("Gin Neat", 1)]), [False] * 3)
+        self.assertEqual(self.quantities(items), self.quantities(stock()[:3]))
+
+    def test_unmeasured_ingredients_only_need_to_exist(self) -> None:
+        items = stock()
+        self.assertEqual(serve_orders(items, RECIPES, [("Gin Neat", 2)]), [True])
+        self.assertEqual(self.quantities(items)["Ice"], 0)
+
+    def test_all_or_nothing(self) -> None:
+        items = stock()
+        served = serve_orders(items, RECIPES, [("Gimlet", 1), ("Gimlet", 5)], all_or_nothing=True)
+        self.assertEqual(served, [False, False])
+        self.assertEqual(self.quantities(items), self.quantities(stock()))
+        served = serve_orders(items, RECIPES, [("Gimlet", 1), ("Gimlet", 1)], all_or_nothing=True)
+        self.assertEqual(served, [True, True])
+
+    def test_rejects_non_positive_servings(self) -> None:
+        with self.assertRaises(ValueError):
+            serve_orders(stock(), RECIPES, [("Gimlet", 1), ("Gimlet", 0)])
+
+    def test_indexed_inputs_match_lists(self) -> None:
+        orders = [("Gimlet", 1), ("Punch", 3), ("Gin Neat", 1), ("Gimlet", 1), ("Unknown", 1)]
+        items = stock()
+        expected = serve_orders(items, RECIPES, orders)
+        inventory = Inventory(stock(), columnar=True)
+        self.assertEqual(serve_orders(inventory, RecipeCatalog(RECIPES), orders), expected)
+        self.assertEqual(self.quantities(inventory), self.quantities(items))
+        self.assertEqual(inventory.total_value(), sum(item.current_value() for item in items))
+
+    def test_concurrent_batches_never_oversell(self) -> None:
+        inventory = Inventory([Spirit("Gin", 6000, "", 0.4), Mixer("Lime Juice", 100_000, "", False)])
+        results = []
+
+        def worker() -> None:
+            results.extend(serve_orders(inventory, RECIPES, [("Gimlet", 1)] * 25))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(results), 100)
+        self.assertEqual(inventory.get("gin").quantity, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
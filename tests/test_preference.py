@@ -0,0 +1,169 @@
+"""Tests for pymixology.recommendation.preference."""
+
+from __future__ import annotations
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.generators import synthetic_recipes
+from pymixology.recommendation.flavor import FlavorIndex, rank_by_flavor_profile
+from pymixology.recommendation.preference import (
+    ProfileRegistry,
+    ReviewStore,
+    get_top_favorites,
+    record_review,
+    resolve_profile,
+    set_flavor_profile,
+)
+from pymixology.recommendation.suggester import recommend_by_flavor
+
+
+class ReviewStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = ReviewStore()
+        self.addCleanup(self.store.close)
+
+    def test_aggregates(self) -> None:
+        self.store.add_many([("Martini", 5), ("Martini", 4), ("Mojito", 3)])
+        record_review(self.store, "Mojito", "5")
+        self.assertEqual(self.store.stats("Martini"), (2, 4.5))
+        self.assertEqual(self.store.stats("Mojito"), (2, 4.0))
+        self.assertIsNone(self.store.stats("Negroni"))
+        self.assertEqual(self.store.counts(), {"Martini": 2, "Mojito": 2})
+        self.assertEqual(self.store.means(), {"Martini": 4.5, "Mojito": 4.0})
+
+    def test_top_orders_by_mean_then_count_then_name(self) -> None:
+        self.store.add_many([("B", 4), ("A", 4), ("C", 4), ("C", 4), ("D", 5), ("E", 1)])
+        self.assertEqual(self.store.top(10), [("D", 5.0), ("C", 4.0), ("A", 4.0), ("B", 4.0), ("E", 1.0)])
+        self.assertEqual(get_top_favorites(self.store, 2), ["D", "C"])
+        self.assertEqual(get_top_favorites(self.store, 0), [])
+        self.assertEqual(get_top_favorites(self.store, -1), [])
+
+    def test_top_matches_a_full_sort(self) -> None:
+        rng = random.Random(11)
+        ratings = [(f"Cocktail {rng.randrange(300)}", rng.randint(1, 5)) for _ in range(5000)]
+        self.store.add_many(ratings)
+        totals = {}
+        for name, rating in ratings:
+            count, total = totals.get(name, (0, 0))
+            totals[name] = (count + 1, total + rating)
+        expected = sorted(totals, key=lambda name: (-totals[name][1] / totals[name][0], -totals[name][0], name))
+        self.assertEqual(get_top_favorites(self.store, 25), expected[:25])
+
+    def test_survives_reopening(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "reviews.db")
+            with ReviewStore(path) as store:
+                store.add_many([("Martini", 5), ("Martini", 3)])
+            with ReviewStore(path) as store:
+                store.add("Martini", 4)
+                self.assertEqual(store.stats("Martini"), (3, 4.0))
+
+
+class TopFavoritesTest(unittest.TestCase):
+    def test_dict_and_list_keep_stable_tie_order(self) -> None:
+        ratings = {"A": 3, "B": 5, "C": 4, "D": 5, "E": 1}
+        expected = [name for name, _ in sorted(ratings.items(), key=lambda item: item[1], reverse=True)]
+        reviews = []
+        for name, rating in ratings.items():
+            record_review(reviews, name, rating)
+        for top_n in (0, 1, 3, 10):
+            with self.subTest(top_n=top_n):
+                self.assertEqual(get_top_favorites(ratings, top_n), expected[:top_n])
+                self.assertEqual(get_top_favorites(reviews, top_n), expected[:top_n])
+
+    def test_rejects_other_containers(self) -> None:
+        with self.assertRaises(TypeError):
+            get_top_favorites("reviews")
+        with self.assertRaises(TypeError):
+            record_review(("reviews",), "Martini", 5)
+
+
+class ProfileRegistryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = ProfileRegistry(cache_size=3)
+        self.addCleanup(self.registry.close)
+
+    def test_set_normalizes_and_get_returns_it(self) -> None:
+        stored = self.registry.set("ana", {"sweet": "7", "strong": 2.0, "umami": 9})
+        self.assertEqual(stored, {"sweet": 7, "sour": 0, "bitter": 0, "strong": 2})
+        self.assertEqual(self.registry.get("ana"), stored)
+        self.assertIn("ana", self.registry)
+        self.assertNotIn("bo", self.registry)
+        self.assertNotIn(5, self.registry)
+        self.assertIsNone(self.registry.get("bo"))
+
+    def test_returned_profiles_are_copies(self) -> None:
+        self.registry.set("ana", {"sweet": 7})["sweet"] = 0
+        self.registry.get("ana")["sour"] = 9
+        self.registry.load_many(["ana"])["ana"]["bitter"] = 9
+        self.registry._cache.clear()
+        self.registry.get("ana")["strong"] = 9
+        self.assertEqual(self.registry.get("ana"), {"sweet": 7, "sour": 0, "bitter": 0, "strong": 0})
+
+    def test_cache_is_bounded_lru(self) -> None:
+        for user in "abcd":
+            self.registry.set(user, {"sweet": ord(user)})
+        self.assertEqual(list(self.registry._cache), ["b", "c", "d"])
+        self.registry.get("b")
+        self.assertEqual(self.registry.get("a"), {"sweet": ord("a"), "sour": 0, "bitter": 0, "strong": 0})
+        self.assertEqual(list(self.registry._cache), ["d", "b", "a"])
+        with self.assertRaises(ValueError):
+            ProfileRegistry(cache_size=0)
+
+    def test_load_many_batches_past_the_parameter_limit(self) -> None:
+        with ProfileRegistry(cache_size=5000) as registry:
+            for i in range(2500):
+                registry.set(f"user-{i}", {"sour": i % 10})
+            registry._cache.clear()
+            users = [f"user-{i}" for i in range(2500)] + ["nobody"]
+            found = registry.load_many(users)
+            self.assertEqual(len(found), 2500)
+            self.assertEqual(found["user-1234"]["sour"], 4)
+            self.assertEqual(len(registry._cache), 2500)
+
+    def test_survives_reopening(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "profiles.db")
+            with ProfileRegistry(path) as registry:
+                registry.set("ana", {"bitter": 8})
+            with ProfileRegistry(path) as registry:
+                self.assertEqual(registry.get("ana")["bitter"], 8)
+
+    def test_resolve_profile(self) -> None:
+        profile = {"sweet": 3}
+        self.assertIs(resolve_profile(profile), profile)
+        self.registry.set("ana", profile)
+        self.assertEqual(resolve_profile("ana", self.registry)["sweet"], 3)
+        with self.assertRaises(ValueError):
+            resolve_profile("ana")
+        with self.assertRaises(KeyError):
+            resolve_profile("bo", self.registry)
+
+    def test_set_flavor_profile_per_user(self) -> None:
+        stored = set_flavor_profile(1, 2, 3, 4, user_id="ana", registry=self.registry)
+        self.assertEqual(self.registry.get("ana"), stored)
+        with self.assertRaises(ValueError):
+            set_flavor_profile(1, 2, 3, 4, user_id="ana")
+
+    def test_user_ids_match_profile_dicts(self) -> None:
+        recipes = synthetic_recipes(500)
+        index = FlavorIndex(recipes)
+        profiles = {"ana": {"sweet": 9, "sour": 1}, "bo": {"bitter": 6, "strong": 6}}
+        for user, profile in profiles.items():
+            self.registry.set(user, profile)
+        users = ["ana", {"sour": 5}, "bo"]
+        dicts = [profiles[user] if isinstance(user, str) else user for user in users]
+        self.assertEqual(index.top_k_batch(users, 5, self.registry), [index.top_k(profile, 5) for profile in dicts])
+        self.assertEqual(
+            rank_by_flavor_profile("bo", index, 5, self.registry), rank_by_flavor_profile(profiles["bo"], index, 5)
+        )
+        self.assertEqual(
+            recommend_by_flavor("ana", recipes, self.registry), recommend_by_flavor(profiles["ana"], recipes)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
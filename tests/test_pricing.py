@@ -0,0 +1,171 @@
+"""Tests for pymixology.inventory.pricing."""
+
+from __future__ import annotations
+
+import unittest
+
+from benchmarks.generators import synthetic_inventory, synthetic_recipes
+from pymixology.inventory.items import Mixer, Spirit
+from pymixology.inventory.manager import Inventory
+from pymixology.inventory.orders import serve_orders
+from pymixology.inventory.pricing import MenuPricing, optimize_menu, price_menu
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import _normalize_ingredient
+
+
+def requirements(recipe):
+    """(key, amount per serving) pairs, with 0 for unmeasured amounts."""
+    servings = recipe.get("servings", 1) or 1
+    pairs = []
+    for item in recipe.get("ingredients", []):
+        ingredient = _normalize_ingredient(item)
+        amount = ingredient.get("amount")
+        usable = isinstance(amount, (int, float)) and amount > 0
+        pairs.append((canonical_name(ingredient["name"]), amount / servings if usable else 0.0))
+    return pairs
+
+
+def reference_cost(recipe, stock):
+    pairs = requirements(recipe)
+    if any(key not in stock for key, _ in pairs):
+        return None
+    return sum(amount * stock[key].unit_value for key, amount in pairs)
+
+
+def reference_servings(recipe, levels):
+    totals = {}
+    for key, amount in requirements(recipe):
+        totals[key] = totals.get(key, 0.0) + amount
+    if any(key not in levels for key in totals):
+        return 0
+    limits = [levels[key] / amount for key, amount in totals.items() if amount > 0]
+    return int(min(limits)) if limits else 0
+
+
+def reference_optimize(recipes, stock, size, worth):
+    """Re-score every remaining recipe at each step and take the most valuable one."""
+    levels = {key: item.quantity for key, item in stock.items()}
+    remaining = list(range(len(recipes)))
+    chosen = []
+    while len(chosen) < size:
+        scored = []
+        for rid in remaining:
+            servings = reference_servings(recipes[rid], levels)
+            if worth[rid] is not None and worth[rid] > 0 and servings > 0:
+                scored.append((-worth[rid] * servings, rid, servings))
+        if not scored:
+            break
+        _, rid, servings = min(scored)
+        remaining.remove(rid)
+        for key, amount in requirements(recipes[rid]):
+            levels[key] -= amount * servings
+        chosen.append((recipes[rid]["name"], servings))
+    return chosen
+
+
+class MenuPricingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.recipes = synthetic_recipes(400, pool_size=60)
+        cls.recipes[0] = dict(cls.recipes[0], servings=4)
+        cls.recipes.append({"name": "Garnish Only", "ingredients": ["Mint"]})
+        cls.items = synthetic_inventory(60, coverage=0.9)
+        cls.stock = {}
+        for item in cls.items:
+            cls.stock.setdefault(item.key, item)
+        cls.menu = MenuPricing(cls.recipes)
+        cls.menu.sync(cls.items)
+
+    def test_costs_match_per_recipe_sum(self) -> None:
+        self.assertEqual(len(self.menu), len(self.recipes))
+        for recipe, cost in zip(self.recipes, self.menu.costs()):
+            expected = reference_cost(recipe, self.stock)
+            if expected is None:
+                self.assertIsNone(cost)
+            else:
+                self.assertAlmostEqual(cost, expected)
+        self.assertTrue(any(cost is None for cost in self.menu.costs()))
+        self.assertTrue(any(cost is not None for cost in self.menu.costs()))
+
+    def test_max_servings(self) -> None:
+        levels = {key: item.quantity for key, item in self.stock.items()}
+        expected = [reference_servings(recipe, levels) for recipe in self.recipes]
+        self.assertEqual(self.menu.max_servings(), expected)
+        self.assertTrue(any(expected))
+
+    def test_max_servings_agree_with_serve_orders(self) -> None:
+        checked = 0
+        for recipe, servings in zip(self.recipes, self.menu.max_servings()):
+            if servings == 0:
+                continue
+            for count, served in ((servings, True), (servings + 1, False)):
+                with self.subTest(recipe=recipe["name"], count=count):
+                    inventory = synthetic_inventory(60, coverage=0.9)
+                    self.assertEqual(serve_orders(inventory, [recipe], [(recipe["name"], count)]), [served])
+            checked += 1
+            if checked == 10:
+                break
+
+    def test_margins(self) -> None:
+        prices = {recipe["name"]: 12.0 for recipe in self.recipes[:50]}
+        for recipe, cost, margin in zip(self.recipes, self.menu.costs(), self.menu.margins(prices)):
+            if recipe["name"] not in prices or cost is None:
+                self.assertIsNone(margin)
+            else:
+                self.assertAlmostEqual(margin, 12.0 - cost)
+        self.assertTrue(all(margin is None for margin in self.menu.margins()))
+
+    def test_optimize_matches_exhaustive_greedy(self) -> None:
+        prices = {recipe["name"]: 6.0 + i % 9 for i, recipe in enumerate(self.recipes)}
+        worths = {"servings": [1.0] * len(self.recipes), "margin": self.menu.margins(prices)}
+        for objective, worth in worths.items():
+            for size in (1, 5, 40):
+                with self.subTest(objective=objective, size=size):
+                    expected = reference_optimize(self.recipes, self.stock, size, worth)
+                    got = self.menu.optimize(size, objective, prices)
+                    self.assertEqual(got, expected)
+                    self.assertEqual(optimize_menu(self.items, self.recipes, size, objective, prices), expected)
+
+    def test_repeated_slots_are_summed(self) -> None:
+        recipes = [
+            {
+                "name": "Double Lime",
+                "ingredients": [
+                    {"name": "Lime Juice", "amount": 30, "unit": "ml"},
+                    {"name": "Fresh Lime Juice", "amount": 30, "unit": "ml"},
+                ],
+            },
+            {"name": "Twice Gin", "ingredients": [{"name": "Gin", "amount": 20}, {"name": "gin", "amount": 20}]},
+        ]
+        items = [Mixer("Lime Juice", 100, "", False, value=5), Spirit("Gin", 100, "", 0.4, value=10)]
+        menu = MenuPricing(recipes)
+        menu.sync(items)
+        self.assertEqual(menu.max_servings(), [1, 2])
+        self.assertEqual(menu.costs(), [3.0, 4.0])
+        plan = menu.optimize(2)
+        self.assertEqual(plan, [("Twice Gin", 2), ("Double Lime", 1)])
+        self.assertEqual(serve_orders(items, recipes, plan), [True, True])
+        self.assertEqual([item.quantity for item in items], [40, 20])
+
+    def test_optimize_edge_cases(self) -> None:
+        self.assertEqual(self.menu.optimize(0), [])
+        with self.assertRaises(ValueError):
+            self.menu.optimize(3, "profit")
+
+    def test_price_menu_accepts_inventories_and_menus(self) -> None:
+        expected = {}
+        for recipe in self.recipes:
+            expected.setdefault(recipe["name"], reference_cost(recipe, self.stock))
+        for inventory in (self.items, Inventory(synthetic_inventory(60, coverage=0.9))):
+            for recipe_db in (self.recipes, MenuPricing(self.recipes)):
+                got = price_menu(inventory, recipe_db)
+                self.assertEqual(got.keys(), expected.keys())
+                for name, cost in got.items():
+                    if expected[name] is None:
+                        self.assertIsNone(cost)
+                    else:
+                        self.assertAlmostEqual(cost, expected[name])
+
+
+if __name__ == "__main__":
+    unittest.main()
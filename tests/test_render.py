@@ -0,0 +1,142 @@
+"""Tests for pymixology.recipes.render."""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import html
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.generators import synthetic_recipes
+from pymixology.recipes.catalog import display_recipe, load_recipes
+from pymixology.recipes.render import CSV_COLUMNS, FORMATS, RecipeRenderer, render_recipes
+from pymixology.recipes.tools import ScaledRecipe
+
+DATA = Path(__file__).resolve().parent.parent / "pymixology" / "data" / "cocktails.json"
+
+ODD = [
+    {
+        "name": 'Tom & "Jerry" <hot>',
+        "servings": 2,
+        "ingredients": [
+            {"name": "Rum, dark", "amount": 1.125, "unit": "oz"},
+            {"name": "Egg", "amount": "1 whole"},
+            {"name": "Nutmeg"},
+            "Hot water\nto top",
+        ],
+        "steps": ["Beat <eggs> & sugar", 'Add "rum"'],
+    },
+    {"name": "Bare"},
+    {"name": "List Amount", "ingredients": [{"name": "Ice", "amount": [1, 2]}], "steps": "Stir"},
+]
+
+
+def legacy_text(recipe):
+    """The line-by-line output ``display_recipe`` printed before the renderer existed."""
+    lines = [f"Recipe: {recipe.get('name', 'Unknown Cocktail')}", "Ingredients:"]
+    for item in recipe.get("ingredients", []):
+        item = item if isinstance(item, dict) else {"name": item}
+        name, amount, unit = item.get("name", ""), item.get("amount"), item.get("unit")
+        if amount is None:
+            lines.append(f"- {name}")
+            continue
+        text = f"{amount:.2f}".rstrip("0").rstrip(".") if isinstance(amount, (int, float)) else str(amount)
+        lines.append(f"- {text} {unit} {name}" if unit else f"- {text} {name}")
+    lines.append("Steps:")
+    lines.extend(f"{i}. {step}" for i, step in enumerate(recipe.get("steps", []), start=1))
+    return "\n".join(lines) + "\n"
+
+
+def render(recipes, **kwargs):
+    output = io.StringIO()
+    count = RecipeRenderer(**kwargs).render(recipes, output)
+    return count, output.getvalue()
+
+
+class RecipeRendererTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.recipes = load_recipes(str(DATA)) + ODD[:2]
+
+    def test_text_matches_legacy_display(self) -> None:
+        count, text = render(self.recipes)
+        self.assertEqual(count, len(self.recipes))
+        self.assertEqual(text, "\n".join(legacy_text(recipe) for recipe in self.recipes))
+        for recipe in self.recipes[:5] + ODD[:2]:
+            with contextlib.redirect_stdout(io.StringIO()) as printed:
+                display_recipe(recipe)
+            self.assertEqual(printed.getvalue(), legacy_text(recipe))
+
+    def test_csv_parses(self) -> None:
+        _, text = render(self.recipes + ODD, fmt="csv")
+        rows = list(csv.reader(io.StringIO(text)))
+        self.assertEqual(tuple(rows[0]), CSV_COLUMNS)
+        expected = []
+        for recipe in self.recipes + ODD:
+            ingredients = recipe.get("ingredients", [])
+            if not ingredients:
+                expected.append([recipe["name"], str(recipe.get("servings", "") or ""), "", "", ""])
+            for item in ingredients:
+                item = item if isinstance(item, dict) else {"name": item}
+                amount = item.get("amount")
+                if isinstance(amount, (int, float)):
+                    amount = f"{amount:.2f}".rstrip("0").rstrip(".")
+                servings = str(recipe.get("servings", "") or "")
+                expected.append([recipe["name"], servings, item["name"], str(amount or ""), item.get("unit") or ""])
+        self.assertEqual(rows[1:], expected)
+
+    def test_html_escapes_everything(self) -> None:
+        _, page = render(ODD, fmt="html", title="Bar <One> & Co")
+        self.assertIn("<title>Bar &lt;One&gt; &amp; Co</title>", page)
+        self.assertIn("<h2>Tom &amp; &quot;Jerry&quot; &lt;hot&gt;</h2>", page)
+        self.assertIn("<li>1.12 oz Rum, dark</li>", page)
+        self.assertIn(f"<li>{html.escape('Beat <eggs> & sugar')}</li>", page)
+        self.assertNotIn("<eggs>", page)
+        self.assertTrue(page.startswith("<!DOCTYPE html>") and page.endswith("</html>\n"))
+        self.assertEqual(page.count('<section class="recipe">'), len(ODD))
+
+    def test_markdown(self) -> None:
+        _, text = render(ODD[:2], fmt="markdown", title="Menu")
+        self.assertEqual(
+            text,
+            '# Menu\n\n## Tom & "Jerry" <hot>\n\n*Serves 2*\n\n'
+            "- 1.12 oz Rum, dark\n- 1 whole Egg\n- Nutmeg\n- Hot water\nto top\n\n"
+            '1. Beat <eggs> & sugar\n2. Add "rum"\n\n## Bare\n\n',
+        )
+
+    def test_servings_scale_like_scaled_recipe(self) -> None:
+        recipes = synthetic_recipes(300) + ODD
+        for fmt in FORMATS:
+            with self.subTest(fmt=fmt):
+                scaled = render(recipes, fmt=fmt, servings=6)[1]
+                views = [ScaledRecipe(recipe, 6) for recipe in recipes]
+                self.assertEqual(scaled, render(views, fmt=fmt, servings=6)[1])
+        self.assertIn("Servings: 6\n", render(ODD[:1], servings=6)[1])
+        self.assertIn("- 3.38 oz Rum, dark\n", render(ODD[:1], servings=6)[1])
+
+    def test_chunking_and_cache_resets_do_not_change_output(self) -> None:
+        recipes = synthetic_recipes(500) + ODD
+        for fmt in FORMATS:
+            with self.subTest(fmt=fmt):
+                expected = render(recipes, fmt=fmt)[1]
+                self.assertEqual(render(recipes, fmt=fmt, chunk=1, cache_size=3)[1], expected)
+                self.assertEqual(render(iter(recipes), fmt=fmt, chunk=7)[1], expected)
+
+    def test_render_recipes_to_a_path(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "menu.csv"
+            self.assertEqual(render_recipes(ODD, path, fmt="csv"), len(ODD))
+            self.assertEqual(path.read_text(encoding="utf-8"), render(ODD, fmt="csv")[1])
+
+    def test_rejects_bad_settings(self) -> None:
+        for kwargs in ({"fmt": "pdf"}, {"servings": 0}, {"chunk": 0}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    RecipeRenderer(**kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
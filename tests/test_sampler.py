@@ -0,0 +1,163 @@
+"""Tests for pymixology.recommendation.sampler."""
+
+from __future__ import annotations
+
+import random
+import unittest
+from collections import Counter
+
+from benchmarks.generators import synthetic_inventory, synthetic_recipes
+from pymixology.recommendation.flavor import FLAVOR_DIMENSIONS, flavor_vector
+from pymixology.recommendation.preference import ProfileRegistry, ReviewStore
+from pymixology.recommendation.sampler import RecipeSampler, _alias_table, preference_weights
+from pymixology.recommendation.suggester import get_makeable_cocktails
+
+
+def table_probabilities(table):
+    """Exact probability of each index under an alias table."""
+    prob, alias = table
+    n = len(prob)
+    result = [value / n for value in prob]
+    for column in range(n):
+        result[alias[column]] += (1.0 - prob[column]) / n
+    return result
+
+
+def sampler_probabilities(sampler):
+    """Exact probability of each recipe under a sampler's two-level tables."""
+    blocks = table_probabilities(sampler._top)
+    result = []
+    for block, table in enumerate(sampler._tables):
+        if table is None:
+            result.extend([0.0] * (min(len(sampler), (block + 1) * sampler._block) - block * sampler._block))
+        else:
+            result.extend(blocks[block] * p for p in table_probabilities(table))
+    return result
+
+
+class AliasTableTest(unittest.TestCase):
+    def test_reproduces_the_weights(self) -> None:
+        rng = random.Random(1)
+        for weights in ([1.0], [0.0, 2.0, 0.0], [1, 2, 3, 4], [rng.random() * (i % 3) for i in range(200)]):
+            with self.subTest(size=len(weights)):
+                total = sum(weights)
+                for got, weight in zip(table_probabilities(_alias_table(weights)), weights, strict=True):
+                    self.assertAlmostEqual(got, weight / total)
+
+    def test_empty_or_zero_weights(self) -> None:
+        self.assertIsNone(_alias_table([]))
+        self.assertIsNone(_alias_table([0.0, 0.0]))
+
+
+class RecipeSamplerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.recipes = synthetic_recipes(1000)
+        rng = random.Random(2)
+        self.weights = [rng.choice((0.0, 0.5, 1.0, 4.0)) for _ in self.recipes]
+        self.sampler = RecipeSampler(self.recipes, self.weights, rng=random.Random(3))
+
+    def assert_distribution(self, sampler, weights) -> None:
+        total = sum(weights)
+        for got, weight in zip(sampler_probabilities(sampler), weights, strict=True):
+            self.assertAlmostEqual(got, weight / total)
+
+    def test_blocks_reproduce_the_weights(self) -> None:
+        self.assertGreater(len(self.sampler._tables), 1)
+        self.assert_distribution(self.sampler, self.weights)
+
+    def test_draws_follow_the_weights(self) -> None:
+        sampler = RecipeSampler(self.recipes[:4], [1, 0, 3, 6], rng=random.Random(4))
+        counts = Counter(sampler.draw()["name"] for _ in range(20000))
+        self.assertNotIn(self.recipes[1]["name"], counts)
+        for recipe, weight in zip(self.recipes[:4], [1, 0, 3, 6]):
+            self.assertAlmostEqual(counts[recipe["name"]] / 20000, weight / 10, delta=0.02)
+
+    def test_set_weights_updates_touched_blocks(self) -> None:
+        names = [self.recipes[i]["name"] for i in (0, 500, 999)]
+        self.sampler.set_weights({names[0]: 10.0, names[1]: 0.0, names[2].upper(): 2.5, "No Such Drink": 1.0})
+        for index, weight in zip((0, 500, 999), (10.0, 0.0, 2.5)):
+            self.weights[index] = weight
+        self.assertEqual(self.sampler.weight(names[0]), 10.0)
+        self.assert_distribution(self.sampler, self.weights)
+        with self.assertRaises(ValueError):
+            self.sampler.set_weights({names[0]: -1})
+        with self.assertRaises(KeyError):
+            self.sampler.weight("No Such Drink")
+
+    def test_sample_is_distinct_and_restores_weights(self) -> None:
+        positive = sum(1 for weight in self.weights if weight > 0)
+        positions = {id(recipe): index for index, recipe in enumerate(self.recipes)}
+        for count in (0, 5, positive):
+            with self.subTest(count=count):
+                flight = self.sampler.sample(count)
+                self.assertEqual(len(flight), count)
+                self.assertEqual(len({id(recipe) for recipe in flight}), count)
+                self.assertTrue(all(self.weights[positions[id(recipe)]] > 0 for recipe in flight))
+                self.assertEqual(list(self.sampler._weights), self.weights)
+                self.assert_distribution(self.sampler, self.weights)
+        with self.assertRaises(ValueError):
+            self.sampler.sample(positive + 1)
+        with self.assertRaises(ValueError):
+            self.sampler.sample(-1)
+
+    def test_rejects_bad_weights(self) -> None:
+        with self.assertRaises(ValueError):
+            RecipeSampler(self.recipes, [1.0])
+        with self.assertRaises(ValueError):
+            RecipeSampler(self.recipes[:2], [1.0, -1.0])
+        with self.assertRaises(ValueError):
+            RecipeSampler(self.recipes[:2], [0.0, 0.0]).draw()
+        with self.assertRaises(ValueError):
+            RecipeSampler([]).draw()
+
+    def test_makeable_restricts_and_caches(self) -> None:
+        inventory = synthetic_inventory(2000, coverage=0.995)
+        restricted = self.sampler.makeable(inventory)
+        expected = get_makeable_cocktails(inventory, self.recipes)
+        self.assertEqual([recipe["name"] for recipe in restricted._recipes], expected)
+        self.assertIs(self.sampler.makeable(inventory), restricted)
+        for item in inventory:
+            item.quantity = 0
+        self.assertEqual(len(self.sampler.makeable(inventory)), 0)
+
+
+class PreferenceWeightsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.recipes = synthetic_recipes(200)
+        self.profile = {"sweet": 2, "sour": 8, "bitter": 0, "strong": 5}
+
+    def expected(self, ratings, profile, default=3.0):
+        weights = []
+        for recipe in self.recipes:
+            match = sum(profile.get(d, 0) * v for d, v in zip(FLAVOR_DIMENSIONS, flavor_vector(recipe)))
+            weights.append(max(ratings.get(recipe["name"], default) * max(match, 0.0), 0.0))
+        return weights
+
+    def test_ratings_times_flavor_match(self) -> None:
+        names = [recipe["name"] for recipe in self.recipes[:3]]
+        reviews = [{"cocktail": names[0], "rating": 5}, {"cocktail": names[0], "rating": 4}, {"cocktail": names[1]}]
+        expected = self.expected({names[0]: 4.5, names[1]: 0.0}, self.profile)
+        with ReviewStore() as store, ProfileRegistry() as registry:
+            store.add_many([(names[0], 5), (names[0], 4), (names[1], 0)])
+            registry.set("ana", self.profile)
+            for got in (
+                preference_weights(self.recipes, reviews, self.profile),
+                preference_weights(self.recipes, {names[0]: 4.5, names[1]: 0}, "ana", registry),
+                preference_weights(self.recipes, store, self.profile),
+            ):
+                for value, want in zip(got, expected, strict=True):
+                    self.assertAlmostEqual(value, want)
+
+    def test_defaults_and_errors(self) -> None:
+        self.assertEqual(preference_weights(self.recipes[:3]), [3.0] * 3)
+        self.assertEqual(preference_weights(self.recipes[:3], default_rating=-1), [0.0] * 3)
+        with self.assertRaises(TypeError):
+            preference_weights(self.recipes, "reviews")
+
+    def test_from_preferences(self) -> None:
+        sampler = RecipeSampler.from_preferences(self.recipes, user_profile=self.profile, rng=random.Random(5))
+        self.assertEqual(list(sampler._weights), preference_weights(self.recipes, user_profile=self.profile))
+
+
+if __name__ == "__main__":
+    unittest.main()
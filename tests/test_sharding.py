@@ -0,0 +1,131 @@
+"""Tests for pymixology.recipes.sharding."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.generators import synthetic_inventory, synthetic_recipes, write_synthetic_catalog
+from pymixology.recipes.catalog import RecipeCatalog, filter_by_base, iter_recipes, search_cocktail
+from pymixology.recipes.sharding import ShardedCatalog, _iter_range, shard_ranges, split_catalog
+from pymixology.recommendation.suggester import get_makeable_cocktails
+
+# Names that look like array boundaries, nested objects that start on their own line.
+AWKWARD = [
+    {"name": 'Brace ", {"name": "Fake"}', "base": "Gin", "ingredients": [{"name": "Gin", "amount": 60}]},
+    {"name": "Nested", "base": "Rum", "ingredients": [{"name": "Rum", "notes": {"age": {"years": 3}}}]},
+    {"name": "Unicode Ñ ☃", "base": "Vodka", "ingredients": ["Vodka"]},
+]
+
+
+def ranged(path, shards):
+    return [recipe for start, end in shard_ranges(str(path), shards) for recipe in _iter_range(str(path), start, end)]
+
+
+class ShardRangesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def check_ranges(self, path: Path, shards: int) -> None:
+        ranges = shard_ranges(str(path), shards)
+        self.assertLessEqual(len(ranges), shards)
+        self.assertEqual(ranges[-1][1], path.stat().st_size)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+        self.assertEqual(ranged(path, shards), list(iter_recipes(str(path))))
+
+    def test_json_lines(self) -> None:
+        path = self.dir / "recipes.jsonl"
+        write_synthetic_catalog(path, 500, json_lines=True)
+        for shards in (1, 3, 8, 1000):
+            with self.subTest(shards=shards):
+                self.check_ranges(path, shards)
+
+    def test_json_array(self) -> None:
+        path = self.dir / "recipes.json"
+        write_synthetic_catalog(path, 500)
+        for shards in (1, 3, 8, 1000):
+            with self.subTest(shards=shards):
+                self.check_ranges(path, shards)
+
+    def test_awkward_records(self) -> None:
+        recipes = AWKWARD * 200
+        for indent in (None, 2):
+            path = self.dir / f"awkward-{indent}.json"
+            path.write_text("  \n" + json.dumps(recipes, indent=indent, ensure_ascii=False), encoding="utf-8")
+            with self.subTest(indent=indent):
+                self.check_ranges(path, 7)
+
+    def test_empty_and_invalid(self) -> None:
+        path = self.dir / "empty.json"
+        path.write_text("", encoding="utf-8")
+        self.assertEqual(shard_ranges(str(path), 4), [])
+        with self.assertRaises(ValueError):
+            shard_ranges(str(path), 0)
+
+    def test_split_catalog(self) -> None:
+        path = self.dir / "recipes.json"
+        write_synthetic_catalog(path, 250)
+        paths = split_catalog(str(path), str(self.dir / "shards"), 100)
+        self.assertEqual([p.name for p in paths], ["shard-00000.jsonl", "shard-00001.jsonl", "shard-00002.jsonl"])
+        self.assertEqual([r for p in paths for r in iter_recipes(str(p))], list(iter_recipes(str(path))))
+        with self.assertRaises(ValueError):
+            split_catalog(str(path), str(self.dir / "shards"), 0)
+
+
+class ShardedCatalogTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmp = tempfile.TemporaryDirectory()
+        path = Path(cls.tmp.name) / "recipes.json"
+        write_synthetic_catalog(path, 600)
+        cls.recipes = list(iter_recipes(str(path)))
+        cls.catalog = ShardedCatalog.from_file(str(path), 3)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.catalog.close()
+        cls.tmp.cleanup()
+
+    def test_contents_in_catalog_order(self) -> None:
+        self.assertEqual(self.catalog.shard_count, 3)
+        self.assertEqual(len(self.catalog), len(self.recipes))
+        self.assertEqual(list(self.catalog), self.recipes)
+        self.assertEqual(len(self.catalog.load_cpu_seconds), 3)
+
+    def test_queries_match_list_path(self) -> None:
+        for query in ("", "a", "sour", "no such drink"):
+            with self.subTest(query=query):
+                self.assertEqual(search_cocktail(self.catalog, query), search_cocktail(self.recipes, query))
+        for base in {recipe["base"] for recipe in self.recipes} | {"Absinthe"}:
+            with self.subTest(base=base):
+                self.assertEqual(filter_by_base(self.catalog, base), filter_by_base(self.recipes, base))
+
+    def test_makeable_matches_list_path(self) -> None:
+        inventory = synthetic_inventory(2000, coverage=0.995)
+        expected = get_makeable_cocktails(inventory, self.recipes)
+        self.assertEqual(get_makeable_cocktails(inventory, self.catalog), expected)
+        self.assertEqual(get_makeable_cocktails([], self.catalog), get_makeable_cocktails([], self.recipes))
+
+    def test_shard_paths_and_close(self) -> None:
+        recipes = synthetic_recipes(50)
+        path = Path(self.tmp.name) / "small.jsonl"
+        path.write_text("".join(json.dumps(recipe) + "\n" for recipe in recipes), encoding="utf-8")
+        with ShardedCatalog([str(path), path]) as catalog:
+            self.assertEqual(len(catalog), 100)
+            self.assertEqual(catalog.search("e"), search_cocktail(RecipeCatalog(recipes * 2), "e"))
+        self.assertEqual(catalog.shard_count, 0)
+
+    def test_load_errors_reach_the_parent(self) -> None:
+        path = Path(self.tmp.name) / "bad.jsonl"
+        path.write_text("[1, 2]\n", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            ShardedCatalog([str(path)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for pymixology.recommendation.similarity."""
+
+from __future__ import annotations
+
+import unittest
+
+from benchmarks.generators import synthetic_recipes
+from pymixology.names import canonical_name
+from pymixology.recommendation.similarity import (
+    SimilarityIndex,
+    closest_cocktails,
+    find_near_duplicates,
+    jaccard,
+    similar_cocktails,
+)
+
+RECIPES = [
+    {"name": "Gimlet", "ingredients": ["Gin", "Lime Juice", "Simple Syrup"]},
+    {"name": "Gin Sour", "ingredients": ["Gin", "Fresh Lime Juice", "Sugar Syrup"]},
+    {"name": "Daiquiri", "ingredients": ["Rum", "Lime Juice", "Simple Syrup"]},
+    {"name": "Gin Neat", "ingredients": ["Gin"]},
+    {"name": "Nothing", "ingredients": []},
+]
+
+
+def ingredient_set(recipe):
+    return frozenset(canonical_name(item if isinstance(item, str) else item["name"]) for item in recipe["ingredients"])
+
+
+class SimilarityIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.recipes = synthetic_recipes(2000, pool_size=80)
+        cls.sets = [ingredient_set(recipe) for recipe in cls.recipes]
+        cls.index = SimilarityIndex(cls.recipes)
+
+    def assert_exact_and_ordered(self, results, query, exclude=None) -> None:
+        positions = {recipe["name"]: rid for rid, recipe in enumerate(self.recipes)}
+        keys = []
+        for name, score in results:
+            self.assertNotEqual(positions[name], exclude)
+            self.assertEqual(score, jaccard(query, self.sets[positions[name]]))
+            self.assertGreater(score, 0)
+            keys.append((-score, positions[name]))
+        self.assertEqual(keys, sorted(keys))
+
+    def test_jaccard(self) -> None:
+        self.assertEqual(jaccard(frozenset("ab"), frozenset("bc")), 1 / 3)
+        self.assertEqual(jaccard(frozenset(), frozenset()), 0.0)
+
+    def test_similar_scores_are_exact(self) -> None:
+        for rid in range(0, len(self.recipes), 37):
+            with self.subTest(rid=rid):
+                results = self.index.similar(self.recipes[rid]["name"], 10)
+                self.assertLessEqual(len(results), 10)
+                self.assert_exact_and_ordered(results, self.sets[rid], exclude=rid)
+
+    def test_similar_finds_close_neighbours(self) -> None:
+        for rid, query in enumerate(self.sets):
+            best = max(jaccard(query, other) for other_rid, other in enumerate(self.sets) if other_rid != rid)
+            if best >= 0.7:
+                with self.subTest(rid=rid):
+                    self.assertEqual(self.index.similar(self.recipes[rid]["name"], 1)[0][1], best)
+
+    def test_closest_scores_are_exact(self) -> None:
+        for query in (["Gin", "Lime Juice"], ["Rum", "Mint", "Soda Water", "Simple Syrup"], ["Ingredient 50"]):
+            with self.subTest(query=query):
+                results = self.index.closest(query, 8)
+                self.assertEqual(len(results), 8)
+                self.assert_exact_and_ordered(results, frozenset(canonical_name(name) for name in query))
+
+    def test_empty_requests(self) -> None:
+        name = self.recipes[0]["name"]
+        self.assertEqual(self.index.similar(name, 0), [])
+        self.assertEqual(self.index.closest(["Gin"], 0), [])
+        self.assertEqual(self.index.closest([], 5), [])
+        self.assertEqual(self.index.closest(["No Such Thing"], 5), [])
+        with self.assertRaises(KeyError):
+            self.index.similar("No Such Drink")
+
+    def test_near_duplicates(self) -> None:
+        groups = self.index.near_duplicates(0.75)
+        positions = {recipe["name"]: rid for rid, recipe in enumerate(self.recipes)}
+        grouped = {}
+        for group in groups:
+            rids = [positions[name] for name in group]
+            self.assertEqual(rids, sorted(rids))
+            for rid in rids:
+                grouped[rid] = rids[0]
+                others = [self.sets[other] for other in rids if other != rid]
+                self.assertTrue(any(jaccard(self.sets[rid], other) >= 0.75 for other in others))
+        firsts = [positions[group[0]] for group in groups]
+        self.assertEqual(firsts, sorted(firsts))
+        # Identical ingredient sets always land in the same group.
+        first_with_set = {}
+        for rid, ingredients in enumerate(self.sets):
+            earlier = first_with_set.setdefault(ingredients, rid)
+            if earlier != rid:
+                self.assertEqual(grouped[rid], grouped[earlier])
+        with self.assertRaises(ValueError):
+            self.index.near_duplicates(0)
+
+
+class HelpersTest(unittest.TestCase):
+    def test_small_catalog(self) -> None:
+        self.assertEqual(similar_cocktails(RECIPES, "gimlet", 2), [("Gin Sour", 1.0), ("Daiquiri", 0.5)])
+        self.assertEqual(closest_cocktails(["gin"], RECIPES, 2), [("Gin Neat", 1.0), ("Gimlet", 1 / 3)])
+        self.assertEqual(find_near_duplicates(RECIPES), [["Gimlet", "Gin Sour"]])
+        self.assertEqual(similar_cocktails(RECIPES, "Nothing"), [])
+
+    def test_rejects_bad_parameters(self) -> None:
+        with self.assertRaises(ValueError):
+            SimilarityIndex(RECIPES, num_perm=10, bands=4)
+        with self.assertRaises(ValueError):
+            SimilarityIndex(RECIPES, bands=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Tests for pymixology.recommendation.suggester."""
+
+from __future__ import annotations
+
+import unittest
+
+from benchmarks.generators import synthetic_inventory, synthetic_recipes
+from pymixology.inventory.items import Mixer
+from pymixology.inventory.manager import add_item, remove_item
+from pymixology.names import canonical_name
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.recommendation.suggester import (
+    MakeableIndex,
+    find_cocktails_with_ingredients,
+    get_makeable_cocktails,
+    get_nearly_makeable_cocktails,
+)
+
+
+def nearly_makeable_by_scan(inventory, recipes, max_missing):
+    """Reference implementation of get_nearly_makeable_cocktails."""
+    stock = {item.key: item.quantity for item in inventory}
+    result = {}
+    for recipe in recipes:
+        ingredients = recipe.get("ingredients", [])
+        if not ingredients:
+            continue
+        missing = []
+        for item in ingredients:
+            quantity = stock.get(canonical_name(item["name"]))
+            amount = item.get("amount")
+            if quantity is None or (isinstance(amount, (int, float)) and amount > 0 and quantity < amount):
+                missing.append(item["name"])
+        if len(missing) <= max_missing:
+            result[recipe["name"]] = missing
+    return result
+
+
+class MakeableIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # A small ingredient pool so a good share of recipes is makeable.
+        self.recipes = synthetic_recipes(2000, pool_size=40)
+        self.inventory = synthetic_inventory(40, coverage=0.9)
+        self.index = MakeableIndex(self.recipes)
+
+    def assert_parity(self) -> None:
+        expected = get_makeable_cocktails(self.inventory, self.recipes)
+        self.assertEqual(get_makeable_cocktails(self.inventory, self.index), expected)
+
+    def test_matches_list_path(self) -> None:
+        self.assertTrue(get_makeable_cocktails(self.inventory, self.recipes))
+        self.assert_parity()
+
+    def test_tracks_quantity_changes_incrementally(self) -> None:
+        self.assert_parity()
+        for item in self.inventory[::3]:
+            item.use(item.quantity)
+        self.assert_parity()
+        for item in self.inventory[::3]:
+            item.quantity = 2000
+        self.assert_parity()
+
+    def test_tracks_added_and_removed_items(self) -> None:
+        self.assert_parity()
+        removed = self.inventory[0].name
+        remove_item(self.inventory, removed)
+        self.assert_parity()
+        add_item(self.inventory, Mixer(removed, 5000, "2030-01-01", False))
+        self.assert_parity()
+
+    def test_nearly_makeable_matches_scan(self) -> None:
+        for max_missing in (0, 1, 2):
+            with self.subTest(max_missing=max_missing):
+                expected = nearly_makeable_by_scan(self.inventory, self.recipes, max_missing)
+                self.assertEqual(get_nearly_makeable_cocktails(self.inventory, self.index, max_missing), expected)
+                self.assertEqual(get_nearly_makeable_cocktails(self.inventory, self.recipes, max_missing), expected)
+        with self.assertRaises(ValueError):
+            get_nearly_makeable_cocktails(self.inventory, self.index, -1)
+
+    def test_recipes_without_ingredients_are_never_makeable(self) -> None:
+        index = MakeableIndex([{"name": "Air"}])
+        self.assertEqual(get_makeable_cocktails(self.inventory, index), [])
+        self.assertEqual(index.missing_at_most(5), {})
+
+
+class FindWithIngredientsTest(unittest.TestCase):
+    def test_catalog_matches_list_path(self) -> None:
+        recipes = synthetic_recipes(500)
+        catalog = RecipeCatalog(recipes)
+        for targets in (["Mint"], ["fresh lime juice", "Campari"], ["Unobtainium"], []):
+            with self.subTest(targets=targets):
+                self.assertEqual(
+                    find_cocktails_with_ingredients(targets, catalog),
+                    find_cocktails_with_ingredients(targets, recipes),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
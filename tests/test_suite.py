@@ -0,0 +1,86 @@
+"""Tests for benchmarks.suite."""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks import suite
+
+
+def run_quietly(*args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return suite.run(*args, **kwargs)
+
+
+class SelectCasesTest(unittest.TestCase):
+    def test_all_cases_by_default(self) -> None:
+        self.assertEqual(suite.select_cases(), suite.CASES)
+        self.assertEqual(len({name for name, _, _ in suite.CASES}), len(suite.CASES))
+
+    def test_brackets_are_literal(self) -> None:
+        names = [name for name, _, _ in suite.select_cases(["*[binary]"])]
+        self.assertTrue(names)
+        self.assertTrue(all(name.endswith("[binary]") for name in names))
+        self.assertEqual(suite.select_cases(["recipes.search_cocktail[b]"]), [])
+
+    def test_needs_name_fixtures(self) -> None:
+        for name, needs, _ in suite.CASES:
+            for need in needs:
+                with self.subTest(case=name, need=need):
+                    self.assertIsInstance(vars(suite.Fixtures)[need], functools.cached_property)
+
+
+class RunTest(unittest.TestCase):
+    def test_every_case_runs_at_a_tiny_size(self) -> None:
+        document = run_quietly([30], 1)
+        self.assertEqual([result["case"] for result in document["results"]], [name for name, _, _ in suite.CASES])
+        for result in document["results"]:
+            self.assertEqual((result["size"], result["repeats"]), (30, 1))
+            self.assertGreaterEqual(result["seconds_median"], result["seconds_min"])
+        self.assertEqual(set(document["meta"]), {"revision", "python", "platform", "timestamp"})
+
+    def test_subset_runs_only_matching_cases(self) -> None:
+        document = run_quietly([20, 40], 2, ["recipes.iter_recipes", "*[binary]"])
+        cases = {result["case"] for result in document["results"]}
+        expected = {"recipes.iter_recipes", "recipes.search_cocktail[binary]", "recipes.filter_by_base[binary]"}
+        self.assertEqual(cases, expected)
+        self.assertEqual(len(document["results"]), 6)
+
+    def test_release_closes_fixtures(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            data = suite.Fixtures(20, Path(tmp))
+            binary = data.binary
+            self.assertEqual(len(binary), 20)
+            data.release("binary")
+            data.release("recipes")
+            self.assertTrue(binary._file.closed)
+            self.assertNotIn("binary", vars(data))
+            self.assertNotIn("recipes", vars(data))
+            self.assertIsNot(data.binary, binary)
+            data.release("binary")
+            data.release("binary")
+
+
+class GeneratorsTest(unittest.TestCase):
+    def test_seeded_catalog_is_the_same_in_every_process(self) -> None:
+        script = "import json, benchmarks.generators as g; print(json.dumps(g.synthetic_recipes(300)))"
+        root = Path(__file__).resolve().parent.parent
+        outputs = set()
+        for seed in ("0", "1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            result = subprocess.run([sys.executable, "-c", script], cwd=root, env=env, capture_output=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            outputs.add(result.stdout)
+        self.assertEqual(len(outputs), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
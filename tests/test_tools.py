@@ -0,0 +1,147 @@
+"""Tests for pymixology.recipes.tools."""
+
+from __future__ import annotations
+
+import copy
+import random
+import unittest
+
+from pymixology.recipes.tools import (
+    UNIT_TABLE,
+    IngredientColumns,
+    ScaledRecipe,
+    calculate_abv,
+    calculate_abv_batch,
+    convert_units,
+    estimate_cost,
+    estimate_cost_batch,
+    scale_catalog,
+    scale_recipe,
+    unit_converter,
+)
+
+RECIPES = [
+    {
+        "name": "Sour",
+        "servings": 2,
+        "ingredients": [
+            {"name": "Whiskey", "amount": 120, "unit": "ml"},
+            {"name": "Lemon Juice", "amount": "a splash"},
+            {"name": "Mint"},
+            "Ice",
+        ],
+        "steps": ["Shake"],
+    },
+    {"name": "Neat", "ingredients": [{"name": "Rum", "amount": 60, "unit": "ml"}]},
+    {"name": "Empty"},
+    {"name": "Zero", "servings": 0, "ingredients": [{"name": "Gin", "amount": 30}]},
+]
+
+
+class BatchHelpersTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(7)
+        self.volumes = [
+            [{"vol": rng.choice((0, 10, 30, 60)), "abv": rng.random()} for _ in range(rng.randint(0, 6))]
+            for _ in range(300)
+        ]
+        self.prices = [
+            [
+                {
+                    "price_per_bottle": rng.uniform(10, 60),
+                    "bottle_vol": rng.choice((700, 750, 1000)),
+                    "used_vol": rng.randint(0, 60),
+                }
+                for _ in range(rng.randint(0, 6))
+            ]
+            for _ in range(300)
+        ]
+
+    def test_calculate_abv_batch_matches_scalar(self) -> None:
+        expected = [calculate_abv(batch) for batch in self.volumes]
+        for batch in (self.volumes, iter(self.volumes), IngredientColumns.from_lists(self.volumes, ("vol", "abv"))):
+            for got, want in zip(calculate_abv_batch(batch), expected, strict=True):
+                self.assertAlmostEqual(got, want)
+
+    def test_estimate_cost_batch_matches_scalar(self) -> None:
+        expected = [estimate_cost(batch) for batch in self.prices]
+        columns = IngredientColumns.from_lists(self.prices, ("price_per_bottle", "bottle_vol", "used_vol"))
+        self.assertEqual(len(columns), len(self.prices))
+        for batch in (self.prices, columns):
+            for got, want in zip(estimate_cost_batch(batch), expected, strict=True):
+                self.assertAlmostEqual(got, want)
+
+    def test_estimate_cost_rejects_empty_bottles(self) -> None:
+        bad = [[{"price_per_bottle": 10, "bottle_vol": 0, "used_vol": 5}]]
+        with self.assertRaises(ValueError):
+            estimate_cost(bad[0])
+        with self.assertRaises(ValueError):
+            estimate_cost_batch(bad)
+
+    def test_convert_units_matches_unit_converter(self) -> None:
+        units = sorted(UNIT_TABLE)
+        amounts = [float(i) for i in range(len(units))]
+        for target in units:
+            with self.subTest(target=target):
+                expected = [unit_converter(amount, unit, target) for amount, unit in zip(amounts, units)]
+                for got, want in zip(convert_units(amounts, units, target.upper()), expected, strict=True):
+                    self.assertAlmostEqual(got, want)
+                self.assertEqual(convert_units(amounts, target, target), amounts)
+
+    def test_unit_errors(self) -> None:
+        self.assertAlmostEqual(unit_converter(30, "ml", "oz"), 30 / UNIT_TABLE["oz"])
+        with self.assertRaises(ValueError):
+            unit_converter(1, "ml", "gallon")
+        with self.assertRaises(ValueError):
+            convert_units([1.0], "gallon", "ml")
+        with self.assertRaises(ValueError):
+            convert_units([1.0, 2.0], ["ml"], "oz")
+
+
+class ScaledRecipeTest(unittest.TestCase):
+    def test_view_equals_scale_recipe(self) -> None:
+        for recipe in RECIPES:
+            for servings in (1, 3, 8):
+                with self.subTest(recipe=recipe["name"], servings=servings):
+                    expected = scale_recipe(recipe, servings)
+                    view = ScaledRecipe(recipe, servings)
+                    self.assertEqual(dict(view), expected)
+                    self.assertEqual(list(view), list(expected))
+                    self.assertEqual(len(view), len(expected))
+                    self.assertEqual(view.to_dict(), expected)
+                    self.assertEqual(list(view.to_dict()), list(expected))
+
+    def test_missing_ingredients_read_as_empty(self) -> None:
+        view = ScaledRecipe({"name": "Empty"}, 4)
+        self.assertIn("ingredients", view)
+        self.assertEqual(list(view["ingredients"]), [])
+        self.assertEqual(view.to_dict(), {"name": "Empty", "ingredients": [], "servings": 4})
+
+    def test_shares_the_original_without_mutating_it(self) -> None:
+        original = copy.deepcopy(RECIPES[0])
+        view = ScaledRecipe(RECIPES[0], 6)
+        self.assertEqual(view["ingredients"][0]["amount"], 360)
+        self.assertEqual(view["ingredients"][1:3], [{"name": "Lemon Juice", "amount": "a splash"}, {"name": "Mint"}])
+        self.assertIs(view["steps"], RECIPES[0]["steps"])
+        self.assertEqual(RECIPES[0], original)
+
+    def test_to_dict_is_independent(self) -> None:
+        materialized = ScaledRecipe(RECIPES[0], 2).to_dict()
+        materialized["ingredients"][2]["name"] = "Basil"
+        materialized["steps"].append("Strain")
+        self.assertEqual(RECIPES[0]["ingredients"][2], {"name": "Mint"})
+        self.assertEqual(RECIPES[0]["steps"], ["Shake"])
+
+    def test_scale_catalog(self) -> None:
+        views = scale_catalog(iter(RECIPES), 4)
+        self.assertEqual([view.to_dict() for view in views], [scale_recipe(recipe, 4) for recipe in RECIPES])
+
+    def test_rejects_non_positive_servings(self) -> None:
+        for func in (scale_recipe, ScaledRecipe, scale_catalog):
+            with self.subTest(func=func.__name__):
+                with self.assertRaises(ValueError):
+                    func(RECIPES[0] if func is not scale_catalog else RECIPES, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()